@@ -17,6 +17,8 @@
 
 """Python Elastic Enterprise Search Client"""
 
+import sys
+
 from elastic_transport import APIError as APIError
 from elastic_transport import BadGatewayError as BadGatewayError
 from elastic_transport import BadRequestError as BadRequestError
@@ -35,7 +37,10 @@ from elastic_transport import ServiceUnavailableError as ServiceUnavailableError
 from elastic_transport import TransportError as TransportError
 from elastic_transport import UnauthorizedError as UnauthorizedError
 
-from ._serializer import JSONSerializer
+from ._cache import ResponseCache
+from ._http_urllib3 import PoolStats, Urllib3HttpConnection
+from ._retry import RetryPolicy
+from ._serializer import JSONSerializer, OrjsonSerializer
 from ._version import __version__  # noqa: F401
 from .client import AppSearch, EnterpriseSearch, WorkplaceSearch
 
@@ -54,11 +59,65 @@ __all__ = [
     "JSONSerializer",
     "MethodNotImplementedError",
     "NotFoundError",
+    "OrjsonSerializer",
     "PayloadTooLargeError",
     "PaymentRequiredError",
+    "PoolStats",
+    "ResponseCache",
+    "RetryPolicy",
     "SerializationError",
     "ServiceUnavailableError",
     "TransportError",
     "UnauthorizedError",
+    "Urllib3HttpConnection",
     "WorkplaceSearch",
 ]
+
+_ASYNC_EXPORTS = (
+    "AIOHttpConnection",
+    "AsyncAppSearch",
+    "AsyncEnterpriseSearch",
+    "AsyncTransport",
+    "AsyncWorkplaceSearch",
+)
+
+if sys.version_info >= (3, 7):
+    # The asyncio clients import 'aiohttp' which is slow to import
+    # so they're only imported once they're accessed (PEP 562).
+    def __getattr__(name):
+        if name in _ASYNC_EXPORTS:
+            from . import _async
+
+            value = getattr(_async, name)
+            globals()[name] = value
+            return value
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(_ASYNC_EXPORTS))
+
+    __all__ += _ASYNC_EXPORTS
+    __all__.sort()
+
+else:
+    try:
+        # asyncio clients are only available on Python 3.6+
+        if sys.version_info < (3, 6):
+            raise ImportError
+
+        from ._async import AIOHttpConnection as AIOHttpConnection
+        from ._async import AsyncAppSearch as AsyncAppSearch
+        from ._async import AsyncEnterpriseSearch as AsyncEnterpriseSearch
+        from ._async import AsyncTransport as AsyncTransport
+        from ._async import AsyncWorkplaceSearch as AsyncWorkplaceSearch
+
+        __all__ += [
+            "AIOHttpConnection",
+            "AsyncAppSearch",
+            "AsyncEnterpriseSearch",
+            "AsyncTransport",
+            "AsyncWorkplaceSearch",
+        ]
+        __all__.sort()
+    except (ImportError, SyntaxError):
+        pass
@@ -0,0 +1,323 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+from ..._utils import DEFAULT
+from ...client import AppSearch, WorkplaceSearch, _oauth_exchange_params
+from ..helpers import async_iter_pages
+from ._app_search import AsyncAppSearch as _AsyncAppSearch
+from ._enterprise_search import AsyncEnterpriseSearch as _AsyncEnterpriseSearch
+from ._workplace_search import AsyncWorkplaceSearch as _AsyncWorkplaceSearch
+
+__all__ = ["AsyncAppSearch", "AsyncEnterpriseSearch", "AsyncWorkplaceSearch"]
+
+
+class AsyncAppSearch(_AsyncAppSearch):
+    """Async client for Elastic App Search service
+
+    `<https://www.elastic.co/guide/en/app-search/current/api-reference.html>`_
+
+    :arg response_cache: :class:`~elastic_enterprise_search.ResponseCache`
+        to cache responses from :meth:`search`, :meth:`multi_search`,
+        and :meth:`query_suggestion` in. Disabled by default.
+    """
+
+    def __init__(self, *args, **kwargs):
+        response_cache = kwargs.pop("response_cache", None)
+        super(AsyncAppSearch, self).__init__(*args, **kwargs)
+        self.response_cache = response_cache
+
+    async def perform_request(
+        self,
+        method,
+        path,
+        headers=None,
+        params=None,
+        body=None,
+        http_auth=DEFAULT,
+        request_timeout=DEFAULT,
+        ignore_status=(),
+    ):
+        cache = self.response_cache
+        if cache is None:
+            return await super(AsyncAppSearch, self).perform_request(
+                method,
+                path,
+                headers=headers,
+                params=params,
+                body=body,
+                http_auth=http_auth,
+                request_timeout=request_timeout,
+                ignore_status=ignore_status,
+            )
+
+        key, engine_name = cache._request_key(
+            self, method, path, params, body, headers, http_auth
+        )
+        if key is not None:
+            resp = cache._get(key, self.transport.serializer)
+            if resp is not None:
+                return resp
+        try:
+            resp = await super(AsyncAppSearch, self).perform_request(
+                method,
+                path,
+                headers=headers,
+                params=params,
+                body=body,
+                http_auth=http_auth,
+                request_timeout=request_timeout,
+                ignore_status=ignore_status,
+            )
+        finally:
+            # Documents may have changed even if the request failed.
+            if key is None and engine_name is not None:
+                cache.invalidate(engine_name)
+        if key is not None:
+            cache._put(key, engine_name, resp, self.transport.serializer)
+        return resp
+
+    create_signed_search_key = staticmethod(AppSearch.create_signed_search_key)
+
+    async def index_documents(self, engine_name, documents, **kwargs):
+        """Create or update documents
+
+        `<https://www.elastic.co/guide/en/app-search/master/documents.html#documents-create>`_
+
+        :arg engine_name: Name of the engine
+        :arg documents: List of document to index. A ``pandas.DataFrame``
+            or a dict of field names to NumPy arrays or pandas Series is
+            encoded column by column with
+            :func:`~elastic_enterprise_search.helpers.encode_columns`
+        :arg kwargs: Additional arguments for the request, the same
+            as for other APIs like ``params`` and ``http_auth``
+        """
+        from ...helpers._columnar import _is_columnar, encode_columns
+
+        if _is_columnar(documents):
+            documents = encode_columns(documents, serializer=self.transport.serializer)
+        return await super(AsyncAppSearch, self).index_documents(
+            engine_name, documents, **kwargs
+        )
+
+    def iter_api_keys(self, page_size=None, prefetch=False, **kwargs):
+        """Iterates over every API key by lazily
+        requesting pages from :meth:`list_api_keys`
+
+        :arg page_size: The number of results per page
+        :arg prefetch: Request the next page in the background
+            while the current page is being processed
+        :arg kwargs: Additional arguments passed to :meth:`list_api_keys`
+        """
+        return _async_iter_results(self.list_api_keys, page_size, prefetch, **kwargs)
+
+    def iter_curations(self, engine_name, page_size=None, prefetch=False, **kwargs):
+        """Iterates over every curation in an engine by lazily
+        requesting pages from :meth:`list_curations`
+
+        :arg engine_name: Name of the engine
+        :arg page_size: The number of results per page
+        :arg prefetch: Request the next page in the background
+            while the current page is being processed
+        :arg kwargs: Additional arguments passed to :meth:`list_curations`
+        """
+        return _async_iter_results(
+            self.list_curations, page_size, prefetch, engine_name=engine_name, **kwargs
+        )
+
+    def iter_documents(self, engine_name, page_size=None, prefetch=False, **kwargs):
+        """Iterates over every document in an engine by lazily
+        requesting pages from :meth:`list_documents`
+
+        :arg engine_name: Name of the engine
+        :arg page_size: The number of results per page
+        :arg prefetch: Request the next page in the background
+            while the current page is being processed
+        :arg kwargs: Additional arguments passed to :meth:`list_documents`
+        """
+        return _async_iter_results(
+            self.list_documents, page_size, prefetch, engine_name=engine_name, **kwargs
+        )
+
+    def iter_engines(self, page_size=None, prefetch=False, **kwargs):
+        """Iterates over every engine by lazily
+        requesting pages from :meth:`list_engines`
+
+        :arg page_size: The number of results per page
+        :arg prefetch: Request the next page in the background
+            while the current page is being processed
+        :arg kwargs: Additional arguments passed to :meth:`list_engines`
+        """
+        return _async_iter_results(self.list_engines, page_size, prefetch, **kwargs)
+
+    def iter_synonym_sets(self, engine_name, page_size=None, prefetch=False, **kwargs):
+        """Iterates over every synonym set in an engine by lazily
+        requesting pages from :meth:`list_synonym_sets`
+
+        :arg engine_name: Name of the engine
+        :arg page_size: The number of results per page
+        :arg prefetch: Request the next page in the background
+            while the current page is being processed
+        :arg kwargs: Additional arguments passed to :meth:`list_synonym_sets`
+        """
+        return _async_iter_results(
+            self.list_synonym_sets,
+            page_size,
+            prefetch,
+            engine_name=engine_name,
+            **kwargs
+        )
+
+
+class AsyncWorkplaceSearch(_AsyncWorkplaceSearch):
+    """Async client for Workplace Search
+
+    `<https://www.elastic.co/guide/en/workplace-search/current/workplace-search-api-overview.html>`_
+    """
+
+    oauth_authorize_url = WorkplaceSearch.oauth_authorize_url
+
+    async def oauth_exchange_for_access_token(
+        self, client_id, client_secret, redirect_uri, code=None, refresh_token=None
+    ):
+        """Exchanges either an authorization code or refresh token for
+        an access token via the confidential OAuth flow.
+
+        :param client_id: Client ID as generated when setting up an OAuth application
+        :param client_secret: Client secret as generated when setting up an OAuth application
+        :param redirect_uri: Location to redirect user once the OAuth process is completed.
+            Must match one of the URIs configured in the OAuth application
+        :param code: Authorization code as returned by the '/ws/oauth/authorize' endpoint
+        :param refresh_token: Refresh token returned at the same time as receiving an access token
+        :returns: The HTTP response containing the access_token and refresh_token
+            along with other token-related metadata
+        """
+        params = _oauth_exchange_params(
+            client_id, client_secret, redirect_uri, code, refresh_token
+        )
+
+        return await self.perform_request(
+            method="POST",
+            path="/ws/oauth/token",
+            params=params,
+            # Note that we don't want any authentication on this
+            # request, the 'code'/'refresh_token' is enough!
+            http_auth=None,
+        )
+
+    def iter_content_sources(self, page_size=None, prefetch=False, **kwargs):
+        """Iterates over every content source by lazily
+        requesting pages from :meth:`list_content_sources`
+
+        :arg page_size: The number of results per page
+        :arg prefetch: Request the next page in the background
+            while the current page is being processed
+        :arg kwargs: Additional arguments passed to :meth:`list_content_sources`
+        """
+        return _async_iter_results(
+            self.list_content_sources, page_size, prefetch, **kwargs
+        )
+
+    def iter_external_identities(
+        self, content_source_id, page_size=None, prefetch=False, **kwargs
+    ):
+        """Iterates over every external identity of a content source by lazily
+        requesting pages from :meth:`list_external_identities`
+
+        :arg content_source_id: Unique ID for a Custom API source, provided upon
+            creation of a Custom API Source
+        :arg page_size: The number of results per page
+        :arg prefetch: Request the next page in the background
+            while the current page is being processed
+        :arg kwargs: Additional arguments passed to :meth:`list_external_identities`
+        """
+        return _async_iter_results(
+            self.list_external_identities,
+            page_size,
+            prefetch,
+            content_source_id=content_source_id,
+            **kwargs
+        )
+
+    def iter_permissions(
+        self, content_source_id, page_size=None, prefetch=False, **kwargs
+    ):
+        """Iterates over every user permission of a content source by lazily
+        requesting pages from :meth:`list_permissions`
+
+        :arg content_source_id: Unique ID for a Custom API source, provided upon
+            creation of a Custom API Source
+        :arg page_size: The number of results per page
+        :arg prefetch: Request the next page in the background
+            while the current page is being processed
+        :arg kwargs: Additional arguments passed to :meth:`list_permissions`
+        """
+        return _async_iter_results(
+            self.list_permissions,
+            page_size,
+            prefetch,
+            content_source_id=content_source_id,
+            **kwargs
+        )
+
+
+async def _async_iter_results(list_api, page_size, prefetch, **kwargs):
+    """Yields every result from every page of a paginated list API"""
+    async for page in async_iter_pages(
+        list_api, page_size=page_size, prefetch=prefetch, **kwargs
+    ):
+        for result in page["results"]:
+            yield result
+
+
+class AsyncEnterpriseSearch(_AsyncEnterpriseSearch):
+    """Async client for Enterprise Search
+
+    `<https://www.elastic.co/guide/en/enterprise-search/current/management-apis.html>`_
+    """
+
+    def __init__(self, hosts=None, transport_class=None, **kwargs):
+        """
+        :arg hosts: List of nodes, or a single node, we should connect to.
+            Node should be a dictionary ({"host": "localhost", "port": 3002}),
+            the entire dictionary will be passed to the :class:`~elastic_transport.Connection`
+            class as kwargs, or a string in the format of ``host[:port]`` which will be
+            translated to a dictionary automatically.  If no value is given the
+            :class:`~elastic_transport.Connection` class defaults will be used.
+
+        :arg transport_class: :class:`~elastic_enterprise_search.AsyncTransport`
+            sub-class to use.
+
+        :arg kwargs: Any additional arguments will be passed on to the
+            :class:`~elastic_enterprise_search.AsyncTransport` class and,
+            subsequently, to the :class:`~elastic_transport.Connection` instances.
+        """
+        super(AsyncEnterpriseSearch, self).__init__(
+            hosts=hosts, transport_class=transport_class, **kwargs
+        )
+
+        self.app_search = AsyncAppSearch(
+            _transport=self.transport,
+            coalesce_requests=self._single_flight is not None,
+            retry_policy=self.retry_policy,
+            http_compress=self._compress_min_size,
+        )
+        self.workplace_search = AsyncWorkplaceSearch(
+            _transport=self.transport,
+            coalesce_requests=self._single_flight is not None,
+            retry_policy=self.retry_policy,
+            http_compress=self._compress_min_size,
+        )
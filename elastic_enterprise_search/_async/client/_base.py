@@ -0,0 +1,134 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import asyncio
+import functools
+
+from elastic_transport import TransportError
+
+from ..._cache import _request_key
+from ..._singleflight import _is_idempotent_read
+from ..._utils import DEFAULT
+from ...client._base import BaseClient
+from ..singleflight import AsyncSingleFlight
+from ..transport import AsyncTransport
+
+__all__ = ["AsyncBaseClient"]
+
+
+class AsyncBaseClient(BaseClient):
+    _single_flight_class = AsyncSingleFlight
+
+    def __init__(
+        self,
+        hosts=None,
+        http_auth=None,
+        transport_class=None,
+        meta_header=None,
+        coalesce_requests=False,
+        retry_policy=None,
+        http_compress=False,
+        _transport=None,
+        **kwargs
+    ):
+        if _transport is None and transport_class is None:
+            transport_class = AsyncTransport
+        super(AsyncBaseClient, self).__init__(
+            hosts=hosts,
+            http_auth=http_auth,
+            transport_class=transport_class,
+            meta_header=meta_header,
+            coalesce_requests=coalesce_requests,
+            retry_policy=retry_policy,
+            http_compress=http_compress,
+            _transport=_transport,
+            **kwargs
+        )
+
+    async def close(self):
+        await self.transport.close()
+
+    async def perform_request(
+        self,
+        method,
+        path,
+        headers=None,
+        params=None,
+        body=None,
+        http_auth=DEFAULT,
+        request_timeout=DEFAULT,
+        ignore_status=(),
+    ):
+        """Adds client authentication to request headers
+        before handing it to the AsyncTransport layer.
+        """
+        headers = self._prepare_headers(headers, params, http_auth)
+        if self._compress_min_size is not None:
+            headers, body = self._compress_request(method, path, headers, body)
+
+        retry_policy = self.retry_policy
+        if retry_policy is None:
+            return await self._perform_request(
+                method, path, headers, params, body, request_timeout, ignore_status
+            )
+
+        retry = 0
+        while True:
+            try:
+                return await self._perform_request(
+                    method, path, headers, params, body, request_timeout, ignore_status
+                )
+            except TransportError as e:
+                if not retry_policy._should_retry(retry, e):
+                    raise
+                await asyncio.sleep(retry_policy._backoff(retry, e))
+                retry += 1
+
+    async def _perform_request(
+        self, method, path, headers, params, body, request_timeout, ignore_status
+    ):
+        if self._single_flight is not None and _is_idempotent_read(method, path):
+            key = _request_key(method, path, params, body, headers)
+            return await self._single_flight.do(
+                (key, repr(request_timeout), repr(ignore_status)),
+                functools.partial(
+                    self.transport.perform_request,
+                    method,
+                    path,
+                    headers=headers,
+                    params=params,
+                    body=body,
+                    request_timeout=request_timeout,
+                    ignore_status=ignore_status,
+                ),
+            )
+
+        return await self.transport.perform_request(
+            method,
+            path,
+            headers=headers,
+            params=params,
+            body=body,
+            request_timeout=request_timeout,
+            ignore_status=ignore_status,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        await self.close()
@@ -0,0 +1,61 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import asyncio
+
+__all__ = ["async_iter_pages"]
+
+
+async def async_iter_pages(list_api, page_size=None, prefetch=False, **kwargs):
+    """Async version of :func:`~elastic_enterprise_search.helpers.iter_pages`.
+    With ``prefetch=True`` the next page is requested in a task
+    while the current page is being processed.
+
+    :arg list_api: Async client method which accepts ``current_page``
+        and ``page_size``, for example ``AsyncAppSearch.list_documents``
+    :arg page_size: The number of results per page
+    :arg prefetch: Request the next page while the current page is being processed
+    :arg kwargs: Additional arguments passed to ``list_api``
+    """
+
+    def fetch_page(current_page):
+        return list_api(current_page=current_page, page_size=page_size, **kwargs)
+
+    next_resp = None
+    try:
+        current_page = 1
+        resp = await fetch_page(current_page)
+        while True:
+            has_next_page = (
+                bool(resp["results"])
+                and current_page < resp["meta"]["page"]["total_pages"]
+            )
+            if prefetch and has_next_page:
+                next_resp = asyncio.ensure_future(fetch_page(current_page + 1))
+
+            yield resp
+
+            if not has_next_page:
+                break
+            current_page += 1
+            if next_resp is not None:
+                resp, next_resp = await next_resp, None
+            else:
+                resp = await fetch_page(current_page)
+    finally:
+        if next_resp is not None:
+            next_resp.cancel()
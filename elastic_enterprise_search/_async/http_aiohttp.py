@@ -0,0 +1,248 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import asyncio
+import ssl
+import time
+import warnings
+
+from elastic_transport import Connection, ConnectionError, ConnectionTimeout
+from elastic_transport.utils import DEFAULT, client_meta_version, normalize_headers
+
+try:
+    import aiohttp
+except ImportError:  # pragma: nocover
+    aiohttp = None
+
+try:
+    import certifi
+
+    CA_CERTS = certifi.where()
+except ImportError:  # pragma: nocover
+    CA_CERTS = None
+
+__all__ = ["AIOHttpConnection"]
+
+
+class AIOHttpConnection(Connection):
+    """
+    Default asyncio connection class using the `aiohttp` library.
+    Connections are pooled per host by a single ``aiohttp.ClientSession``
+    which is created on the first request so that it's bound to the
+    running event loop.
+
+    :arg host: hostname of the node (default: localhost)
+    :arg port: port to use (integer)
+    :arg url_prefix: optional url prefix
+    :arg use_ssl: use ssl for the connection if `True`
+    :arg verify_certs: whether to verify SSL certificates
+    :arg ssl_show_warn: show warning when verify certs is disabled
+    :arg ca_certs: optional path to CA bundle.
+    :arg client_cert: path to the file containing the private key and the
+        certificate, or cert only if using client_key
+    :arg client_key: path to the file containing the private key if using
+        separate cert and key files (client_cert will contain only the cert)
+    :arg ssl_context: :class:`ssl.SSLContext` to use instead of
+        building one from the other SSL options
+    :arg connections_per_host: the number of connections which will be kept open to this
+        host.
+    :arg connection_idle_timeout: close connections which weren't used for
+        this many seconds, by default aiohttp's keep-alive timeout is used
+    :arg headers: any custom http headers to be add to requests
+    :arg http_compress: Use gzip compression
+    :arg opaque_id: Send this value in the 'X-Opaque-Id' HTTP header
+        For tracing all requests made by this transport.
+    """
+
+    HTTP_CLIENT_META = (
+        ("ai", client_meta_version(aiohttp.__version__)) if aiohttp else None
+    )
+
+    def __init__(
+        self,
+        host="localhost",
+        port=None,
+        use_ssl=False,
+        verify_certs=DEFAULT,
+        ssl_show_warn=DEFAULT,
+        ca_certs=None,
+        client_cert=None,
+        client_key=None,
+        ssl_context=None,
+        connections_per_host=10,
+        connection_idle_timeout=None,
+        headers=None,
+        http_compress=None,
+        opaque_id=None,
+        **kwargs
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "You must have 'aiohttp' installed to use AIOHttpConnection"
+            )
+
+        super(AIOHttpConnection, self).__init__(
+            host=host,
+            port=port,
+            use_ssl=use_ssl,
+            headers=headers,
+            http_compress=http_compress,
+            opaque_id=opaque_id,
+            **kwargs
+        )
+
+        if ssl_context and (
+            (verify_certs is not DEFAULT)
+            or (ssl_show_warn is not DEFAULT)
+            or ca_certs
+            or client_cert
+            or client_key
+        ):
+            warnings.warn(
+                "When using `ssl_context`, all other SSL related kwargs are ignored"
+            )
+
+        if self.use_ssl and ssl_context is None:
+            if verify_certs is DEFAULT:
+                verify_certs = True
+            if ssl_show_warn is DEFAULT:
+                ssl_show_warn = True
+
+            ca_certs = CA_CERTS if ca_certs is None else ca_certs
+            if verify_certs:
+                if not ca_certs:
+                    raise ValueError(
+                        "Root certificates are missing for certificate "
+                        "validation. Either pass them in using the ca_certs parameter or "
+                        "install certifi to use it automatically."
+                    )
+                ssl_context = ssl.create_default_context(cafile=ca_certs)
+            else:
+                ssl_context = ssl.create_default_context()
+                ssl_context.check_hostname = False
+                ssl_context.verify_mode = ssl.CERT_NONE
+                if ssl_show_warn:
+                    warnings.warn(
+                        "Connecting to %r using SSL with verify_certs=False is insecure"
+                        % self.base_url
+                    )
+            if client_cert:
+                ssl_context.load_cert_chain(client_cert, client_key)
+
+        self._ssl_context = ssl_context
+        self._connections_per_host = connections_per_host
+        self._connection_idle_timeout = connection_idle_timeout
+        self.session = None
+
+    async def perform_request(
+        self,
+        method,
+        target,
+        body=None,
+        request_timeout=DEFAULT,
+        ignore_status=(),
+        headers=None,
+    ):
+        if self.session is None:
+            self._create_session()
+
+        url = self.base_url + target
+        if request_timeout is DEFAULT:
+            request_timeout = self.request_timeout
+        timeout = aiohttp.ClientTimeout(total=request_timeout)
+
+        request_headers = self.headers.copy()
+        request_headers.update(headers or ())
+        request_headers = normalize_headers(request_headers)
+
+        orig_body = body
+        if self.http_compress and body:
+            body = self._gzip_compress(body)
+            request_headers["content-encoding"] = "gzip"
+
+        start = time.time()
+        try:
+            async with self.session.request(
+                method,
+                url,
+                data=body,
+                headers=request_headers,
+                timeout=timeout,
+            ) as response:
+                raw_data = (await response.read()).decode("utf-8", "surrogatepass")
+                response_headers = dict(response.headers)
+            duration = time.time() - start
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.log_request_fail(
+                method=method,
+                url=url,
+                body=orig_body,
+                duration=time.time() - start,
+                exception=e,
+            )
+            if isinstance(e, asyncio.TimeoutError):
+                raise ConnectionTimeout(
+                    "Connection timed out during request", errors=(e,)
+                )
+            raise ConnectionError(str(e), errors=(e,))
+
+        # raise errors based on http status codes, let the client handle those if needed
+        if not (200 <= response.status < 300) and response.status not in ignore_status:
+            self.log_request_fail(
+                method=method,
+                url=url,
+                body=orig_body,
+                duration=duration,
+                status=response.status,
+                response=raw_data,
+            )
+            self._raise_error(
+                status=response.status, headers=response_headers, raw_data=raw_data
+            )
+
+        self.log_request_success(
+            method=method,
+            url=url,
+            body=orig_body,
+            status=response.status,
+            response=raw_data,
+            duration=duration,
+        )
+
+        return response.status, response_headers, raw_data
+
+    async def close(self):
+        """
+        Explicitly closes connection
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _create_session(self):
+        connector_kwargs = {"limit": self._connections_per_host}
+        if self._connection_idle_timeout is not None:
+            connector_kwargs["keepalive_timeout"] = self._connection_idle_timeout
+        if self.use_ssl:
+            connector_kwargs["ssl"] = self._ssl_context
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(**connector_kwargs),
+            # Responses are decoded from gzip automatically
+            auto_decompress=True,
+        )
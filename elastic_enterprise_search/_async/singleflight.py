@@ -0,0 +1,82 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import asyncio
+
+from .._cache import _copy_response, _response_meta
+from .._singleflight import _is_copyable
+
+__all__ = ["AsyncSingleFlight"]
+
+
+class AsyncSingleFlight(object):
+    """Shares a single in-flight request between every task
+    making an identical request at the same time. Callers
+    waiting on another task's request receive their own
+    copy of the response or the same raised exception.
+
+    The request runs in its own task so cancelling any of the
+    callers, including the one which started the request, only
+    stops that caller from waiting. The request is cancelled
+    once every caller waiting on it has been cancelled.
+    """
+
+    def __init__(self, serializer):
+        self.serializer = serializer
+        self._calls = {}
+
+    async def do(self, key, func):
+        call = self._calls.get(key)
+        leader = call is None
+        if leader:
+            # key -> [task, number of callers waiting on it]
+            call = self._calls[key] = [None, 0]
+            call[0] = asyncio.ensure_future(self._request(key, call, func))
+            call[0].add_done_callback(_retrieve_exception)
+        task = call[0]
+
+        call[1] += 1
+        try:
+            response, encoded = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            call[1] -= 1
+            if call[1] == 0 and not task.done():
+                task.cancel()
+            raise
+        # The caller which started the request gets the original
+        # response, callers joining the request get a copy.
+        if encoded is None or leader:
+            return response
+        return _copy_response(_response_meta(response), encoded, self.serializer)
+
+    async def _request(self, key, call, func):
+        try:
+            response = await func()
+        finally:
+            # No new callers can join once the call is removed.
+            del self._calls[key]
+
+        encoded = None
+        if call[1] > 1 and _is_copyable(response):
+            encoded = self.serializer.dumps(response.body)
+        return response, encoded
+
+
+def _retrieve_exception(task):
+    # Marks the exception as retrieved when no caller is left waiting.
+    if not task.cancelled():
+        task.exception()
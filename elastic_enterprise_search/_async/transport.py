@@ -0,0 +1,162 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+from elastic_transport import (
+    ConnectionError,
+    ConnectionTimeout,
+    Transport,
+    TransportError,
+)
+from elastic_transport.models import QueryParams
+from elastic_transport.response import DictResponse, ListResponse, Response
+from elastic_transport.utils import DEFAULT, normalize_headers
+
+from .http_aiohttp import AIOHttpConnection
+
+__all__ = ["AsyncTransport"]
+
+
+class AsyncTransport(Transport):
+    """Same as :class:`~elastic_transport.Transport` except that
+    requests are sent with ``await`` by an asyncio connection class.
+
+    Main interface is the `perform_request` coroutine.
+    """
+
+    DEFAULT_CONNECTION_CLASS = AIOHttpConnection
+
+    async def perform_request(
+        self,
+        method,
+        path,
+        headers=None,
+        params=None,
+        body=None,
+        request_timeout=DEFAULT,
+        ignore_status=(),
+    ):
+        """
+        Perform the actual request. Retrieve a connection from the connection
+        pool, pass all the information to it's perform_request method and
+        return the data.
+
+        If an exception was raised, mark the connection as failed and retry (up
+        to `max_retries` times).
+
+        :arg method: HTTP method to use
+        :arg path: relative URL to target
+        :arg headers: dictionary of headers, will be handed over to the
+            underlying :class:`~elastic_transport.Connection` class
+        :arg params: dictionary of query parameters, will be handed over to the
+            underlying :class:`~elastic_transport.Connection` class for serialization
+        :arg body: body of the request, will be serialized using serializer and
+            passed to the connection
+        :arg request_timeout: Timeout to be passed to the HTTP client for the request
+        :arg ignore_status: Collection of HTTP status codes to not raise an error for.
+        :returns: Deserialized Response
+        """
+        if isinstance(ignore_status, int):
+            ignore_status = (ignore_status,)
+
+        if body is not None:
+            body = self.serializer.dumps(body)
+            try:
+                body = body.encode("utf-8", "surrogatepass")
+            except (UnicodeError, AttributeError):
+                # bytes/str - no need to re-encode
+                pass
+
+        headers = normalize_headers(headers)
+        if params is not None and not isinstance(params, QueryParams):
+            params = QueryParams(params)
+
+        target = path
+        if params:
+            target += "?" + self.params_encoder(params)
+
+        # Errors are stored from (oldest->newest)
+        errors = []
+
+        for attempt in range(self.max_retries + 1):
+            connection = self.get_connection()
+
+            try:
+                resp_status, resp_headers, data = await connection.perform_request(
+                    method,
+                    target,
+                    body,
+                    headers=headers,
+                    ignore_status=ignore_status,
+                    request_timeout=request_timeout,
+                )
+            except TransportError as e:
+                if method == "HEAD" and e.status == 404:
+                    return Response(status=404, headers=e.headers, body=False)
+
+                retry = False
+                if isinstance(e, ConnectionTimeout):
+                    retry = self.retry_on_timeout
+                elif isinstance(e, ConnectionError):
+                    retry = True
+                elif e.status in self.retry_on_status:
+                    retry = True
+
+                if retry:
+                    try:
+                        # only mark as dead if we are retrying
+                        self.mark_dead(connection)
+                    except TransportError:
+                        pass
+                    # raise exception on last retry
+                    if attempt == self.max_retries:
+                        e.errors = tuple(errors)
+                        raise
+                    else:
+                        errors.append(e)
+                else:
+                    e.errors = tuple(errors)
+                    raise
+
+            else:
+                # connection didn't fail, confirm it's live status
+                self.connection_pool.mark_live(connection)
+
+                if method == "HEAD":
+                    return Response(
+                        status=resp_status,
+                        headers=resp_headers,
+                        body=200 <= resp_status < 300,
+                    )
+
+                if data:
+                    data = self.deserializer.loads(
+                        data, resp_headers.get("content-type")
+                    )
+
+                response_cls = Response
+                if isinstance(data, list):
+                    response_cls = ListResponse
+                elif isinstance(data, dict):
+                    response_cls = DictResponse
+                return response_cls(status=resp_status, headers=resp_headers, body=data)
+
+    async def close(self):
+        """
+        Explicitly closes connections
+        """
+        for connection in self.connection_pool.connections:
+            await connection.close()
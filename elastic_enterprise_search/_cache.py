@@ -0,0 +1,209 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from ._utils import DEFAULT
+from ._utils import monotonic as _monotonic
+
+__all__ = ["ResponseCache"]
+
+# App Search endpoints whose responses can be cached and
+# the endpoints that invalidate cached responses for an engine.
+_CACHED_ACTIONS = frozenset(("search", "multi_search", "query_suggestion"))
+_INVALIDATING_ACTIONS = frozenset(("documents",))
+
+
+def _engine_action(path):
+    """Returns the '(engine_name, action)' for a request path of
+    the form '/api/as/v1/engines/{engine_name}/{action}' otherwise
+    returns 'None'.
+    """
+    parts = path.split("?", 1)[0].split("/")
+    if len(parts) == 7 and parts[1:5] == ["api", "as", "v1", "engines"]:
+        return parts[5], parts[6]
+    return None
+
+
+def _request_key(method, path, params, body, headers):
+    """Returns a string which is equal for equivalent requests.
+    Only a digest of the 'Authorization' header is kept in the key.
+    """
+    auth = None
+    extra_headers = []
+    for k, v in (headers or {}).items():
+        k = k.lower()
+        if k == "authorization":
+            auth = v
+        elif k not in ("user-agent", "x-elastic-client-meta"):
+            extra_headers.append((k, v))
+    params = sorted(
+        (k, v) for k, v in (params or {}).items() if k != "__elastic_client_meta"
+    )
+    key = json.dumps(
+        [method, path, params, body, sorted(extra_headers)],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    if auth is not None:
+        key += hashlib.sha256(auth.encode("utf-8")).hexdigest()
+    return key
+
+
+def _response_meta(response):
+    return type(response), response.status, response.headers
+
+
+def _copy_response(meta, encoded, serializer):
+    """Creates a new response from the '_response_meta()'
+    of a response and its serialized body
+    """
+    response_cls, status, headers = meta
+    return response_cls(status=status, headers=headers, body=serializer.loads(encoded))
+
+
+class ResponseCache(object):
+    """In-process cache of App Search responses for ``search()``,
+    ``multi_search()``, and ``query_suggestion()``.
+
+    Responses are keyed on the request path, query parameters, request
+    body, and the authentication used for the request. Entries expire
+    after ``ttl`` seconds and the least recently used entries are evicted
+    when either ``max_entries`` or ``max_bytes`` would be exceeded.
+    Calling ``index_documents()``, ``put_documents()``, or ``delete_documents()``
+    with the same client invalidates all cached responses for that engine.
+
+    :arg ttl: Number of seconds a response is cached for
+    :arg max_entries: Maximum number of responses to cache
+    :arg max_bytes: Maximum total size of the cached responses
+        when serialized as JSON. Defaults to no limit.
+    """
+
+    def __init__(self, ttl=60.0, max_entries=1000, max_bytes=None):
+        if ttl <= 0:
+            raise ValueError("'ttl' must be greater than zero")
+        if max_entries < 1:
+            raise ValueError("'max_entries' must be at least 1")
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        # key -> (expires_at, engine_name, nbytes, response meta, encoded body)
+        self._entries = OrderedDict()
+        self._nbytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def nbytes(self):
+        """Total size of the cached responses in bytes"""
+        return self._nbytes
+
+    def clear(self):
+        """Removes every cached response"""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def invalidate(self, engine_name):
+        """Removes every cached response for an engine"""
+        with self._lock:
+            for key in [k for k, v in self._entries.items() if v[1] == engine_name]:
+                self._nbytes -= self._entries.pop(key)[2]
+
+    def _request_key(self, client, method, path, params, body, headers, http_auth):
+        """Returns '(key, engine_name)' for a cacheable request,
+        '(None, engine_name)' for a request that invalidates the
+        engine, and '(None, None)' for every other request.
+        """
+        engine_action = _engine_action(path)
+        if engine_action is None:
+            return None, None
+        engine_name, action = engine_action
+        if action in _INVALIDATING_ACTIONS:
+            return None, engine_name if method != "GET" else None
+        if action not in _CACHED_ACTIONS:
+            return None, None
+
+        if http_auth is not DEFAULT:
+            auth = client._parse_http_auth(http_auth)
+        else:
+            auth = client._authorization_header
+        headers = dict(headers or {})
+        if auth is not None and not any(k.lower() == "authorization" for k in headers):
+            headers["authorization"] = auth
+        key = _request_key(method, path, params, body, headers)
+        return key, engine_name
+
+    def _get(self, key, serializer):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                if entry[0] > _monotonic():
+                    # Re-insert to mark as most recently used.
+                    self._entries[key] = entry
+                else:
+                    self._nbytes -= entry[2]
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        # Cached responses are stored serialized so every
+        # caller gets their own copy of the response body.
+        return _copy_response(entry[3], entry[4], serializer)
+
+    def _put(self, key, engine_name, response, serializer):
+        body = getattr(response, "body", None)
+        if getattr(response, "status", None) != 200 or not isinstance(
+            body, (dict, list)
+        ):
+            return
+        encoded = serializer.dumps(body)
+        nbytes = len(encoded)
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+
+        entry = (
+            _monotonic() + self.ttl,
+            engine_name,
+            nbytes,
+            _response_meta(response),
+            encoded,
+        )
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[2]
+            self._entries[key] = entry
+            self._nbytes += nbytes
+
+            # Evict the least recently used responses
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._nbytes > self.max_bytes
+            ):
+                self._nbytes -= self._entries.popitem(last=False)[1][2]
@@ -0,0 +1,63 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import gzip
+import io
+
+from six import ensure_binary
+
+__all__ = ["DEFAULT_COMPRESS_MIN_SIZE"]
+
+# Bodies smaller than this mostly fit into a single
+# packet so compressing them barely saves any time.
+DEFAULT_COMPRESS_MIN_SIZE = 1024
+
+# Same as zlib's default level, higher levels are
+# much slower while only saving a few more bytes.
+_COMPRESS_LEVEL = 6
+
+
+def _compress_min_size(http_compress):
+    """Returns the minimum size in bytes of request bodies to compress
+    for the 'http_compress' parameter or 'None' if it's disabled.
+    """
+    if http_compress is True:
+        return DEFAULT_COMPRESS_MIN_SIZE
+    elif http_compress is None or http_compress is False:
+        return None
+    elif not isinstance(http_compress, int) or http_compress < 0:
+        raise ValueError(
+            "'http_compress' must be a bool or the minimum number of bytes to compress"
+        )
+    return http_compress
+
+
+def _gzip_compress(data):
+    """Compresses 'data' with gzip. The modification time is left
+    out of the header so equal bodies compress to equal bytes.
+    """
+    buf = io.BytesIO()
+    with gzip.GzipFile(
+        fileobj=buf, mode="wb", compresslevel=_COMPRESS_LEVEL, mtime=0
+    ) as f:
+        f.write(data)
+    return buf.getvalue()
+
+
+def _encode_body(serializer, body):
+    """Serializes a request body to bytes the same way the Transport would"""
+    return ensure_binary(serializer.dumps(body), errors="surrogatepass")
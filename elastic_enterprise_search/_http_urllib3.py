@@ -0,0 +1,274 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import threading
+from collections import namedtuple
+
+import urllib3
+from elastic_transport import Urllib3HttpConnection as _Urllib3HttpConnection
+
+from ._utils import monotonic as _monotonic
+
+__all__ = ["PoolStats", "Urllib3HttpConnection"]
+
+
+class PoolStats(
+    namedtuple(
+        "PoolStats",
+        [
+            "maxsize",
+            "in_use",
+            "idle",
+            "max_in_use",
+            "waits",
+            "wait_time",
+            "connects",
+            "reaped",
+        ],
+    )
+):
+    """Usage of the connections to a single host.
+
+    :arg maxsize: Maximum number of connections to the host
+    :arg in_use: Number of connections currently sending a request
+    :arg idle: Number of open connections waiting in the pool
+    :arg max_in_use: Highest number of connections in use at the same time
+    :arg waits: Number of requests which waited for a connection because
+        all ``maxsize`` connections were in use. If this keeps growing
+        the pool is saturated and ``connections_per_host`` should be raised.
+    :arg wait_time: Total number of seconds requests waited for a connection
+    :arg connects: Number of connections opened, each one a TCP
+        (and TLS) handshake with the host
+    :arg reaped: Number of connections closed after being idle
+        for longer than ``connection_idle_timeout``
+    """
+
+    __slots__ = ()
+
+
+class _MeteredPoolMixin(object):
+    """Counts how the connections of an urllib3 connection pool are used
+    and closes connections which were idle for longer than 'idle_timeout'.
+    """
+
+    def _init_metrics(self, idle_timeout):
+        self.idle_timeout = idle_timeout
+        self._metrics_lock = threading.Lock()
+        self._in_use = 0
+        self._max_in_use = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._connects = 0
+        self._reaped = 0
+        self._next_reap = 0.0
+
+    def _get_conn(self, timeout=None):
+        # With 'block=True' an empty queue means every
+        # connection is in use so this request has to wait.
+        pool = self.pool
+        start = _monotonic() if pool is not None and pool.empty() else None
+        conn = super(_MeteredPoolMixin, self)._get_conn(timeout=timeout)
+        now = _monotonic()
+
+        reaped = self._is_idle(conn, now)
+        if reaped:
+            conn.close()
+        with self._metrics_lock:
+            if start is not None:
+                self._waits += 1
+                self._wait_time += now - start
+            if reaped:
+                self._reaped += 1
+            # Connections without a socket connect before sending the request.
+            if conn.sock is None:
+                self._connects += 1
+            self._in_use += 1
+            self._max_in_use = max(self._max_in_use, self._in_use)
+        return conn
+
+    def _put_conn(self, conn):
+        now = _monotonic()
+        if conn is not None:
+            conn._idle_since = now
+        with self._metrics_lock:
+            self._in_use -= 1
+        super(_MeteredPoolMixin, self)._put_conn(conn)
+
+        if self.idle_timeout is not None and now >= self._next_reap:
+            self._next_reap = now + min(self.idle_timeout, 1.0)
+            self._reap_idle(now)
+
+    def _prewarm(self, n):
+        # Connections are taken from the queue directly
+        # so they aren't counted as used by requests.
+        base = super(_MeteredPoolMixin, self)
+        conns, opened = [], 0
+        try:
+            for _ in range(n):
+                conns.append(base._get_conn(timeout=0))
+            for conn in conns:
+                if conn.sock is None:
+                    conn.connect()
+                    opened += 1
+        except Exception:
+            # Prewarming is best effort, the first
+            # requests will report that the host is down.
+            pass
+        finally:
+            now = _monotonic()
+            for conn in conns:
+                conn._idle_since = now
+                base._put_conn(conn)
+        with self._metrics_lock:
+            self._connects += opened
+        return opened
+
+    def _is_idle(self, conn, now):
+        return (
+            self.idle_timeout is not None
+            and conn is not None
+            and conn.sock is not None
+            and now - getattr(conn, "_idle_since", now) >= self.idle_timeout
+        )
+
+    def _reap_idle(self, now):
+        pool = self.pool
+        if pool is None:
+            return 0
+        reaped = 0
+        # Connections in the queue aren't in use by any request.
+        with pool.mutex:
+            for conn in pool.queue:
+                if self._is_idle(conn, now):
+                    conn.close()
+                    reaped += 1
+        if reaped:
+            with self._metrics_lock:
+                self._reaped += reaped
+        return reaped
+
+    def _stats(self):
+        idle = 0
+        pool = self.pool
+        if pool is not None:
+            with pool.mutex:
+                idle = sum(
+                    1
+                    for conn in pool.queue
+                    if conn is not None and conn.sock is not None
+                )
+        with self._metrics_lock:
+            return PoolStats(
+                maxsize=pool.maxsize if pool is not None else 0,
+                in_use=self._in_use,
+                idle=idle,
+                max_in_use=self._max_in_use,
+                waits=self._waits,
+                wait_time=self._wait_time,
+                connects=self._connects,
+                reaped=self._reaped,
+            )
+
+
+class _HTTPConnectionPool(_MeteredPoolMixin, urllib3.HTTPConnectionPool):
+    pass
+
+
+class _HTTPSConnectionPool(_MeteredPoolMixin, urllib3.HTTPSConnectionPool):
+    pass
+
+
+_METERED_POOL_CLASSES = {
+    urllib3.HTTPConnectionPool: _HTTPConnectionPool,
+    urllib3.HTTPSConnectionPool: _HTTPSConnectionPool,
+}
+
+
+def _metered_pool_class(pool):
+    """Returns the metered subclass of an urllib3 connection pool's class"""
+    pool_class = type(pool)
+    metered_pool_class = _METERED_POOL_CLASSES.get(pool_class)
+    if metered_pool_class is None:
+        raise TypeError(
+            "Can't measure connection pools of type '%s.%s', only "
+            "'urllib3.HTTPConnectionPool' and 'urllib3.HTTPSConnectionPool' "
+            "are supported" % (pool_class.__module__, pool_class.__name__)
+        )
+    return metered_pool_class
+
+
+class Urllib3HttpConnection(_Urllib3HttpConnection):
+    """Same as :class:`elastic_transport.Urllib3HttpConnection` except
+    connections to the host can be opened ahead of the first request
+    and closed once they're idle, and the pool's usage is measured.
+
+    :arg connections_per_host: Maximum number of connections to the host.
+        Requests wait for a connection once all of them are in use.
+    :arg prewarm_connections: Number of connections to open when the
+        connection is created so the first requests don't wait for
+        TCP and TLS handshakes. Connections which fail to open are
+        opened again on their first request instead.
+    :arg connection_idle_timeout: Close connections which weren't used
+        for this many seconds instead of reusing them. Set this lower than
+        the keep-alive timeout of Enterprise Search and any proxies in
+        between so a request is never sent on a connection being closed.
+    :arg kwargs: Any other arguments of
+        :class:`elastic_transport.Urllib3HttpConnection`
+    """
+
+    def __init__(
+        self,
+        connections_per_host=10,
+        prewarm_connections=0,
+        connection_idle_timeout=None,
+        **kwargs
+    ):
+        if not 0 <= prewarm_connections <= connections_per_host:
+            raise ValueError(
+                "'prewarm_connections' must be between zero and 'connections_per_host'"
+            )
+        if connection_idle_timeout is not None and connection_idle_timeout <= 0:
+            raise ValueError("'connection_idle_timeout' must be greater than zero")
+
+        super(Urllib3HttpConnection, self).__init__(
+            connections_per_host=connections_per_host, **kwargs
+        )
+        # The pool is created by the superclass, switch it to
+        # the subclass which only adds metrics and reaping.
+        self.pool.__class__ = _metered_pool_class(self.pool)
+        self.pool._init_metrics(connection_idle_timeout)
+
+        if prewarm_connections:
+            self.prewarm(prewarm_connections)
+
+    def prewarm(self, n):
+        """Opens up to 'n' connections to the host which aren't open yet.
+        Returns the number of connections which were opened.
+        """
+        return self.pool._prewarm(n)
+
+    def reap_idle_connections(self):
+        """Closes connections which weren't used for longer than
+        ``connection_idle_timeout``. Idle connections are also closed
+        while requests are sent, call this to close them without any
+        requests. Returns the number of connections closed.
+        """
+        return self.pool._reap_idle(_monotonic())
+
+    def pool_stats(self):
+        """Returns the :class:`PoolStats` for this host"""
+        return self.pool._stats()
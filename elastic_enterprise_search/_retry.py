@@ -0,0 +1,144 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import contextlib
+import random
+import threading
+import time
+from email.utils import mktime_tz, parsedate_tz
+
+from elastic_transport import ConnectionError, ConnectionTimeout, TransportError
+
+__all__ = ["RetryPolicy"]
+
+# Counts the throttled responses clients retry in each thread so
+# helpers limiting their concurrency can react to them too.
+_throttled_retries = threading.local()
+
+
+class RetryPolicy(object):
+    """Retries requests which failed because Enterprise Search is
+    overloaded, by default responses with HTTP status 429 (Too Many
+    Requests) and 503 (Service Unavailable).
+
+    Before each retry the client waits for the number of seconds
+    in the response's ``Retry-After`` header. Without the header the
+    client waits a random time between zero and ``backoff_factor * 2 ** retry``
+    seconds ("full jitter") so that clients throttled at the same time
+    don't all retry at the same time. Waits never exceed ``max_backoff``.
+
+    :arg max_retries: Maximum number of times a request is retried
+    :arg retry_on_status: HTTP status codes of responses to retry
+    :arg backoff_factor: Seconds to wait at most before the first retry,
+        doubled for each following retry
+    :arg max_backoff: Maximum number of seconds to wait before a retry
+    :arg respect_retry_after: Wait for the time in the ``Retry-After``
+        header if the response has one
+    :arg retry_on_connection_error: Also retry requests which failed
+        to connect or timed out. Disabled by default because a request
+        may have been processed even if the response was never received.
+    """
+
+    def __init__(
+        self,
+        max_retries=3,
+        retry_on_status=(429, 503),
+        backoff_factor=0.5,
+        max_backoff=30.0,
+        respect_retry_after=True,
+        retry_on_connection_error=False,
+    ):
+        if max_retries < 0:
+            raise ValueError("'max_retries' must be zero or greater")
+        if backoff_factor < 0 or max_backoff < 0:
+            raise ValueError("'backoff_factor' and 'max_backoff' must not be negative")
+
+        self.max_retries = max_retries
+        self.retry_on_status = tuple(retry_on_status)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.respect_retry_after = respect_retry_after
+        self.retry_on_connection_error = retry_on_connection_error
+
+    def _is_throttled(self, error):
+        """Returns True if the error means the server is overloaded"""
+        return (
+            isinstance(error, TransportError) and error.status in self.retry_on_status
+        )
+
+    def _should_retry(self, retry, error):
+        """Returns True if the request that raised 'error' should be
+        retried. 'retry' is the number of times it's been retried already.
+        """
+        if retry >= self.max_retries:
+            return False
+        if self.retry_on_connection_error and isinstance(
+            error, (ConnectionError, ConnectionTimeout)
+        ):
+            return True
+        return self._is_throttled(error)
+
+    def _backoff(self, retry, error):
+        """Returns the number of seconds to wait before retrying"""
+        if self.respect_retry_after:
+            retry_after = _parse_retry_after(getattr(error, "headers", None))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff_factor * (2**retry))
+        )
+
+    def _sleep(self, retry, error):
+        time.sleep(self._backoff(retry, error))
+
+
+@contextlib.contextmanager
+def _count_throttled_retries():
+    """Counts the throttled responses retried by clients in the current
+    thread within the block. Yields a list holding the count.
+    """
+    counter = [0]
+    _throttled_retries.counter = counter
+    try:
+        yield counter
+    finally:
+        _throttled_retries.counter = None
+
+
+def _record_throttled_retry():
+    counter = getattr(_throttled_retries, "counter", None)
+    if counter is not None:
+        counter[0] += 1
+
+
+def _parse_retry_after(headers):
+    """Parses the 'Retry-After' header which is either
+    a number of seconds or an HTTP date.
+    """
+    if not headers:
+        return None
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        return None
+    return max(mktime_tz(parsed) - time.time(), 0.0)
@@ -16,10 +16,25 @@
 #  under the License.
 
 import datetime
+import decimal
+import math
 
 from elastic_transport import JSONSerializer as _JSONSerializer
 
-from ._utils import format_datetime
+from ._utils import format_datetime, string_types
+
+try:
+    import orjson
+except ImportError:  # pragma: nocover
+    orjson = None
+
+__all__ = ["DEFAULT_JSON_SERIALIZER", "JSONSerializer", "OrjsonSerializer"]
+
+# orjson decodes integers which don't fit in 64 bits as floats.
+# Those have at least 19 digits, runs of digits are found by
+# mapping every digit to '0' and every other byte to a space.
+_DIGITS_TABLE = bytes(bytearray(48 if 48 <= i <= 57 else 32 for i in range(256)))
+_LONG_NUMBER = b"0" * 19
 
 
 class JSONSerializer(_JSONSerializer):
@@ -33,3 +48,81 @@ class JSONSerializer(_JSONSerializer):
         if isinstance(data, datetime.datetime):
             return format_datetime(data)
         return super(JSONSerializer, self).default(data)
+
+    def dumps(self, data):
+        # Bodies which are already encoded, like the
+        # ones compressed by 'http_compress', are sent as-is.
+        if isinstance(data, bytes):
+            return data
+        return super(JSONSerializer, self).dumps(data)
+
+
+class OrjsonSerializer(JSONSerializer):
+    """Same as :class:`JSONSerializer` except uses the much faster
+    `orjson <https://github.com/ijl/orjson>`_ library to encode and decode
+    JSON. The JSON is equivalent to the output of :class:`JSONSerializer`,
+    anything orjson would encode or decode differently (``NaN`` and
+    ``Infinity``, integers larger than 64 bits, strings with lone
+    surrogates) falls back to the standard library. Only very large
+    and very small floats are written in a different notation for
+    the same value, like ``1e20`` instead of ``1e+20``.
+    """
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError(
+                "You must have 'orjson' installed to use OrjsonSerializer"
+            )
+        # Dates and datetimes are passed to .default() so
+        # they're formatted the same as by JSONSerializer.
+        self._options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def loads(self, s):
+        if not _has_long_number(s):
+            try:
+                return orjson.loads(s)
+            except (ValueError, TypeError):
+                # orjson rejects 'NaN' and 'Infinity' which the
+                # standard library decodes, let it decide.
+                pass
+        return super(OrjsonSerializer, self).loads(s)
+
+    def dumps(self, data):
+        if isinstance(data, (string_types, bytes)):
+            return data
+        try:
+            encoded = orjson.dumps(data, default=self.default, option=self._options)
+        except TypeError:
+            return super(OrjsonSerializer, self).dumps(data)
+        # orjson encodes 'NaN' and 'Infinity' as 'null' so the
+        # data is only searched for them when there's a 'null'.
+        if b"null" in encoded and _has_non_finite(data):
+            return super(OrjsonSerializer, self).dumps(data)
+        return encoded.decode("utf-8")
+
+
+def _has_long_number(s):
+    """Returns True if the JSON contains 19 or more digits in a row"""
+    if not isinstance(s, (bytes, bytearray)):
+        s = s.encode("utf-8", "surrogatepass")
+    return _LONG_NUMBER in s.translate(_DIGITS_TABLE)
+
+
+def _has_non_finite(data):
+    """Returns True if the data contains a NaN or infinite number"""
+    if isinstance(data, float):
+        return math.isnan(data) or math.isinf(data)
+    elif isinstance(data, decimal.Decimal):
+        return not data.is_finite()
+    elif isinstance(data, dict):
+        return any(
+            _has_non_finite(key) or _has_non_finite(value)
+            for key, value in data.items()
+        )
+    elif isinstance(data, (list, tuple)):
+        return any(_has_non_finite(value) for value in data)
+    return False
+
+
+# Use orjson for all JSON by default if it's installed.
+DEFAULT_JSON_SERIALIZER = OrjsonSerializer if orjson is not None else JSONSerializer
@@ -0,0 +1,100 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import threading
+
+from ._cache import _CACHED_ACTIONS, _copy_response, _engine_action, _response_meta
+
+__all__ = ["SingleFlight"]
+
+
+def _is_idempotent_read(method, path):
+    """Returns 'True' for requests which only read data. Searches use
+    'POST' to send a body but are coalesced along with 'GET' requests.
+    """
+    if method in ("GET", "HEAD"):
+        return True
+    elif method != "POST":
+        return False
+    engine_action = _engine_action(path)
+    if engine_action is not None:
+        return engine_action[1] in _CACHED_ACTIONS
+    return path.split("?", 1)[0] == "/api/ws/v1/search"
+
+
+def _is_copyable(response):
+    return isinstance(getattr(response, "body", None), (dict, list))
+
+
+class _Call(object):
+    __slots__ = ("event", "waiters", "response", "encoded", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.waiters = 0
+        self.response = None
+        self.encoded = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Shares a single in-flight request between every thread
+    making an identical request at the same time. Callers
+    waiting on another thread's request receive their own
+    copy of the response or the same raised exception.
+    """
+
+    def __init__(self, serializer):
+        self.serializer = serializer
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                call.waiters += 1
+                leader = False
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            if call.encoded is None:
+                return call.response
+            return _copy_response(
+                _response_meta(call.response), call.encoded, self.serializer
+            )
+
+        try:
+            call.response = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # No new waiters can join once the call is removed.
+            with self._lock:
+                del self._calls[key]
+            try:
+                if call.waiters and _is_copyable(call.response):
+                    call.encoded = self.serializer.dumps(call.response.body)
+            finally:
+                call.event.set()
+        return call.response
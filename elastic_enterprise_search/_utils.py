@@ -17,13 +17,27 @@
 
 import re
 import sys
-from datetime import date, datetime
+import time
+from datetime import date, datetime, timedelta  # noqa: F401
+
+try:
+    from functools import lru_cache
+except ImportError:  # Python 2.7
+    lru_cache = None
+
+try:
+    from datetime import timezone
+
+    _UTC = timezone.utc
+except ImportError:  # Python 2.7
+    # Never the tzinfo of a datetime, naive datetimes
+    # have a tzinfo of None and use the local timezone.
+    _UTC = object()
 
-from dateutil import parser, tz
 from elastic_transport import QueryParams  # noqa: F401
 from elastic_transport.compat import Mapping, quote, urlencode, urlparse
 from elastic_transport.utils import DEFAULT as DEFAULT
-from six import ensure_str
+from six import binary_type, ensure_str, text_type
 
 __all__ = [
     "DEFAULT",
@@ -31,7 +45,9 @@ __all__ = [
     "SKIP_IN_PATH",
     "default_params_encoder",
     "format_datetime",
+    "monotonic",
     "parse_datetime",
+    "quote_param",
     "string_types",
     "to_array",
     "to_deep_object",
@@ -54,6 +70,9 @@ try:
 except ImportError:
     typing = None
 
+# time.monotonic() isn't available on Python 2.7
+monotonic = getattr(time, "monotonic", time.time)
+
 
 def to_param(value):
     # type: (typing.Any) -> str
@@ -84,18 +103,52 @@ def to_param(value):
     return value
 
 
+def _quote_param(value):
+    # type: (typing.Any) -> str
+    # Don't percent encode these characters for nicer logs
+    return quote(to_param(value), ",*[]:-")
+
+
+# Paths and query strings are built from the same few engine names,
+# IDs, and page numbers over and over so the quoted values are cached.
+# Only types which can't compare equal to a value of another
+# type with a different encoding (like 1 and True) are cached.
+_CACHED_PARAM_TYPES = frozenset((text_type, binary_type, int))
+_CACHED_PATH_TYPES = _CACHED_PARAM_TYPES | frozenset((type(None),))
+
+
+def _to_path(parts):
+    # type: (typing.Tuple[typing.Any, ...]) -> str
+    return "/" + "/".join(
+        [quote_param(part) for part in parts if part not in SKIP_IN_PATH]
+    )
+
+
+if lru_cache is not None:
+    _quote_param_cached = lru_cache(maxsize=4096)(_quote_param)
+    _to_path_cached = lru_cache(maxsize=4096)(_to_path)
+else:  # pragma: nocover
+    _quote_param_cached = _quote_param
+    _to_path_cached = _to_path
+
+
+def quote_param(value):
+    # type: (typing.Any) -> str
+    """Escapes a value with 'to_param()' for use in a URL path or query string"""
+    if type(value) in _CACHED_PARAM_TYPES:
+        return _quote_param_cached(value)
+    return _quote_param(value)
+
+
 def to_path(*parts):
     # type: (typing.Any) -> str
     """
     Create a URL string from parts, omit all `None` values and empty strings.
     Convert lists and tuples to comma separated values.
     """
-    return "/" + "/".join(
-        # Don't percent encode these characters for nicer logs
-        quote(to_param(part), ",*[]:-")
-        for part in parts
-        if part not in SKIP_IN_PATH
-    )
+    if _CACHED_PATH_TYPES.issuperset(map(type, parts)):
+        return _to_path_cached(parts)
+    return _to_path(parts)
 
 
 def to_array(value, param=None):
@@ -134,22 +187,77 @@ def to_deep_object(param, value):
 def format_datetime(value):
     # type: (datetime) -> str
     """Format a datetime object to RFC 3339"""
-    # When given a timezone unaware datetime, use local timezone.
+    # Subclasses may override strftime() and years before 1000
+    # are formatted differently depending on the platform.
+    if type(value) is not datetime or value.year < 1000:
+        return _format_datetime_strftime(value)
+
+    tzinfo = value.tzinfo
+    if tzinfo is _UTC:
+        suffix = "Z"
+    else:
+        # When given a timezone unaware datetime, use local timezone.
+        if tzinfo is None:
+            value = value.replace(tzinfo=_local_timezone())
+        utcoffset = value.utcoffset()
+        try:
+            suffix = _TIMEZONE_SUFFIXES[utcoffset]
+        except KeyError:
+            suffix = _format_utcoffset(utcoffset)
+            if len(_TIMEZONE_SUFFIXES) < 1024:
+                _TIMEZONE_SUFFIXES[utcoffset] = suffix
+
+    return "%04d-%02d-%02dT%02d:%02d:%02d%s" % (
+        value.year,
+        value.month,
+        value.day,
+        value.hour,
+        value.minute,
+        value.second,
+        suffix,
+    )
+
+
+def _format_datetime_strftime(value):
+    # type: (datetime) -> str
+    """Format a datetime object to RFC 3339 with strftime(). This is
+    the reference implementation that format_datetime() must match.
+    """
     if value.tzinfo is None:
-        value = value.replace(tzinfo=tz.tzlocal())
+        value = value.replace(tzinfo=_local_timezone())
+    return value.strftime("%Y-%m-%dT%H:%M:%S") + _format_utcoffset(value.utcoffset())
 
-    utcoffset = value.utcoffset()
+
+def _format_utcoffset(utcoffset):
+    # type: (timedelta) -> str
     offset_secs = utcoffset.total_seconds()
     # Use 'Z' for UTC, otherwise use '[+-]XX:XX' for tz offset
     if offset_secs == 0:
-        timezone = "Z"
-    else:
-        offset_sign = "+" if offset_secs >= 0 else "-"
-        offset_secs = int(abs(offset_secs))
-        hours = offset_secs // 3600
-        minutes = (offset_secs % 3600) // 60
-        timezone = "{}{:02}:{:02}".format(offset_sign, hours, minutes)
-    return value.strftime("%Y-%m-%dT%H:%M:%S") + timezone
+        return "Z"
+    offset_sign = "+" if offset_secs >= 0 else "-"
+    offset_secs = int(abs(offset_secs))
+    hours = offset_secs // 3600
+    minutes = (offset_secs % 3600) // 60
+    return "{}{:02}:{:02}".format(offset_sign, hours, minutes)
+
+
+# Formatted '[+-]XX:XX' suffixes keyed by UTC offset.
+_TIMEZONE_SUFFIXES = {}
+_local_timezone_cache = []
+
+
+def _local_timezone():
+    """Returns a cached 'dateutil.tz.tzlocal()'. tzlocal() reads the
+    'time' module's timezone settings when created so a new one
+    is created if time.tzset() changed them.
+    """
+    key = (time.timezone, time.altzone, time.daylight, time.tzname)
+    if not _local_timezone_cache or _local_timezone_cache[0] != key:
+        # 'dateutil' is imported lazily to keep the package import fast.
+        from dateutil import tz
+
+        _local_timezone_cache[:] = [key, tz.tzlocal()]
+    return _local_timezone_cache[1]
 
 
 def parse_datetime(value):
@@ -163,6 +271,9 @@ def parse_datetime(value):
             "Datetime must match format '(YYYY)-(MM)-(DD)T(HH):(MM):(SS)(TZ)' was '%s'"
             % value
         )
+
+    from dateutil import parser
+
     return parser.isoparse(value)
 
 
@@ -175,9 +286,9 @@ def default_params_encoder(params):
     """
     to_encode = []
     for key, val in params.items():
-        key = quote(key, ",*[]:-")
+        key = quote_param(key)
         if val is not None:  # pass-through None values
-            val = quote(to_param(val), ",*[]:-")
+            val = quote_param(val)
         to_encode.append((key, val))
     return "&".join(
         ("%s=%s" % (key, val) if val is not None else key) for key, val in to_encode
@@ -15,7 +15,6 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
-import jwt
 from elastic_transport import QueryParams
 from six import ensure_str
 from six.moves.urllib_parse import urlencode
@@ -32,8 +31,88 @@ class AppSearch(_AppSearch):
     """Client for Elastic App Search service
 
     `<https://www.elastic.co/guide/en/app-search/current/api-reference.html>`_
+
+    :arg response_cache: :class:`~elastic_enterprise_search.ResponseCache`
+        to cache responses from :meth:`search`, :meth:`multi_search`,
+        and :meth:`query_suggestion` in. Disabled by default.
     """
 
+    def __init__(self, *args, **kwargs):
+        response_cache = kwargs.pop("response_cache", None)
+        super(AppSearch, self).__init__(*args, **kwargs)
+        self.response_cache = response_cache
+
+    def perform_request(
+        self,
+        method,
+        path,
+        headers=None,
+        params=None,
+        body=None,
+        http_auth=DEFAULT,
+        request_timeout=DEFAULT,
+        ignore_status=(),
+    ):
+        cache = self.response_cache
+        if cache is None:
+            return super(AppSearch, self).perform_request(
+                method,
+                path,
+                headers=headers,
+                params=params,
+                body=body,
+                http_auth=http_auth,
+                request_timeout=request_timeout,
+                ignore_status=ignore_status,
+            )
+
+        key, engine_name = cache._request_key(
+            self, method, path, params, body, headers, http_auth
+        )
+        if key is not None:
+            resp = cache._get(key, self.transport.serializer)
+            if resp is not None:
+                return resp
+        try:
+            resp = super(AppSearch, self).perform_request(
+                method,
+                path,
+                headers=headers,
+                params=params,
+                body=body,
+                http_auth=http_auth,
+                request_timeout=request_timeout,
+                ignore_status=ignore_status,
+            )
+        finally:
+            # Documents may have changed even if the request failed.
+            if key is None and engine_name is not None:
+                cache.invalidate(engine_name)
+        if key is not None:
+            cache._put(key, engine_name, resp, self.transport.serializer)
+        return resp
+
+    def index_documents(self, engine_name, documents, **kwargs):
+        """Create or update documents
+
+        `<https://www.elastic.co/guide/en/app-search/master/documents.html#documents-create>`_
+
+        :arg engine_name: Name of the engine
+        :arg documents: List of document to index. A ``pandas.DataFrame``
+            or a dict of field names to NumPy arrays or pandas Series is
+            encoded column by column with
+            :func:`~elastic_enterprise_search.helpers.encode_columns`
+        :arg kwargs: Additional arguments for the request, the same
+            as for other APIs like ``params`` and ``http_auth``
+        """
+        # Importing the helpers package loads every helper, so
+        # it's only done once a client method needs a helper.
+        from ..helpers._columnar import _is_columnar, encode_columns
+
+        if _is_columnar(documents):
+            documents = encode_columns(documents, serializer=self.transport.serializer)
+        return super(AppSearch, self).index_documents(engine_name, documents, **kwargs)
+
     @staticmethod
     def create_signed_search_key(
         api_key,
@@ -56,6 +135,9 @@ class AppSearch(_AppSearch):
         :arg facets: Sets the facets that are allowed.
             To disable aggregations set to '{}' or 'None'.
         """
+        # 'jwt' is only needed here so isn't imported with the client.
+        import jwt
+
         options = {
             k: v
             for k, v in (
@@ -69,6 +151,74 @@ class AppSearch(_AppSearch):
         }
         return ensure_str(jwt.encode(payload=options, key=api_key, algorithm="HS256"))
 
+    def iter_api_keys(self, page_size=None, prefetch=False, **kwargs):
+        """Iterates over every API key by lazily
+        requesting pages from :meth:`list_api_keys`
+
+        :arg page_size: The number of results per page
+        :arg prefetch: Request the next page in the background
+            while the current page is being processed
+        :arg kwargs: Additional arguments passed to :meth:`list_api_keys`
+        """
+        return _iter_results(self.list_api_keys, page_size, prefetch, **kwargs)
+
+    def iter_curations(self, engine_name, page_size=None, prefetch=False, **kwargs):
+        """Iterates over every curation in an engine by lazily
+        requesting pages from :meth:`list_curations`
+
+        :arg engine_name: Name of the engine
+        :arg page_size: The number of results per page
+        :arg prefetch: Request the next page in the background
+            while the current page is being processed
+        :arg kwargs: Additional arguments passed to :meth:`list_curations`
+        """
+        return _iter_results(
+            self.list_curations, page_size, prefetch, engine_name=engine_name, **kwargs
+        )
+
+    def iter_documents(self, engine_name, page_size=None, prefetch=False, **kwargs):
+        """Iterates over every document in an engine by lazily
+        requesting pages from :meth:`list_documents`
+
+        :arg engine_name: Name of the engine
+        :arg page_size: The number of results per page
+        :arg prefetch: Request the next page in the background
+            while the current page is being processed
+        :arg kwargs: Additional arguments passed to :meth:`list_documents`
+        """
+        return _iter_results(
+            self.list_documents, page_size, prefetch, engine_name=engine_name, **kwargs
+        )
+
+    def iter_engines(self, page_size=None, prefetch=False, **kwargs):
+        """Iterates over every engine by lazily
+        requesting pages from :meth:`list_engines`
+
+        :arg page_size: The number of results per page
+        :arg prefetch: Request the next page in the background
+            while the current page is being processed
+        :arg kwargs: Additional arguments passed to :meth:`list_engines`
+        """
+        return _iter_results(self.list_engines, page_size, prefetch, **kwargs)
+
+    def iter_synonym_sets(self, engine_name, page_size=None, prefetch=False, **kwargs):
+        """Iterates over every synonym set in an engine by lazily
+        requesting pages from :meth:`list_synonym_sets`
+
+        :arg engine_name: Name of the engine
+        :arg page_size: The number of results per page
+        :arg prefetch: Request the next page in the background
+            while the current page is being processed
+        :arg kwargs: Additional arguments passed to :meth:`list_synonym_sets`
+        """
+        return _iter_results(
+            self.list_synonym_sets,
+            page_size,
+            prefetch,
+            engine_name=engine_name,
+            **kwargs
+        )
+
 
 class WorkplaceSearch(_WorkplaceSearch):
     """Client for Workplace Search
@@ -122,37 +272,9 @@ class WorkplaceSearch(_WorkplaceSearch):
         :returns: The HTTP response containing the access_token and refresh_token
             along with other token-related metadata
         """
-        values = [client_id, client_secret, redirect_uri]
-
-        # Check that 'code' and 'refresh_token' are mutually exclusive
-        if code is None and refresh_token is None:
-            raise ValueError(
-                "Either the 'code' or 'refresh_token' parameter must be used"
-            )
-        elif code is not None and refresh_token is not None:
-            raise ValueError(
-                "'code' and 'refresh_token' parameters are mutually exclusive"
-            )
-        elif code is not None:
-            values.append(code)
-            grant_type = "authorization_code"
-        else:
-            assert refresh_token is not None
-            values.append(refresh_token)
-            grant_type = "refresh_token"
-
-        if not all(isinstance(value, str) for value in values):
-            raise TypeError("All parameters must be of type 'str'")
-
-        params = QueryParams()
-        params.add("grant_type", grant_type)
-        params.add("client_id", client_id)
-        params.add("client_secret", client_secret)
-        params.add("redirect_uri", redirect_uri)
-        if code is not None:
-            params.add("code", code)
-        else:
-            params.add("refresh_token", refresh_token)
+        params = _oauth_exchange_params(
+            client_id, client_secret, redirect_uri, code, refresh_token
+        )
 
         return self.perform_request(
             method="POST",
@@ -163,6 +285,102 @@ class WorkplaceSearch(_WorkplaceSearch):
             http_auth=None,
         )
 
+    def iter_content_sources(self, page_size=None, prefetch=False, **kwargs):
+        """Iterates over every content source by lazily
+        requesting pages from :meth:`list_content_sources`
+
+        :arg page_size: The number of results per page
+        :arg prefetch: Request the next page in the background
+            while the current page is being processed
+        :arg kwargs: Additional arguments passed to :meth:`list_content_sources`
+        """
+        return _iter_results(self.list_content_sources, page_size, prefetch, **kwargs)
+
+    def iter_external_identities(
+        self, content_source_id, page_size=None, prefetch=False, **kwargs
+    ):
+        """Iterates over every external identity of a content source by lazily
+        requesting pages from :meth:`list_external_identities`
+
+        :arg content_source_id: Unique ID for a Custom API source, provided upon
+            creation of a Custom API Source
+        :arg page_size: The number of results per page
+        :arg prefetch: Request the next page in the background
+            while the current page is being processed
+        :arg kwargs: Additional arguments passed to :meth:`list_external_identities`
+        """
+        return _iter_results(
+            self.list_external_identities,
+            page_size,
+            prefetch,
+            content_source_id=content_source_id,
+            **kwargs
+        )
+
+    def iter_permissions(
+        self, content_source_id, page_size=None, prefetch=False, **kwargs
+    ):
+        """Iterates over every user permission of a content source by lazily
+        requesting pages from :meth:`list_permissions`
+
+        :arg content_source_id: Unique ID for a Custom API source, provided upon
+            creation of a Custom API Source
+        :arg page_size: The number of results per page
+        :arg prefetch: Request the next page in the background
+            while the current page is being processed
+        :arg kwargs: Additional arguments passed to :meth:`list_permissions`
+        """
+        return _iter_results(
+            self.list_permissions,
+            page_size,
+            prefetch,
+            content_source_id=content_source_id,
+            **kwargs
+        )
+
+
+def _iter_results(list_api, page_size, prefetch, **kwargs):
+    """Yields every result from every page of a paginated list API"""
+    from ..helpers._pagination import iter_pages
+
+    for page in iter_pages(list_api, page_size=page_size, prefetch=prefetch, **kwargs):
+        for result in page["results"]:
+            yield result
+
+
+def _oauth_exchange_params(client_id, client_secret, redirect_uri, code, refresh_token):
+    """Validates the parameters for exchanging an authorization code or
+    refresh token for an access token and builds the query parameters.
+    """
+    values = [client_id, client_secret, redirect_uri]
+
+    # Check that 'code' and 'refresh_token' are mutually exclusive
+    if code is None and refresh_token is None:
+        raise ValueError("Either the 'code' or 'refresh_token' parameter must be used")
+    elif code is not None and refresh_token is not None:
+        raise ValueError("'code' and 'refresh_token' parameters are mutually exclusive")
+    elif code is not None:
+        values.append(code)
+        grant_type = "authorization_code"
+    else:
+        assert refresh_token is not None
+        values.append(refresh_token)
+        grant_type = "refresh_token"
+
+    if not all(isinstance(value, str) for value in values):
+        raise TypeError("All parameters must be of type 'str'")
+
+    params = QueryParams()
+    params.add("grant_type", grant_type)
+    params.add("client_id", client_id)
+    params.add("client_secret", client_secret)
+    params.add("redirect_uri", redirect_uri)
+    if code is not None:
+        params.add("code", code)
+    else:
+        params.add("refresh_token", refresh_token)
+    return params
+
 
 class EnterpriseSearch(_EnterpriseSearch):
     """Client for Enterprise Search
@@ -189,5 +407,15 @@ class EnterpriseSearch(_EnterpriseSearch):
             hosts=hosts, transport_class=transport_class, **kwargs
         )
 
-        self.app_search = AppSearch(_transport=self.transport)
-        self.workplace_search = WorkplaceSearch(_transport=self.transport)
+        self.app_search = AppSearch(
+            _transport=self.transport,
+            coalesce_requests=self._single_flight is not None,
+            retry_policy=self.retry_policy,
+            http_compress=self._compress_min_size,
+        )
+        self.workplace_search = WorkplaceSearch(
+            _transport=self.transport,
+            coalesce_requests=self._single_flight is not None,
+            retry_policy=self.retry_policy,
+            http_compress=self._compress_min_size,
+        )
@@ -20,6 +20,7 @@ from elastic_transport import QueryParams
 from .._utils import (  # noqa: F401
     DEFAULT,
     SKIP_IN_PATH,
+    quote_param,
     to_array,
     to_deep_object,
     to_path,
@@ -51,13 +52,11 @@ class AppSearch(BaseClient):
         :arg ignore_status: HTTP status codes to not raise an error
         """
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
             "/api/as/v1/credentials",
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -89,18 +88,10 @@ class AppSearch(BaseClient):
         if api_key_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "DELETE",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "credentials",
-                api_key_name,
-            ),
-            params=params,
+            "/api/as/v1/credentials/%s" % quote_param(api_key_name),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -132,18 +123,10 @@ class AppSearch(BaseClient):
         if api_key_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "credentials",
-                api_key_name,
-            ),
-            params=params,
+            "/api/as/v1/credentials/%s" % quote_param(api_key_name),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -177,19 +160,11 @@ class AppSearch(BaseClient):
         if api_key_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "PUT",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "credentials",
-                api_key_name,
-            ),
+            "/api/as/v1/credentials/%s" % quote_param(api_key_name),
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -307,15 +282,7 @@ class AppSearch(BaseClient):
 
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "logs",
-                "api",
-            ),
+            "/api/as/v1/engines/%s/logs/api" % quote_param(engine_name),
             params=params,
             headers=headers,
             http_auth=http_auth,
@@ -362,15 +329,7 @@ class AppSearch(BaseClient):
 
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "analytics",
-                "counts",
-            ),
+            "/api/as/v1/engines/%s/analytics/counts" % quote_param(engine_name),
             params=params,
             headers=headers,
             http_auth=http_auth,
@@ -426,14 +385,7 @@ class AppSearch(BaseClient):
 
         return self.perform_request(
             "POST",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "curations",
-            ),
+            "/api/as/v1/engines/%s/curations" % quote_param(engine_name),
             params=params,
             headers=headers,
             http_auth=http_auth,
@@ -472,20 +424,11 @@ class AppSearch(BaseClient):
             if param in SKIP_IN_PATH:
                 raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "DELETE",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "curations",
-                curation_id,
-            ),
-            params=params,
+            "/api/as/v1/engines/%s/curations/%s"
+            % (quote_param(engine_name), quote_param(curation_id)),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -523,20 +466,11 @@ class AppSearch(BaseClient):
             if param in SKIP_IN_PATH:
                 raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "curations",
-                curation_id,
-            ),
-            params=params,
+            "/api/as/v1/engines/%s/curations/%s"
+            % (quote_param(engine_name), quote_param(curation_id)),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -594,15 +528,8 @@ class AppSearch(BaseClient):
 
         return self.perform_request(
             "PUT",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "curations",
-                curation_id,
-            ),
+            "/api/as/v1/engines/%s/curations/%s"
+            % (quote_param(engine_name), quote_param(curation_id)),
             params=params,
             headers=headers,
             http_auth=http_auth,
@@ -647,14 +574,7 @@ class AppSearch(BaseClient):
 
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "curations",
-            ),
+            "/api/as/v1/engines/%s/curations" % quote_param(engine_name),
             params=params,
             headers=headers,
             http_auth=http_auth,
@@ -689,20 +609,11 @@ class AppSearch(BaseClient):
         if engine_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "DELETE",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "documents",
-            ),
+            "/api/as/v1/engines/%s/documents" % quote_param(engine_name),
             body=document_ids,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -736,20 +647,11 @@ class AppSearch(BaseClient):
         if engine_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "documents",
-            ),
+            "/api/as/v1/engines/%s/documents" % quote_param(engine_name),
             body=document_ids,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -783,20 +685,11 @@ class AppSearch(BaseClient):
         if engine_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "documents",
-            ),
+            "/api/as/v1/engines/%s/documents" % quote_param(engine_name),
             body=documents,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -840,15 +733,7 @@ class AppSearch(BaseClient):
 
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "documents",
-                "list",
-            ),
+            "/api/as/v1/engines/%s/documents/list" % quote_param(engine_name),
             params=params,
             headers=headers,
             http_auth=http_auth,
@@ -883,20 +768,11 @@ class AppSearch(BaseClient):
         if engine_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "PATCH",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "documents",
-            ),
+            "/api/as/v1/engines/%s/documents" % quote_param(engine_name),
             body=documents,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -980,18 +856,10 @@ class AppSearch(BaseClient):
         if engine_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "DELETE",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-            ),
-            params=params,
+            "/api/as/v1/engines/%s" % quote_param(engine_name),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1023,18 +891,10 @@ class AppSearch(BaseClient):
         if engine_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-            ),
-            params=params,
+            "/api/as/v1/engines/%s" % quote_param(engine_name),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1135,14 +995,7 @@ class AppSearch(BaseClient):
 
         return self.perform_request(
             "POST",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "click",
-            ),
+            "/api/as/v1/engines/%s/click" % quote_param(engine_name),
             params=params,
             headers=headers,
             http_auth=http_auth,
@@ -1177,20 +1030,11 @@ class AppSearch(BaseClient):
         if engine_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "source_engines",
-            ),
+            "/api/as/v1/engines/%s/source_engines" % quote_param(engine_name),
             body=source_engines,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1224,20 +1068,11 @@ class AppSearch(BaseClient):
         if engine_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "DELETE",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "source_engines",
-            ),
+            "/api/as/v1/engines/%s/source_engines" % quote_param(engine_name),
             body=source_engines,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1271,20 +1106,11 @@ class AppSearch(BaseClient):
         if engine_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "multi_search",
-            ),
+            "/api/as/v1/engines/%s/multi_search" % quote_param(engine_name),
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1339,14 +1165,7 @@ class AppSearch(BaseClient):
 
         return self.perform_request(
             "POST",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "query_suggestion",
-            ),
+            "/api/as/v1/engines/%s/query_suggestion" % quote_param(engine_name),
             params=params,
             headers=headers,
             http_auth=http_auth,
@@ -1379,19 +1198,10 @@ class AppSearch(BaseClient):
         if engine_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "schema",
-            ),
-            params=params,
+            "/api/as/v1/engines/%s/schema" % quote_param(engine_name),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1425,20 +1235,11 @@ class AppSearch(BaseClient):
         if engine_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "schema",
-            ),
+            "/api/as/v1/engines/%s/schema" % quote_param(engine_name),
             body=schema,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1472,20 +1273,11 @@ class AppSearch(BaseClient):
         if engine_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "search",
-            ),
+            "/api/as/v1/engines/%s/search" % quote_param(engine_name),
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1517,19 +1309,10 @@ class AppSearch(BaseClient):
         if engine_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "search_settings",
-            ),
-            params=params,
+            "/api/as/v1/engines/%s/search_settings" % quote_param(engine_name),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1563,20 +1346,11 @@ class AppSearch(BaseClient):
         if engine_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "PUT",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "search_settings",
-            ),
+            "/api/as/v1/engines/%s/search_settings" % quote_param(engine_name),
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1608,20 +1382,10 @@ class AppSearch(BaseClient):
         if engine_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "search_settings",
-                "reset",
-            ),
-            params=params,
+            "/api/as/v1/engines/%s/search_settings/reset" % quote_param(engine_name),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1655,20 +1419,11 @@ class AppSearch(BaseClient):
         if engine_name in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "synonyms",
-            ),
+            "/api/as/v1/engines/%s/synonyms" % quote_param(engine_name),
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1706,20 +1461,11 @@ class AppSearch(BaseClient):
             if param in SKIP_IN_PATH:
                 raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "DELETE",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "synonyms",
-                synonym_set_id,
-            ),
-            params=params,
+            "/api/as/v1/engines/%s/synonyms/%s"
+            % (quote_param(engine_name), quote_param(synonym_set_id)),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1757,20 +1503,11 @@ class AppSearch(BaseClient):
             if param in SKIP_IN_PATH:
                 raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "synonyms",
-                synonym_set_id,
-            ),
-            params=params,
+            "/api/as/v1/engines/%s/synonyms/%s"
+            % (quote_param(engine_name), quote_param(synonym_set_id)),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1810,21 +1547,12 @@ class AppSearch(BaseClient):
             if param in SKIP_IN_PATH:
                 raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "PUT",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "synonyms",
-                synonym_set_id,
-            ),
+            "/api/as/v1/engines/%s/synonyms/%s"
+            % (quote_param(engine_name), quote_param(synonym_set_id)),
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1868,14 +1596,7 @@ class AppSearch(BaseClient):
 
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "synonyms",
-            ),
+            "/api/as/v1/engines/%s/synonyms" % quote_param(engine_name),
             params=params,
             headers=headers,
             http_auth=http_auth,
@@ -1929,15 +1650,7 @@ class AppSearch(BaseClient):
 
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "analytics",
-                "clicks",
-            ),
+            "/api/as/v1/engines/%s/analytics/clicks" % quote_param(engine_name),
             params=params,
             headers=headers,
             http_auth=http_auth,
@@ -1987,15 +1700,7 @@ class AppSearch(BaseClient):
 
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "as",
-                "v1",
-                "engines",
-                engine_name,
-                "analytics",
-                "queries",
-            ),
+            "/api/as/v1/engines/%s/analytics/queries" % quote_param(engine_name),
             params=params,
             headers=headers,
             http_auth=http_auth,
@@ -16,8 +16,9 @@
 #  under the License.
 
 import base64
+import functools
 
-from elastic_transport import Transport
+from elastic_transport import Transport, TransportError
 from elastic_transport.utils import (
     client_meta_version,
     create_user_agent,
@@ -25,7 +26,12 @@ from elastic_transport.utils import (
 )
 from six import ensure_binary, ensure_str, ensure_text
 
-from .._serializer import JSONSerializer
+from .._cache import _request_key
+from .._compress import _compress_min_size, _encode_body, _gzip_compress
+from .._http_urllib3 import Urllib3HttpConnection
+from .._retry import _record_throttled_retry
+from .._serializer import DEFAULT_JSON_SERIALIZER, JSONSerializer
+from .._singleflight import SingleFlight, _is_idempotent_read
 from .._utils import DEFAULT, default_params_encoder
 from .._version import __version__
 
@@ -33,12 +39,17 @@ __all__ = ["BaseClient"]
 
 
 class BaseClient(object):
+    _single_flight_class = SingleFlight
+
     def __init__(
         self,
         hosts=None,
         http_auth=None,
         transport_class=None,
         meta_header=None,
+        coalesce_requests=False,
+        retry_policy=None,
+        http_compress=False,
         _transport=None,
         **kwargs
     ):
@@ -64,10 +75,27 @@ class BaseClient(object):
             kwargs["params_encoder"] = default_params_encoder
 
             # Override the default JSON serializer with one
-            # that handles datetimes wrt. RFC 3339
-            kwargs.setdefault("serializers", {"application/json": JSONSerializer()})
+            # that handles datetimes wrt. RFC 3339 and uses
+            # orjson for speed when it's available.
+            kwargs.setdefault(
+                "serializers", {"application/json": DEFAULT_JSON_SERIALIZER()}
+            )
+
+            # Connections which can be prewarmed, reaped
+            # when idle, and report how their pool is used.
+            if transport_class is None:
+                kwargs.setdefault("connection_class", Urllib3HttpConnection)
             self.transport = (transport_class or Transport)(hosts, **kwargs)
 
+            # The Transport retries some statuses immediately on its own,
+            # leave the statuses of 'retry_policy' to be retried with backoff.
+            if retry_policy is not None and "retry_on_status" not in kwargs:
+                self.transport.retry_on_status = tuple(
+                    status
+                    for status in self.transport.retry_on_status
+                    if status not in retry_policy.retry_on_status
+                )
+
         if meta_header is None:
             meta_header = True
 
@@ -77,19 +105,57 @@ class BaseClient(object):
         self._client_meta = (
             ("ent", client_meta_version(__version__)),
         ) + self.transport.transport_client_meta
-        self.meta_header = meta_header
+        self._client_meta_header = ",".join(
+            "%s=%s" % (k, v) for k, v in self._client_meta
+        )
 
         # Clients hold on to their own 'Authorization' HTTP header
         # because Enterprise, Workplace, and App Search all have
         # their own authentication schemes and can be authenticated
         # separately while sharing a Transport layer.
         self._authorization_header = None
+        self.meta_header = meta_header
         if http_auth is not None:
             self.http_auth = http_auth
 
+        # Identical concurrent read requests share a single
+        # in-flight request when 'coalesce_requests' is set.
+        self._single_flight = None
+        if coalesce_requests:
+            self._single_flight = self._single_flight_class(self.transport.serializer)
+
+        # Requests rejected because the server is overloaded
+        # are retried with backoff when 'retry_policy' is set.
+        self.retry_policy = retry_policy
+
+        # Large request bodies are sent compressed and reads ask
+        # for compressed responses when 'http_compress' is set.
+        self._compress_min_size = _compress_min_size(http_compress)
+        if self._compress_min_size is not None and not isinstance(
+            self.transport.serializer, JSONSerializer
+        ):
+            raise ValueError(
+                "'http_compress' requires the client's JSONSerializer or OrjsonSerializer"
+            )
+
     def close(self):
         self.transport.close()
 
+    def pool_stats(self):
+        """Returns the :class:`~elastic_enterprise_search.PoolStats` of
+        the connections to each host keyed by the host's URL. Only
+        connection classes which measure their pool are included.
+        """
+        connection_pool = self.transport.connection_pool
+        connections = getattr(
+            connection_pool, "orig_connections", connection_pool.connections
+        )
+        return {
+            connection.base_url: connection.pool_stats()
+            for connection in connections
+            if hasattr(connection, "pool_stats")
+        }
+
     @property
     def http_auth(self):
         auth_header = self._authorization_header
@@ -108,6 +174,7 @@ class BaseClient(object):
     @http_auth.setter
     def http_auth(self, http_auth):
         self._authorization_header = self._parse_http_auth(http_auth)
+        self._build_base_headers()
 
     @property
     def meta_header(self):
@@ -118,6 +185,18 @@ class BaseClient(object):
         if not isinstance(meta_header, bool):
             raise TypeError("meta_header must be of type bool")
         self._meta_header = meta_header
+        self._build_base_headers()
+
+    def _build_base_headers(self):
+        """Builds the HTTP headers sent with every request from this
+        client. Must be called whenever an input to the headers changes.
+        """
+        headers = {"user-agent": self._user_agent_header}
+        if self._meta_header:
+            headers["x-elastic-client-meta"] = self._client_meta_header
+        if self._authorization_header is not None:
+            headers["authorization"] = self._authorization_header
+        self._base_headers = headers
 
     @staticmethod
     def _parse_http_auth(http_auth):
@@ -159,30 +238,48 @@ class BaseClient(object):
         """Adds client authentication to request headers
         before handing it to the Transport layer.
         """
-        headers = normalize_headers(headers)
-        headers.setdefault("user-agent", self._user_agent_header)
+        headers = self._prepare_headers(headers, params, http_auth)
+        if self._compress_min_size is not None:
+            headers, body = self._compress_request(method, path, headers, body)
 
-        # Remove additional client meta from params
-        # on the '__elastic_client_meta' parameter and create
-        # the 'x-elastic-client-meta' HTTP header if
-        # meta_header is set to True.
-        if params:
-            client_meta = tuple(params.pop("__elastic_client_meta", ()))
-        else:
-            client_meta = ()
-        if self.meta_header:
-            client_meta = self._client_meta + client_meta
-            headers["x-elastic-client-meta"] = ",".join(
-                "%s=%s" % (k, v) for k, v in client_meta
+        retry_policy = self.retry_policy
+        if retry_policy is None:
+            return self._perform_request(
+                method, path, headers, params, body, request_timeout, ignore_status
             )
 
-        if self._authorization_header is not None or http_auth is not DEFAULT:
-            if http_auth is not DEFAULT:
-                auth_header = self._parse_http_auth(http_auth)
-            else:
-                auth_header = self._authorization_header
-            if auth_header is not None:
-                headers.setdefault("authorization", auth_header)
+        retry = 0
+        while True:
+            try:
+                return self._perform_request(
+                    method, path, headers, params, body, request_timeout, ignore_status
+                )
+            except TransportError as e:
+                if not retry_policy._should_retry(retry, e):
+                    raise
+                if retry_policy._is_throttled(e):
+                    _record_throttled_retry()
+                retry_policy._sleep(retry, e)
+                retry += 1
+
+    def _perform_request(
+        self, method, path, headers, params, body, request_timeout, ignore_status
+    ):
+        if self._single_flight is not None and _is_idempotent_read(method, path):
+            key = _request_key(method, path, params, body, headers)
+            return self._single_flight.do(
+                (key, repr(request_timeout), repr(ignore_status)),
+                functools.partial(
+                    self.transport.perform_request,
+                    method,
+                    path,
+                    headers=headers,
+                    params=params,
+                    body=body,
+                    request_timeout=request_timeout,
+                    ignore_status=ignore_status,
+                ),
+            )
 
         return self.transport.perform_request(
             method,
@@ -194,6 +291,70 @@ class BaseClient(object):
             ignore_status=ignore_status,
         )
 
+    def _prepare_headers(self, headers, params, http_auth):
+        """Builds the HTTP headers for a request including
+        the 'User-Agent', 'X-Elastic-Client-Meta' and
+        'Authorization' headers for this client.
+
+        The returned headers must not be modified as they
+        may be shared between requests.
+        """
+        # Remove additional client meta from params
+        # on the '__elastic_client_meta' parameter.
+        if params:
+            client_meta = tuple(params.pop("__elastic_client_meta", ()))
+        else:
+            client_meta = ()
+
+        # Most requests only need this client's headers
+        # so they can be used as-is without copying.
+        if not headers and not client_meta and http_auth is DEFAULT:
+            return self._base_headers
+
+        request_headers = self._base_headers.copy()
+        if headers:
+            headers = normalize_headers(headers)
+            request_headers.update(headers)
+        if self._meta_header:
+            request_headers["x-elastic-client-meta"] = (
+                ",".join(
+                    [self._client_meta_header]
+                    + ["%s=%s" % (k, v) for k, v in client_meta]
+                )
+                if client_meta
+                else self._client_meta_header
+            )
+        if http_auth is not DEFAULT and not (headers and "authorization" in headers):
+            auth_header = self._parse_http_auth(http_auth)
+            if auth_header is None:
+                request_headers.pop("authorization", None)
+            else:
+                request_headers["authorization"] = auth_header
+
+        return request_headers
+
+    def _compress_request(self, method, path, headers, body):
+        """Compresses the request body with gzip if it's at least
+        'http_compress' bytes once serialized and asks for a compressed
+        response to reads like searches and lists, which can be large.
+        Returns new headers instead of modifying 'headers'.
+        """
+        compress_body = False
+        if body is not None:
+            body = _encode_body(self.transport.serializer, body)
+            compress_body = len(body) >= self._compress_min_size
+        accept_gzip = _is_idempotent_read(method, path)
+        if not compress_body and not accept_gzip:
+            return headers, body
+
+        headers = headers.copy()
+        if compress_body:
+            body = _gzip_compress(body)
+            headers["content-encoding"] = "gzip"
+        if accept_gzip:
+            headers["accept-encoding"] = "gzip"
+        return headers, body
+
     def __enter__(self):
         return self
 
@@ -20,6 +20,7 @@ from elastic_transport import QueryParams
 from .._utils import (  # noqa: F401
     DEFAULT,
     SKIP_IN_PATH,
+    quote_param,
     to_array,
     to_deep_object,
     to_path,
@@ -51,12 +52,10 @@ class EnterpriseSearch(BaseClient):
         :raises elastic_enterprise_search.UnauthorizedError:
         """
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "GET",
             "/api/ent/v1/internal/health",
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -85,12 +84,10 @@ class EnterpriseSearch(BaseClient):
         :raises elastic_enterprise_search.UnauthorizedError:
         """
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "GET",
             "/api/ent/v1/internal/read_only_mode",
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -121,13 +118,11 @@ class EnterpriseSearch(BaseClient):
         :raises elastic_enterprise_search.UnauthorizedError:
         """
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "PUT",
             "/api/ent/v1/internal/read_only_mode",
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -195,12 +190,10 @@ class EnterpriseSearch(BaseClient):
         :raises elastic_enterprise_search.UnauthorizedError:
         """
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "GET",
             "/api/ent/v1/internal/version",
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -20,6 +20,7 @@ from elastic_transport import QueryParams
 from .._utils import (  # noqa: F401
     DEFAULT,
     SKIP_IN_PATH,
+    quote_param,
     to_array,
     to_deep_object,
     to_path,
@@ -53,13 +54,11 @@ class WorkplaceSearch(BaseClient):
         :raises elastic_enterprise_search.UnauthorizedError:
         """
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
             "/api/ws/v1/analytics/event",
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -91,13 +90,11 @@ class WorkplaceSearch(BaseClient):
         :raises elastic_enterprise_search.UnauthorizedError:
         """
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
             "/api/ws/v1/synonyms",
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -144,15 +141,7 @@ class WorkplaceSearch(BaseClient):
 
         return self.perform_request(
             "POST",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-                "sync",
-                "jobs",
-            ),
+            "/api/ws/v1/sources/%s/sync/jobs" % quote_param(content_source_id),
             body=body,
             params=params,
             headers=headers,
@@ -187,13 +176,11 @@ class WorkplaceSearch(BaseClient):
         :raises elastic_enterprise_search.NotFoundError:
         """
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
             "/api/ws/v1/sources",
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -229,18 +216,10 @@ class WorkplaceSearch(BaseClient):
         if content_source_id in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "DELETE",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-            ),
-            params=params,
+            "/api/ws/v1/sources/%s" % quote_param(content_source_id),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -275,18 +254,10 @@ class WorkplaceSearch(BaseClient):
         if content_source_id in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-            ),
-            params=params,
+            "/api/ws/v1/sources/%s" % quote_param(content_source_id),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -324,19 +295,11 @@ class WorkplaceSearch(BaseClient):
         if content_source_id in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "PUT",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-            ),
+            "/api/ws/v1/sources/%s" % quote_param(content_source_id),
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -461,20 +424,11 @@ class WorkplaceSearch(BaseClient):
             if param in SKIP_IN_PATH:
                 raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-                "documents",
-                document_id,
-            ),
-            params=params,
+            "/api/ws/v1/sources/%s/documents/%s"
+            % (quote_param(content_source_id), quote_param(document_id)),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -513,21 +467,12 @@ class WorkplaceSearch(BaseClient):
         if content_source_id in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-                "documents",
-                "bulk_destroy",
-            ),
+            "/api/ws/v1/sources/%s/documents/bulk_destroy"
+            % quote_param(content_source_id),
             body=document_ids,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -562,19 +507,10 @@ class WorkplaceSearch(BaseClient):
         if content_source_id in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "DELETE",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-                "documents",
-            ),
-            params=params,
+            "/api/ws/v1/sources/%s/documents" % quote_param(content_source_id),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -614,21 +550,12 @@ class WorkplaceSearch(BaseClient):
         if content_source_id in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-                "documents",
-                "bulk_create",
-            ),
+            "/api/ws/v1/sources/%s/documents/bulk_create"
+            % quote_param(content_source_id),
             body=documents,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -675,14 +602,8 @@ class WorkplaceSearch(BaseClient):
 
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-                "external_identities",
-            ),
+            "/api/ws/v1/sources/%s/external_identities"
+            % quote_param(content_source_id),
             params=params,
             headers=headers,
             http_auth=http_auth,
@@ -721,20 +642,12 @@ class WorkplaceSearch(BaseClient):
         if content_source_id in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-                "external_identities",
-            ),
+            "/api/ws/v1/sources/%s/external_identities"
+            % quote_param(content_source_id),
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -775,20 +688,11 @@ class WorkplaceSearch(BaseClient):
             if param in SKIP_IN_PATH:
                 raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "DELETE",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-                "external_identities",
-                user,
-            ),
-            params=params,
+            "/api/ws/v1/sources/%s/external_identities/%s"
+            % (quote_param(content_source_id), quote_param(user)),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -829,20 +733,11 @@ class WorkplaceSearch(BaseClient):
             if param in SKIP_IN_PATH:
                 raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-                "external_identities",
-                user,
-            ),
-            params=params,
+            "/api/ws/v1/sources/%s/external_identities/%s"
+            % (quote_param(content_source_id), quote_param(user)),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -886,21 +781,12 @@ class WorkplaceSearch(BaseClient):
             if param in SKIP_IN_PATH:
                 raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "PUT",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-                "external_identities",
-                user,
-            ),
+            "/api/ws/v1/sources/%s/external_identities/%s"
+            % (quote_param(content_source_id), quote_param(user)),
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -949,14 +835,7 @@ class WorkplaceSearch(BaseClient):
 
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-                "permissions",
-            ),
+            "/api/ws/v1/sources/%s/permissions" % quote_param(content_source_id),
             params=params,
             headers=headers,
             http_auth=http_auth,
@@ -1002,22 +881,12 @@ class WorkplaceSearch(BaseClient):
             if param in SKIP_IN_PATH:
                 raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-                "permissions",
-                user,
-                "remove",
-            ),
+            "/api/ws/v1/sources/%s/permissions/%s/remove"
+            % (quote_param(content_source_id), quote_param(user)),
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1049,13 +918,11 @@ class WorkplaceSearch(BaseClient):
         :raises elastic_enterprise_search.UnauthorizedError:
         """
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
             "/api/ws/v1/search",
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1090,18 +957,10 @@ class WorkplaceSearch(BaseClient):
         if synonym_set_id in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "DELETE",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "synonyms",
-                synonym_set_id,
-            ),
-            params=params,
+            "/api/ws/v1/synonyms/%s" % quote_param(synonym_set_id),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1136,18 +995,10 @@ class WorkplaceSearch(BaseClient):
         if synonym_set_id in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "synonyms",
-                synonym_set_id,
-            ),
-            params=params,
+            "/api/ws/v1/synonyms/%s" % quote_param(synonym_set_id),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1185,19 +1036,11 @@ class WorkplaceSearch(BaseClient):
         if synonym_set_id in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "PUT",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "synonyms",
-                synonym_set_id,
-            ),
+            "/api/ws/v1/synonyms/%s" % quote_param(synonym_set_id),
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1229,13 +1072,11 @@ class WorkplaceSearch(BaseClient):
         :raises elastic_enterprise_search.UnauthorizedError:
         """
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "GET",
             "/api/ws/v1/synonyms",
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1280,22 +1121,12 @@ class WorkplaceSearch(BaseClient):
             if param in SKIP_IN_PATH:
                 raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "POST",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-                "permissions",
-                user,
-                "add",
-            ),
+            "/api/ws/v1/sources/%s/permissions/%s/add"
+            % (quote_param(content_source_id), quote_param(user)),
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1337,20 +1168,11 @@ class WorkplaceSearch(BaseClient):
             if param in SKIP_IN_PATH:
                 raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "GET",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-                "permissions",
-                user,
-            ),
-            params=params,
+            "/api/ws/v1/sources/%s/permissions/%s"
+            % (quote_param(content_source_id), quote_param(user)),
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -1395,21 +1217,12 @@ class WorkplaceSearch(BaseClient):
             if param in SKIP_IN_PATH:
                 raise ValueError("Empty value passed for a required argument")
 
-        params = QueryParams(params)
-
         return self.perform_request(
             "PUT",
-            to_path(
-                "api",
-                "ws",
-                "v1",
-                "sources",
-                content_source_id,
-                "permissions",
-                user,
-            ),
+            "/api/ws/v1/sources/%s/permissions/%s"
+            % (quote_param(content_source_id), quote_param(user)),
             body=body,
-            params=params,
+            params=QueryParams(params) if params else None,
             headers=headers,
             http_auth=http_auth,
             request_timeout=request_timeout,
@@ -0,0 +1,60 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+
+"""Helpers for common workflows built on top of the API clients"""
+
+from ._api_logs import export_api_logs
+from ._batching import SearchBatcher, SearchFuture
+from ._bulk import parallel_bulk, streaming_bulk
+from ._columnar import encode_columns
+from ._errors import BulkIndexError
+from ._export import export_documents
+from ._hash_store import DocumentHashStore
+from ._identities import (
+    ExternalIdentityChange,
+    ExternalIdentitySyncReport,
+    sync_external_identities,
+)
+from ._incremental import DocumentSyncReport, sync_documents, sync_engine_documents
+from ._limiter import AdaptiveConcurrencyLimiter, RateLimiter
+from ._pagination import iter_pages
+from ._permissions import PermissionChange, PermissionSyncReport, sync_permissions
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "BulkIndexError",
+    "DocumentHashStore",
+    "DocumentSyncReport",
+    "ExternalIdentityChange",
+    "ExternalIdentitySyncReport",
+    "PermissionChange",
+    "PermissionSyncReport",
+    "RateLimiter",
+    "SearchBatcher",
+    "SearchFuture",
+    "encode_columns",
+    "export_api_logs",
+    "export_documents",
+    "iter_pages",
+    "parallel_bulk",
+    "streaming_bulk",
+    "sync_documents",
+    "sync_engine_documents",
+    "sync_external_identities",
+    "sync_permissions",
+]
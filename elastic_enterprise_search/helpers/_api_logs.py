@@ -0,0 +1,342 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import warnings
+from collections import deque
+from datetime import date, datetime, timedelta
+
+from six import string_types
+
+from .._utils import _local_timezone, parse_datetime
+
+__all__ = ["export_api_logs"]
+
+# App Search doesn't return results past the first 10,000 of a query
+# so windows with more API log entries are split into smaller windows.
+DEFAULT_MAX_WINDOW_RESULTS = 10000
+
+_FORMATS = ("ndjson", "columns", "parquet")
+
+
+def _to_utc(value):
+    """Returns a 'from_date' or 'to_date' as a datetime in UTC truncated
+    to seconds, which is the precision dates are sent with. Dates without
+    a timezone are in the local timezone like when they're sent.
+    """
+    from dateutil import tz
+
+    if isinstance(value, string_types):
+        value = parse_datetime(value)
+    elif not isinstance(value, datetime) and isinstance(value, date):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=_local_timezone())
+    return value.astimezone(tz.tzutc()).replace(microsecond=0)
+
+
+def _split_window(window, parts):
+    """Splits a window of '(from_date, to_date)' into at most 'parts'
+    windows with boundaries on whole seconds. Each window starts where
+    the previous one ends so entries between two seconds aren't missed,
+    entries exactly at a boundary are in both windows.
+    """
+    start, end = window
+    seconds = int((end - start).total_seconds())
+    step = timedelta(seconds=max(-(-seconds // parts), 1))
+    windows = []
+    while True:
+        window_end = min(start + step, end)
+        windows.append((start, window_end))
+        if window_end == end:
+            return windows
+        start = window_end
+
+
+def _plan_windows(count_results, window, max_window_results, pool):
+    """Returns the windows between 'from_date' and 'to_date' in chronological
+    order with the number of entries to export from each and whether that's
+    all of the window's entries. Windows with more entries than
+    'max_window_results' are split into as many windows as needed if entries
+    were spread evenly, which are checked again concurrently.
+    """
+    planned = []
+    pending = [window]
+    while pending:
+        windows = pending
+        pending = []
+        for window, total in zip(windows, pool.map(count_results, windows)):
+            if total == 0:
+                continue
+            elif total <= max_window_results:
+                planned.append((window, total, True))
+            elif window[1] - window[0] <= timedelta(seconds=1):
+                warnings.warn(
+                    "The %d API log entries between %s and %s are more than the %d "
+                    "which can be exported for a single window, only the first %d "
+                    "are exported"
+                    % (
+                        total,
+                        window[0],
+                        window[1],
+                        max_window_results,
+                        max_window_results,
+                    )
+                )
+                planned.append((window, max_window_results, False))
+            else:
+                parts = max(-(-total // max_window_results), 2)
+                pending.extend(_split_window(window, parts))
+    planned.sort()
+    return planned
+
+
+class _NDJSONWriter(object):
+    def __init__(self, output, serializer):
+        if callable(output):
+            self.write = output
+        else:
+            self.write = lambda entry: output.write(serializer.dumps(entry) + "\n")
+
+    def close(self):
+        pass
+
+
+class _ColumnsWriter(object):
+    """Buffers up to 'batch_size' entries and calls 'write_columns'
+    with a mapping of every field to the list of its values
+    """
+
+    def __init__(self, write_columns, batch_size):
+        self.write_columns = write_columns
+        self.batch_size = batch_size
+        self.batch = []
+
+    def write(self, entry):
+        self.batch.append(entry)
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.batch:
+            return
+        fields = {}
+        for entry in self.batch:
+            for field in entry:
+                fields.setdefault(field, None)
+        columns = dict(
+            (field, [entry.get(field) for entry in self.batch]) for field in fields
+        )
+        self.batch = []
+        self.write_columns(columns)
+
+    def close(self):
+        self.flush()
+
+
+class _ParquetWriter(_ColumnsWriter):
+    """Writes every batch of entries as a row group of a Parquet
+    file. Columns are the fields of the first batch, values which
+    aren't strings are encoded as JSON.
+    """
+
+    def __init__(self, output, serializer, batch_size):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError(
+                "You must have 'pyarrow' installed to export API logs to Parquet"
+            )
+        super(_ParquetWriter, self).__init__(self._write_row_group, batch_size)
+        self.pyarrow = pyarrow
+        self.output = output
+        self.serializer = serializer
+        self.writer = None
+
+    def _write_row_group(self, columns):
+        pa = self.pyarrow
+        if self.writer is None:
+            self.schema = pa.schema([(field, pa.string()) for field in columns])
+            self.writer = pa.parquet.ParquetWriter(self.output, self.schema)
+
+        rows = len(next(iter(columns.values())))
+        arrays = []
+        for field in self.schema.names:
+            values = columns.get(field, [None] * rows)
+            arrays.append(
+                pa.array(
+                    [
+                        (
+                            value
+                            if value is None or isinstance(value, string_types)
+                            else self.serializer.dumps(value)
+                        )
+                        for value in values
+                    ],
+                    type=pa.string(),
+                )
+            )
+        self.writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        super(_ParquetWriter, self).close()
+        if self.writer is not None:
+            self.writer.close()
+
+
+def export_api_logs(
+    client,
+    engine_name,
+    from_date,
+    to_date,
+    output,
+    format="ndjson",
+    page_size=100,
+    thread_count=4,
+    max_window_results=DEFAULT_MAX_WINDOW_RESULTS,
+    batch_size=10000,
+    **kwargs
+):
+    """Exports every API log entry of an App Search engine between two
+    dates by splitting the dates into time windows and requesting pages
+    of :meth:`~elastic_enterprise_search.AppSearch.get_api_logs` for
+    each window concurrently from a pool of threads.
+
+    App Search only returns the first ``max_window_results`` entries
+    of a query so windows with more entries are split into smaller
+    windows until every window can be paged through completely. The
+    number of entries of each window is checked with a request for a
+    single entry before pages are requested. Windows start where the
+    previous window ends and entries at the boundary are only exported
+    once.
+
+    Entries are written in chronological order as they arrive and only
+    a bounded number of pages are held in memory at once.
+
+    .. code-block:: python
+
+        with open("api-logs.ndjson", "w") as f:
+            export_api_logs(
+                app_search,
+                "national-parks",
+                from_date=datetime.datetime(2021, 1, 1),
+                to_date=datetime.datetime(2021, 2, 1),
+                output=f,
+            )
+
+    :arg client: :class:`~elastic_enterprise_search.AppSearch` instance to use
+    :arg engine_name: Name of the engine
+    :arg from_date: Start of the first window, either a ``datetime``,
+        ``date``, or an RFC 3339 string
+    :arg to_date: End of the last window, included in the export
+    :arg output: Where entries are written depending on ``format``
+    :arg format: ``"ndjson"`` writes one JSON entry per line to a text file
+        object, or calls ``output`` once per entry if it's callable.
+        ``"columns"`` calls ``output`` with a mapping of every field to the list
+        of its values for each batch of ``batch_size`` entries. ``"parquet"``
+        writes each batch as a row group of a Parquet file to a path or
+        binary file object, this requires `pyarrow <https://arrow.apache.org>`_
+    :arg page_size: The number of entries per page
+    :arg thread_count: Number of pages to request concurrently
+    :arg max_window_results: Maximum number of entries App Search returns
+        for a single window
+    :arg batch_size: Number of entries per batch of columns
+    :arg kwargs: Additional arguments passed to
+        :meth:`~elastic_enterprise_search.AppSearch.get_api_logs`
+        like ``query`` or ``http_status_filter``
+    :returns: The number of entries exported
+    """
+    if format not in _FORMATS:
+        raise ValueError("'format' must be one of %s" % ", ".join(_FORMATS))
+    if page_size < 1 or page_size > max_window_results:
+        raise ValueError("'page_size' must be between 1 and 'max_window_results'")
+    window = (_to_utc(from_date), _to_utc(to_date))
+    if window[0] > window[1]:
+        raise ValueError("'from_date' must be before 'to_date'")
+
+    serializer = client.transport.serializer
+    if format == "ndjson":
+        writer = _NDJSONWriter(output, serializer)
+    elif format == "columns":
+        writer = _ColumnsWriter(output, batch_size)
+    else:
+        writer = _ParquetWriter(output, serializer, batch_size)
+
+    def get_api_logs(window, current_page, page_size):
+        return client.get_api_logs(
+            engine_name=engine_name,
+            from_date=window[0],
+            to_date=window[1],
+            current_page=current_page,
+            page_size=page_size,
+            sort_direction="asc",
+            **kwargs
+        )
+
+    def count_results(window):
+        return get_api_logs(window, 1, 1)["meta"]["page"]["total_results"]
+
+    def fetch_page(task):
+        return get_api_logs(task[0], task[1], page_size)["results"]
+
+    from multiprocessing.pool import ThreadPool
+
+    exported = 0
+    pool = ThreadPool(thread_count)
+    try:
+        # Pages are requested in chronological order and at most
+        # 'thread_count * 2' of them are in-flight or buffered.
+        max_pending = max(thread_count, 1) * 2
+        pending = deque()
+        boundary = None
+        for window, total, complete in _plan_windows(
+            count_results, window, max_window_results, pool
+        ):
+            # Entries at the boundary with the previous window
+            # were already exported as part of that window.
+            skip_at = window[0] if window[0] == boundary else None
+            boundary = window[1] if complete else None
+            for current_page in range(1, -(-total // page_size) + 1):
+                result = pool.apply_async(fetch_page, ((window, current_page),))
+                pending.append((result, skip_at))
+                if len(pending) >= max_pending:
+                    exported += _write_entries(writer, *pending.popleft())
+        while pending:
+            exported += _write_entries(writer, *pending.popleft())
+        writer.close()
+    finally:
+        pool.terminate()
+        pool.join()
+    return exported
+
+
+def _write_entries(writer, result, skip_at):
+    """Writes a page of entries except for the ones at the start
+    of the page with a timestamp equal to 'skip_at'
+    """
+    entries = result.get()
+    skipped = 0
+    if skip_at is not None:
+        from dateutil import parser
+
+        for entry in entries:
+            if parser.isoparse(entry["timestamp"]) != skip_at:
+                break
+            skipped += 1
+    for entry in entries[skipped:]:
+        writer.write(entry)
+    return len(entries) - skipped
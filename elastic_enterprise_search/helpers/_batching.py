@@ -0,0 +1,261 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import threading
+from collections import OrderedDict
+
+from elastic_transport import BadRequestError
+from elastic_transport.response import DictResponse
+from six.moves import builtins
+
+from .._utils import DEFAULT, SKIP_IN_PATH, monotonic
+
+__all__ = ["SearchBatcher", "SearchFuture"]
+
+# App Search accepts at most 10 queries per multi search.
+DEFAULT_MAX_BATCH_SIZE = 10
+DEFAULT_MAX_WAIT = 0.002
+
+# TimeoutError isn't a builtin on Python 2.7
+_TimeoutError = getattr(builtins, "TimeoutError", OSError)
+
+
+class SearchFuture(object):
+    """Result of a search submitted to a :class:`SearchBatcher`"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._result = None
+        self._error = None
+
+    def done(self):
+        """Returns 'True' if the search has completed"""
+        return self._event.is_set()
+
+    def result(self, timeout=None):
+        """Waits for the search to complete and returns the response
+        or raises the error from the search.
+
+        :arg timeout: Number of seconds to wait for the search
+            before raising a 'TimeoutError'
+        """
+        if not self._event.wait(timeout):
+            raise _TimeoutError("Search didn't complete within %s seconds" % timeout)
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def exception(self, timeout=None):
+        """Waits for the search to complete and returns
+        the error from the search or 'None' if it succeeded.
+        """
+        if not self._event.wait(timeout):
+            raise _TimeoutError("Search didn't complete within %s seconds" % timeout)
+        return self._error
+
+    def _set_result(self, result):
+        self._result = result
+        self._event.set()
+
+    def _set_exception(self, error):
+        self._error = error
+        self._event.set()
+
+
+class _Batch(object):
+    __slots__ = ("engine_name", "http_auth", "deadline", "searches")
+
+    def __init__(self, engine_name, http_auth, deadline):
+        self.engine_name = engine_name
+        self.http_auth = http_auth
+        self.deadline = deadline
+        self.searches = []  # [(body, future), ...]
+
+
+class SearchBatcher(object):
+    """Collects individual searches against the same engine and sends
+    them together as one :meth:`~elastic_enterprise_search.AppSearch.multi_search`
+    request. A batch is sent after ``max_wait`` seconds or once it
+    contains ``max_batch_size`` searches, whichever comes first.
+
+    .. code-block:: python
+
+        with SearchBatcher(app_search) as batcher:
+            futures = [
+                batcher.submit(engine_name="national-parks", body={"query": query})
+                for query in ("lakes", "mountains", "trees")
+            ]
+            responses = [future.result() for future in futures]
+
+    If App Search rejects a batch with a '400 Bad Request' each of the
+    searches is retried individually so one invalid search doesn't
+    fail the other searches in the batch.
+
+    :arg client: :class:`~elastic_enterprise_search.AppSearch` instance to use
+    :arg max_batch_size: Maximum number of searches in a batch
+    :arg max_wait: Number of seconds to wait for more searches
+        before sending a batch
+    :arg thread_count: Number of threads sending batches
+    """
+
+    def __init__(
+        self,
+        client,
+        max_batch_size=DEFAULT_MAX_BATCH_SIZE,
+        max_wait=DEFAULT_MAX_WAIT,
+        thread_count=4,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("'max_batch_size' must be at least 1")
+
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+
+        self._cond = threading.Condition()
+        # (engine_name, http_auth) -> _Batch waiting to be sent
+        self._batches = OrderedDict()
+        self._closed = False
+        from multiprocessing.pool import ThreadPool
+
+        self._pool = ThreadPool(thread_count)
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def submit(self, engine_name, body, http_auth=DEFAULT):
+        """Adds a search to the next batch for an engine
+        and returns a :class:`SearchFuture` for its response.
+
+        :arg engine_name: Name of the engine
+        :arg body: Search options including query text, pages, sorting, facets, and filters
+        :arg http_auth: Access token or HTTP basic auth username
+            and password to send with the request
+        """
+        if engine_name in SKIP_IN_PATH:
+            raise ValueError("Empty value passed for a required argument")
+
+        if http_auth is DEFAULT:
+            auth = self.client._authorization_header
+        else:
+            auth = self.client._parse_http_auth(http_auth)
+        key = (engine_name, auth)
+        future = SearchFuture()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Can't submit searches after SearchBatcher.close()")
+            batch = self._batches.get(key)
+            if batch is None:
+                batch = self._batches[key] = _Batch(
+                    engine_name, http_auth, monotonic() + self.max_wait
+                )
+                self._cond.notify()
+            batch.searches.append((body, future))
+            if len(batch.searches) >= self.max_batch_size:
+                del self._batches[key]
+                self._pool.apply_async(self._send, (batch,))
+        return future
+
+    def search(self, engine_name, body, http_auth=DEFAULT):
+        """Same as :meth:`submit` except waits for and returns the response"""
+        return self.submit(engine_name, body, http_auth=http_auth).result()
+
+    def close(self):
+        """Sends every pending batch and waits for all searches to complete"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def _run(self):
+        with self._cond:
+            while True:
+                now = monotonic()
+                for key, batch in list(self._batches.items()):
+                    if self._closed or batch.deadline <= now:
+                        del self._batches[key]
+                        self._pool.apply_async(self._send, (batch,))
+                if self._closed:
+                    return
+                if self._batches:
+                    timeout = min(b.deadline for b in self._batches.values()) - now
+                    self._cond.wait(max(timeout, 0))
+                else:
+                    self._cond.wait()
+
+    def _send(self, batch):
+        try:
+            self._send_batch(batch)
+        except Exception as e:  # pragma: nocover
+            # Never leave a caller waiting on a future forever.
+            for _, future in batch.searches:
+                if not future.done():
+                    future._set_exception(e)
+
+    def _send_batch(self, batch):
+        searches = batch.searches
+        if len(searches) == 1:
+            return self._send_one(batch, *searches[0])
+
+        try:
+            resp = self.client.multi_search(
+                engine_name=batch.engine_name,
+                body={"queries": [body for body, _ in searches]},
+                http_auth=batch.http_auth,
+            )
+        except BadRequestError:
+            for body, future in searches:
+                self._send_one(batch, body, future)
+            return
+        except Exception as e:
+            for _, future in searches:
+                future._set_exception(e)
+            return
+
+        if len(resp) != len(searches):
+            error = ValueError(
+                "Expected %d results from multi_search, received %d"
+                % (len(searches), len(resp))
+            )
+            for _, future in searches:
+                future._set_exception(error)
+            return
+
+        for (_, future), result in zip(searches, resp):
+            future._set_result(
+                DictResponse(status=resp.status, headers=resp.headers, body=result)
+            )
+
+    def _send_one(self, batch, body, future):
+        try:
+            future._set_result(
+                self.client.search(
+                    engine_name=batch.engine_name,
+                    body=body,
+                    http_auth=batch.http_auth,
+                )
+            )
+        except Exception as e:
+            future._set_exception(e)
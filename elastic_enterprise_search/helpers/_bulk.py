@@ -0,0 +1,474 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+
+import re
+import threading
+from collections import deque
+
+from elastic_transport import TransportError
+from six import ensure_binary
+from six.moves.queue import Full, Queue
+
+from .._retry import _count_throttled_retries
+from .._utils import SKIP_IN_PATH
+from ._errors import BulkIndexError
+from ._limiter import AdaptiveConcurrencyLimiter
+
+__all__ = ["parallel_bulk", "streaming_bulk"]
+
+# App Search accepts at most 100 documents per request
+# and rejects request bodies larger than 10MiB.
+DEFAULT_CHUNK_SIZE = 100
+DEFAULT_MAX_CHUNK_BYTES = 10 * 1024 * 1024
+
+# Per-document errors which are likely to be transient,
+# any other error is treated as a permanent failure.
+_RETRYABLE_ERROR_RE = re.compile(
+    r"timed? ?out|temporar|try again|unavailable|too many requests|"
+    r"rate limit|overloaded|internal (server )?error",
+    re.IGNORECASE,
+)
+
+
+def _chunk_documents(items, chunk_size, max_chunk_bytes):
+    """Splits an iterable of '(document, serialized document, retries)'
+    items into chunks which fit within both 'chunk_size' and
+    'max_chunk_bytes'. Yields tuples of (documents, serialized
+    documents, retries) with one entry per document.
+    """
+    chunk, chunk_data, chunk_retries = [], [], []
+    chunk_bytes = 2  # Opening '[' and closing ']'
+    for document, data, retries in items:
+        # Account for the ',' separator between documents.
+        data_bytes = len(ensure_binary(data, errors="surrogatepass")) + 1
+
+        if chunk and (
+            len(chunk) >= chunk_size or chunk_bytes + data_bytes > max_chunk_bytes
+        ):
+            yield chunk, chunk_data, chunk_retries
+            chunk, chunk_data, chunk_retries = [], [], []
+            chunk_bytes = 2
+
+        chunk.append(document)
+        chunk_data.append(data)
+        chunk_retries.append(retries)
+        chunk_bytes += data_bytes
+
+    if chunk:
+        yield chunk, chunk_data, chunk_retries
+
+
+def _serialize_documents(documents, serializer):
+    """Serializes each document once as it's consumed"""
+    for document in documents:
+        yield document, serializer.dumps(document), 0
+
+
+def _is_retryable_result(result):
+    """Returns True if every error of a document's result is likely
+    to be transient so sending the document again may succeed.
+    """
+    errors = result.get("errors")
+    return bool(errors) and all(
+        _RETRYABLE_ERROR_RE.search(str(error)) for error in errors
+    )
+
+
+class _DocumentRetryQueue(object):
+    """Holds documents rejected with retryable errors until they're
+    sent again within a later chunk. Counts the chunks in flight so
+    the documents aren't finished while a chunk may still re-queue.
+    """
+
+    def __init__(self, max_retries, is_retryable):
+        self.max_retries = max_retries
+        self.is_retryable = is_retryable or _is_retryable_result
+        self._cond = threading.Condition()
+        self._queue = deque()
+        self._pending = 0
+        self._closed = False
+
+    def chunks(self, documents, serializer, chunk_size, max_chunk_bytes):
+        """Yields chunks of 'documents' with re-queued documents
+        mixed in as soon as they're available. Once 'documents'
+        is consumed waits for the chunks in flight to finish.
+        """
+        items = self._items(documents, serializer)
+        while True:
+            for chunk in _chunk_documents(items, chunk_size, max_chunk_bytes):
+                with self._cond:
+                    self._pending += 1
+                yield chunk
+            items = self._pop_all(wait=True)
+            if not items:
+                break
+
+    def _items(self, documents, serializer):
+        for item in _serialize_documents(documents, serializer):
+            if self._closed:
+                return
+            for requeued in self._pop_all(wait=False):
+                yield requeued
+            yield item
+
+    def chunk_done(self, requeued):
+        with self._cond:
+            self._queue.extend(requeued)
+            self._pending -= 1
+            self._cond.notify_all()
+
+    def close(self):
+        """Stops waiting for chunks in flight, their
+        re-queued documents are never sent.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def _pop_all(self, wait):
+        with self._cond:
+            while wait and not self._closed and not self._queue and self._pending:
+                self._cond.wait()
+            if self._closed:
+                return []
+            items = list(self._queue)
+            self._queue.clear()
+            return items
+
+
+def _bulk_api(client, engine_name, content_source_id, **kwargs):
+    """Returns a function which sends a chunk of serialized documents
+    to either App Search or Workplace Search and returns the list of
+    per-document results from the response.
+    """
+    if engine_name is not None and content_source_id is not None:
+        raise ValueError(
+            "'engine_name' and 'content_source_id' parameters are mutually exclusive"
+        )
+
+    if content_source_id is None:
+        if engine_name in SKIP_IN_PATH:
+            raise ValueError("Empty value passed for a required argument")
+
+        def bulk_api(data):
+            return client.index_documents(
+                engine_name=engine_name, documents="[%s]" % ",".join(data), **kwargs
+            )
+
+    else:
+        if content_source_id in SKIP_IN_PATH:
+            raise ValueError("Empty value passed for a required argument")
+
+        def bulk_api(data):
+            # Workplace Search wraps the per-document results in an object
+            return client.index_documents(
+                content_source_id=content_source_id,
+                documents="[%s]" % ",".join(data),
+                **kwargs
+            )["results"]
+
+    return bulk_api
+
+
+def _send_chunk(bulk_api, data, retry_policy, limiter):
+    """Sends a chunk, retrying only this chunk if the server is
+    overloaded and 'retry_policy' allows. Throttled responses,
+    including the ones retried by the client's own retry policy,
+    lower the concurrency of 'limiter'.
+    """
+    retry = 0
+    while True:
+        token = limiter.acquire() if limiter is not None else None
+        throttled = False
+        with _count_throttled_retries() as throttled_retries:
+            try:
+                return bulk_api(data)
+            except TransportError as e:
+                error = e
+                throttled = retry_policy is not None and retry_policy._is_throttled(e)
+                if retry_policy is None or not retry_policy._should_retry(retry, e):
+                    raise
+            finally:
+                if limiter is not None:
+                    limiter.release(
+                        token, throttled=throttled or throttled_retries[0] > 0
+                    )
+
+        retry_policy._sleep(retry, error)
+        retry += 1
+
+
+def _process_chunk(
+    bulk_api,
+    chunk,
+    raise_on_error,
+    retry_policy=None,
+    limiter=None,
+    document_retries=None,
+    dead_letter=None,
+):
+    """Sends a single chunk of serialized documents and
+    returns a list of (ok, result) tuples, one per document.
+    Documents re-queued by 'document_retries' are left out.
+    """
+    documents, data, retries = chunk
+    requeued = []
+    try:
+        resp = _send_chunk(bulk_api, data, retry_policy, limiter)
+
+        results, errors = [], []
+        for document, document_data, document_retry, result in zip(
+            documents, data, retries, resp
+        ):
+            ok = not result.get("errors")
+            if not ok:
+                if (
+                    document_retries is not None
+                    and document_retry < document_retries.max_retries
+                    and document_retries.is_retryable(result)
+                ):
+                    requeued.append((document, document_data, document_retry + 1))
+                    continue
+                elif dead_letter is not None:
+                    dead_letter(document, result)
+                else:
+                    errors.append(dict(result, document=document))
+            results.append((ok, result))
+    finally:
+        if document_retries is not None:
+            document_retries.chunk_done(requeued)
+
+    if errors and raise_on_error:
+        raise BulkIndexError("%d document(s) failed to index." % len(errors), errors)
+    return results
+
+
+def _bulk_chunks(
+    documents,
+    serializer,
+    chunk_size,
+    max_chunk_bytes,
+    max_document_retries,
+    is_retryable,
+):
+    """Returns the chunks to send and the '_DocumentRetryQueue' if
+    documents with retryable errors should be sent again.
+    """
+    if max_document_retries > 0:
+        document_retries = _DocumentRetryQueue(max_document_retries, is_retryable)
+        chunks = document_retries.chunks(
+            documents, serializer, chunk_size, max_chunk_bytes
+        )
+        return chunks, document_retries
+
+    items = _serialize_documents(documents, serializer)
+    return _chunk_documents(items, chunk_size, max_chunk_bytes), None
+
+
+def streaming_bulk(
+    client,
+    documents,
+    engine_name=None,
+    content_source_id=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    max_chunk_bytes=DEFAULT_MAX_CHUNK_BYTES,
+    raise_on_error=True,
+    retry_policy=None,
+    max_document_retries=0,
+    is_retryable=None,
+    dead_letter=None,
+    **kwargs
+):
+    """Streams documents from an iterable into an App Search engine
+    or a Workplace Search custom content source via ``index_documents()``,
+    splitting them into chunks that the server will accept. Documents
+    are consumed lazily so generators of any size use constant memory.
+
+    Yields a tuple of ``(ok, result)`` per document where ``result``
+    is the ``{"id": ..., "errors": [...]}`` object returned by the server.
+
+    :arg client: :class:`~elastic_enterprise_search.AppSearch` or
+        :class:`~elastic_enterprise_search.WorkplaceSearch` instance to use
+    :arg documents: Iterable of documents to index
+    :arg engine_name: Name of the engine, for App Search
+    :arg content_source_id: ID of the custom content source, for Workplace Search
+    :arg chunk_size: Number of documents to send in a single request
+    :arg max_chunk_bytes: Maximum size in bytes of a single request body
+    :arg raise_on_error: Raise :class:`BulkIndexError` containing the failed
+        documents of a chunk instead of yielding them
+    :arg retry_policy: :class:`~elastic_enterprise_search.RetryPolicy` used to
+        retry a chunk when the server responds that it's overloaded. Only the
+        failed chunk is sent again.
+    :arg max_document_retries: Number of times a document rejected with
+        a retryable error is sent again. Documents are re-queued on their own
+        and sent within later chunks without resending the rest of their chunk,
+        their results are yielded once they're indexed or can't be retried.
+    :arg is_retryable: Function called with a document's result which returns
+        ``True`` if its errors are retryable. By default errors which look
+        transient like timeouts or internal server errors are retryable.
+    :arg dead_letter: Function called with ``(document, result)`` for every
+        document that failed permanently, instead of raising
+        :class:`BulkIndexError` for them
+    :arg kwargs: Additional arguments passed to ``index_documents()``
+    """
+    if chunk_size < 1:
+        raise ValueError("'chunk_size' must be greater than zero")
+    bulk_api = _bulk_api(client, engine_name, content_source_id, **kwargs)
+
+    chunks, document_retries = _bulk_chunks(
+        documents,
+        client.transport.serializer,
+        chunk_size,
+        max_chunk_bytes,
+        max_document_retries,
+        is_retryable,
+    )
+    for chunk in chunks:
+        for result in _process_chunk(
+            bulk_api,
+            chunk,
+            raise_on_error,
+            retry_policy=retry_policy,
+            document_retries=document_retries,
+            dead_letter=dead_letter,
+        ):
+            yield result
+
+
+def parallel_bulk(
+    client,
+    documents,
+    engine_name=None,
+    content_source_id=None,
+    thread_count=4,
+    queue_size=4,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    max_chunk_bytes=DEFAULT_MAX_CHUNK_BYTES,
+    raise_on_error=True,
+    retry_policy=None,
+    adaptive_concurrency=False,
+    max_document_retries=0,
+    is_retryable=None,
+    dead_letter=None,
+    **kwargs
+):
+    """Parallel version of :func:`streaming_bulk` which sends multiple
+    chunks at once from a pool of threads. All threads share the client's
+    :class:`~elastic_transport.Transport` and its connection pool so
+    ``thread_count`` shouldn't exceed ``connections_per_host``.
+
+    At most ``thread_count + queue_size`` chunks are held in memory at once,
+    the ``documents`` iterable isn't consumed faster than chunks complete.
+    Results are yielded in the same order as the documents, except for
+    documents re-queued by ``max_document_retries``. ``dead_letter`` is
+    called from the pool's threads.
+
+    :arg client: :class:`~elastic_enterprise_search.AppSearch` or
+        :class:`~elastic_enterprise_search.WorkplaceSearch` instance to use
+    :arg documents: Iterable of documents to index
+    :arg engine_name: Name of the engine, for App Search
+    :arg content_source_id: ID of the custom content source, for Workplace Search
+    :arg thread_count: Number of chunks to send concurrently
+    :arg queue_size: Number of serialized chunks to buffer ahead of the threads
+    :arg chunk_size: Number of documents to send in a single request
+    :arg max_chunk_bytes: Maximum size in bytes of a single request body
+    :arg raise_on_error: Raise :class:`BulkIndexError` containing the failed
+        documents of a chunk instead of yielding them
+    :arg retry_policy: :class:`~elastic_enterprise_search.RetryPolicy` used to
+        retry a chunk when the server responds that it's overloaded. Only the
+        failed chunk is sent again.
+    :arg adaptive_concurrency: Lower the number of chunks sent concurrently
+        when the server is overloaded and raise it again up to ``thread_count``
+        while requests succeed. Either ``True`` or an
+        :class:`~elastic_enterprise_search.helpers.AdaptiveConcurrencyLimiter`.
+        Throttled responses are recognized by the statuses of ``retry_policy``
+        and of the client's ``retry_policy``. Statuses in the Transport's
+        ``retry_on_status`` are retried by the Transport first and are only
+        seen once its retries are exhausted.
+    :arg max_document_retries: Number of times a document rejected with
+        a retryable error is sent again. Documents are re-queued on their own
+        and sent within later chunks without resending the rest of their chunk,
+        their results are yielded once they're indexed or can't be retried.
+    :arg is_retryable: Function called with a document's result which returns
+        ``True`` if its errors are retryable. By default errors which look
+        transient like timeouts or internal server errors are retryable.
+    :arg dead_letter: Function called with ``(document, result)`` for every
+        document that failed permanently, instead of raising
+        :class:`BulkIndexError` for them
+    :arg kwargs: Additional arguments passed to ``index_documents()``
+    """
+    if chunk_size < 1:
+        raise ValueError("'chunk_size' must be greater than zero")
+    bulk_api = _bulk_api(client, engine_name, content_source_id, **kwargs)
+
+    if adaptive_concurrency is True:
+        limiter = AdaptiveConcurrencyLimiter(max(thread_count, 1))
+    else:
+        limiter = adaptive_concurrency or None
+
+    from multiprocessing.pool import RUN, ThreadPool
+
+    class BlockingPool(ThreadPool):
+        def _setup_queues(self):
+            super(BlockingPool, self)._setup_queues()
+            # Bounding the task queue makes the pool's task handler
+            # block instead of draining the 'documents' iterable.
+            self._inqueue = Queue(max(queue_size, 1))
+            self._quick_put = self._blocking_put
+
+        def _blocking_put(self, task):
+            # Once the pool is terminated the workers stop taking tasks
+            # from the full queue, so give up instead of blocking forever.
+            while True:
+                try:
+                    return self._inqueue.put(task, timeout=0.1)
+                except Full:
+                    if self._state != RUN:
+                        return
+
+    chunks, document_retries = _bulk_chunks(
+        documents,
+        client.transport.serializer,
+        chunk_size,
+        max_chunk_bytes,
+        max_document_retries,
+        is_retryable,
+    )
+    pool = BlockingPool(thread_count)
+    try:
+        for results in pool.imap(
+            lambda chunk: _process_chunk(
+                bulk_api,
+                chunk,
+                raise_on_error,
+                retry_policy=retry_policy,
+                limiter=limiter,
+                document_retries=document_retries,
+                dead_letter=dead_letter,
+            ),
+            chunks,
+        ):
+            for result in results:
+                yield result
+    finally:
+        if document_retries is not None:
+            document_retries.close()
+        # Terminating instead of closing stops the pool from
+        # draining 'documents' if iteration is stopped early.
+        pool.terminate()
+        pool.join()
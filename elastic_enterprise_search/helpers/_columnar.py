@@ -0,0 +1,224 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import datetime
+from json.encoder import encode_basestring
+
+from six import text_type
+
+from .._serializer import JSONSerializer
+from .._utils import _format_utcoffset, _local_timezone
+
+__all__ = ["encode_columns"]
+
+
+def encode_columns(columns, serializer=None):
+    """Encodes column-oriented documents as a JSON array of objects, one
+    per row, without creating a ``dict`` per document. Timestamp columns
+    with a NumPy ``datetime64`` dtype are formatted to RFC 3339 for the whole
+    column at once and are encoded the same as ``datetime`` objects would
+    be, timestamps without a timezone use the local timezone.
+
+    .. code-block:: python
+
+        df = pandas.DataFrame({"id": ["1", "2"], "created_at": pandas.to_datetime(...)})
+        body = encode_columns(df)
+        app_search.index_documents(engine_name="national-parks", documents=body)
+
+    :meth:`~elastic_enterprise_search.AppSearch.index_documents` calls this
+    automatically when given a DataFrame or a dict of arrays.
+
+    :arg columns: A ``pandas.DataFrame`` or a mapping of field name
+        to a sequence of values (list, NumPy array, pandas Series)
+        all of the same length
+    :arg serializer: JSON serializer used for values that aren't
+        in a NumPy array. Defaults to :class:`~elastic_enterprise_search.JSONSerializer`
+    :returns: The documents as a JSON array string
+    """
+    if serializer is None:
+        serializer = JSONSerializer()
+
+    names = []
+    encoded = []
+    for name, column in columns.items():
+        if not isinstance(name, text_type):
+            name = text_type(name)
+        names.append(encode_basestring(name).replace("%", "%%"))
+        encoded.append(_encode_column(column, serializer))
+
+    lengths = set(len(column) for column in encoded)
+    if len(lengths) > 1:
+        raise ValueError(
+            "All columns must have the same length, got lengths %s" % sorted(lengths)
+        )
+    if not names:
+        return "[]"
+
+    template = "{" + ",".join(name + ":%s" for name in names) + "}"
+    return "[" + ",".join([template % row for row in zip(*encoded)]) + "]"
+
+
+def _is_columnar(documents):
+    """Returns True for a DataFrame or a mapping of field names to
+    arrays. Mappings of lists are ambiguous with a single document
+    so they're only treated as columns when passed to encode_columns().
+    """
+    if hasattr(documents, "columns") and hasattr(documents, "iloc"):
+        return True
+    if not isinstance(documents, dict) or not documents:
+        return False
+    return all(
+        hasattr(column, "dtype") and getattr(column, "ndim", None) == 1
+        for column in documents.values()
+    )
+
+
+def _encode_column(column, serializer):
+    """Encodes a column into a list of JSON values"""
+    dtype = getattr(column, "dtype", None)
+    if dtype is None:
+        return [_encode_value(value, serializer) for value in column]
+
+    if dtype.kind == "M":
+        if getattr(dtype, "tz", None) is not None:
+            return _encode_datetime64_tz(column)
+        return _encode_datetime64(_to_numpy(column))
+
+    values = _to_numpy(column)
+    kind = values.dtype.kind
+    if kind in "iu":
+        return values.astype(str).tolist()
+    elif kind == "b":
+        return ["true" if value else "false" for value in values.tolist()]
+    elif kind == "f":
+        import numpy as np
+
+        if np.isfinite(values).all():
+            return [repr(value) for value in values.tolist()]
+    return [_encode_value(value, serializer) for value in values.tolist()]
+
+
+def _encode_value(value, serializer):
+    if isinstance(value, text_type):
+        return encode_basestring(value)
+    # Serializers pass through strings as-is so the
+    # value is wrapped in a list to always encode it.
+    return serializer.dumps([value])[1:-1]
+
+
+def _to_numpy(column):
+    if not hasattr(column, "to_numpy"):
+        return column
+    import numpy as np
+
+    # pandas nullable dtypes ('Int64', 'boolean', 'string', ...) convert
+    # missing values to NaN, or integers to floats when there are any.
+    if not isinstance(column.dtype, np.dtype) and column.isna().any():
+        return column.to_numpy(dtype=object, na_value=None)
+    return column.to_numpy()
+
+
+def _encode_datetime64(values):
+    """Formats a naive datetime64 array using the local timezone"""
+    import numpy as np
+
+    seconds, missing = _to_seconds(values)
+    wall = np.datetime_as_string(seconds, unit="s")
+
+    # Local UTC offsets only change a few times a year so they're
+    # calculated once per day, or per value on days they change.
+    days = np.where(missing, np.datetime64(0, "D"), seconds.astype("datetime64[D]"))
+    unique_days, day_index = np.unique(days, return_inverse=True)
+    day_index = day_index.reshape(-1)
+    day_suffixes = []
+    for day in unique_days.tolist():
+        start = datetime.datetime(day.year, day.month, day.day)
+        suffix = _local_suffix(start)
+        if suffix != _local_suffix(start.replace(hour=23, minute=59, second=59)):
+            suffix = None
+        day_suffixes.append(suffix)
+    suffixes = np.array(day_suffixes, dtype=object)[day_index]
+    changing = np.array([suffix is None for suffix in day_suffixes])[day_index]
+    for i in np.flatnonzero(changing).tolist():
+        suffixes[i] = _local_suffix(seconds[i].item())
+
+    return _join_datetimes(seconds, wall, suffixes, missing)
+
+
+def _encode_datetime64_tz(column):
+    """Formats a pandas timezone-aware datetime column with
+    each value's UTC offset in its timezone.
+    """
+    import numpy as np
+
+    accessor = getattr(column, "dt", column)
+    local = _to_numpy(accessor.tz_localize(None))
+    utc = _to_numpy(accessor.tz_convert(None))
+    seconds, missing = _to_seconds(local)
+    wall = np.datetime_as_string(seconds, unit="s")
+
+    offsets = (local - utc).astype("timedelta64[us]")
+    offsets = np.where(missing, np.timedelta64(0, "us"), offsets).astype(np.int64)
+    unique_offsets, offset_index = np.unique(offsets, return_inverse=True)
+    unique_suffixes = np.array(
+        [
+            _format_utcoffset(datetime.timedelta(microseconds=offset))
+            for offset in unique_offsets.tolist()
+        ],
+        dtype=object,
+    )
+    suffixes = unique_suffixes[offset_index.reshape(-1)]
+
+    return _join_datetimes(seconds, wall, suffixes, missing)
+
+
+def _to_seconds(values):
+    """Truncates datetime64 values to seconds and checks
+    they can be represented as a datetime.
+    """
+    import numpy as np
+
+    seconds = values.astype("datetime64[s]")
+    missing = np.isnat(seconds)
+    years = seconds.astype("datetime64[Y]").astype(np.int64) + 1970
+    out_of_range = ~missing & ((years < datetime.MINYEAR) | (years > datetime.MAXYEAR))
+    if out_of_range.any():
+        raise ValueError(
+            "%s is out of the range of datetime" % seconds[out_of_range][0]
+        )
+    return seconds, missing
+
+
+def _join_datetimes(seconds, wall, suffixes, missing):
+    import numpy as np
+
+    encoded = ('"' + wall.astype(object) + suffixes + '"').tolist()
+
+    # NaT is encoded as null and years before 1000 are
+    # formatted with strftime() like format_datetime() does.
+    years = seconds.astype("datetime64[Y]").astype(np.int64) + 1970
+    for i in np.flatnonzero(missing | (years < 1000)).tolist():
+        if missing[i]:
+            encoded[i] = "null"
+        else:
+            wall = seconds[i].item().strftime("%Y-%m-%dT%H:%M:%S")
+            encoded[i] = '"%s%s"' % (wall, suffixes[i])
+    return encoded
+
+
+def _local_suffix(value):
+    return _format_utcoffset(value.replace(tzinfo=_local_timezone()).utcoffset())
@@ -0,0 +1,80 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+from ._pagination import _iter_pages_parallel
+
+__all__ = ["export_documents"]
+
+
+def export_documents(
+    client,
+    engine_name,
+    output,
+    page_size=100,
+    thread_count=4,
+    preserve_order=True,
+    **kwargs
+):
+    """Exports every document in an App Search engine by requesting pages
+    of :meth:`~elastic_enterprise_search.AppSearch.list_documents`
+    concurrently from a pool of threads.
+
+    Documents are written to ``output`` as they arrive and only a
+    bounded number of pages are held in memory, the output is
+    suitable for backups or for re-indexing with
+    :func:`~elastic_enterprise_search.helpers.streaming_bulk`.
+
+    .. code-block:: python
+
+        with open("national-parks.ndjson", "w") as f:
+            export_documents(app_search, "national-parks", f)
+
+    :arg client: :class:`~elastic_enterprise_search.AppSearch` instance to use
+    :arg engine_name: Name of the engine
+    :arg output: Either a text file object which receives one JSON
+        document per line (NDJSON) or a callable which is called once
+        per document
+    :arg page_size: The number of documents per page
+    :arg thread_count: Number of pages to request concurrently
+    :arg preserve_order: Write documents in the same order as the
+        engine lists them. If ``False`` pages are written as soon as
+        they arrive which keeps slow pages from holding up the others
+    :arg kwargs: Additional arguments passed to
+        :meth:`~elastic_enterprise_search.AppSearch.list_documents`
+    :returns: The number of documents exported
+    """
+    if callable(output):
+        write_document = output
+    else:
+        serializer = client.transport.serializer
+
+        def write_document(document):
+            output.write(serializer.dumps(document) + "\n")
+
+    exported = 0
+    for page in _iter_pages_parallel(
+        client.list_documents,
+        thread_count=thread_count,
+        preserve_order=preserve_order,
+        page_size=page_size,
+        engine_name=engine_name,
+        **kwargs
+    ):
+        for document in page["results"]:
+            write_document(document)
+        exported += len(page["results"])
+    return exported
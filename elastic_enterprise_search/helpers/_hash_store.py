@@ -0,0 +1,227 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import hashlib
+import json
+import threading
+
+__all__ = ["DocumentHashStore"]
+
+# Digests are truncated to 16 bytes which keeps the store
+# compact while collisions stay practically impossible.
+_DIGEST_SIZE = 16
+# Digests of single fields only need to be unique within a document.
+_FIELD_DIGEST_SIZE = 8
+
+# Older versions of SQLite allow at most 999 variables per statement.
+_MAX_VARIABLES = 500
+
+
+def _digest(value, serializer, size):
+    """Returns a digest of the canonical JSON of a value which doesn't
+    depend on the order of keys. Values that aren't JSON like datetimes
+    are encoded by the serializer's 'default()' like when they're sent.
+    """
+    data = json.dumps(
+        value,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=serializer.default,
+    )
+    return hashlib.sha256(data.encode("utf-8", "surrogatepass")).digest()[:size]
+
+
+def _document_hash(document, serializer):
+    """Returns a digest of a document's content"""
+    return _digest(document, serializer, _DIGEST_SIZE)
+
+
+def _field_hashes(document, serializer):
+    """Returns a digest of a document's sorted field names followed by
+    a digest of every field's value in the same order. Comparing them
+    tells which fields of a document changed without storing its content.
+    """
+    fields = sorted(document)
+    digests = [_digest(fields, serializer, _FIELD_DIGEST_SIZE)]
+    digests.extend(
+        _digest(document[field], serializer, _FIELD_DIGEST_SIZE) for field in fields
+    )
+    return b"".join(digests)
+
+
+def _split_field_hashes(hashes):
+    # Skip the digest of the whole document.
+    size = _FIELD_DIGEST_SIZE
+    return [
+        hashes[i : i + size]  # noqa: E203
+        for i in range(_DIGEST_SIZE, len(hashes), size)
+    ]
+
+
+def _changed_fields(document, previous, current):
+    """Returns the names of the fields whose hashes differ between two
+    hashes made of a '_document_hash()' followed by '_field_hashes()',
+    or 'None' if fields were added or removed so the whole document
+    must be sent.
+    """
+    previous, current = _split_field_hashes(previous), _split_field_hashes(current)
+    if len(previous) != len(current) or previous[0] != current[0]:
+        return None
+    return [
+        field
+        for field, before, after in zip(sorted(document), previous[1:], current[1:])
+        if before != after
+    ]
+
+
+class DocumentHashStore(object):
+    """Persistent index of the content hash of every document sent to
+    a content source or an engine, kept in an SQLite database file.
+    Used by :func:`~elastic_enterprise_search.helpers.sync_documents` and
+    :func:`~elastic_enterprise_search.helpers.sync_engine_documents`
+    to only send documents which changed since the previous sync.
+
+    Hashes are kept per namespace so a single file can be shared by
+    multiple content sources and engines. Only the hashes of the documents
+    being compared are read at once so memory use doesn't grow with the
+    number of documents. The store isn't a copy of the documents,
+    if documents are changed or deleted by other means than the
+    sync helpers the store must be cleared with :meth:`clear`.
+
+    .. code-block:: python
+
+        with DocumentHashStore("documents.sqlite3") as store:
+            sync_documents(workplace_search, content_source_id, documents, store)
+            sync_engine_documents(app_search, engine_name, products, store)
+
+    :arg path: Path of the SQLite database file, created if it doesn't exist.
+        ``":memory:"`` keeps the hashes in memory only.
+    """
+
+    def __init__(self, path):
+        import sqlite3
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS document_hashes ("
+                "namespace TEXT NOT NULL, "
+                "id TEXT NOT NULL, "
+                "hash BLOB NOT NULL, "
+                "PRIMARY KEY (namespace, id)"
+                ") WITHOUT ROWID"
+            )
+            # IDs of the documents compared by the syncs in progress,
+            # documents which weren't compared have disappeared.
+            self._conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS seen_ids ("
+                "namespace TEXT NOT NULL, "
+                "id TEXT NOT NULL, "
+                "PRIMARY KEY (namespace, id)"
+                ") WITHOUT ROWID"
+            )
+
+    def hashes(self, namespace):
+        """Returns a dictionary of every document ID in
+        the namespace to the hash of its content
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT id, hash FROM document_hashes WHERE namespace = ?",
+                (namespace,),
+            )
+            return {id_: bytes(hash_) for id_, hash_ in cursor}
+
+    def lookup(self, namespace, ids):
+        """Returns a dictionary of the IDs of a list of documents
+        to the hash of their content. Documents without a hash
+        are left out.
+        """
+        hashes = {}
+        with self._lock:
+            for i in range(0, len(ids), _MAX_VARIABLES):
+                batch = ids[i : i + _MAX_VARIABLES]  # noqa: E203
+                cursor = self._conn.execute(
+                    "SELECT id, hash FROM document_hashes "
+                    "WHERE namespace = ? AND id IN (%s)" % ",".join("?" * len(batch)),
+                    [namespace] + batch,
+                )
+                hashes.update((id_, bytes(hash_)) for id_, hash_ in cursor)
+        return hashes
+
+    def update(self, namespace, hashes):
+        """Stores the hashes of an iterable of ``(id, hash)`` pairs"""
+        import sqlite3
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO document_hashes (namespace, id, hash) "
+                "VALUES (?, ?, ?)",
+                ((namespace, id_, sqlite3.Binary(hash_)) for id_, hash_ in hashes),
+            )
+
+    def delete(self, namespace, ids):
+        """Removes the hashes of an iterable of document IDs"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM document_hashes WHERE namespace = ? AND id = ?",
+                ((namespace, id_) for id_ in ids),
+            )
+
+    def clear(self, namespace):
+        """Removes every hash of the namespace so
+        the next sync sends every document again
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM document_hashes WHERE namespace = ?", (namespace,)
+            )
+
+    def _mark_seen(self, namespace, ids):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_ids (namespace, id) VALUES (?, ?)",
+                ((namespace, id_) for id_ in ids),
+            )
+
+    def _unseen(self, namespace):
+        """Returns the sorted IDs of the documents with
+        a hash which weren't marked as seen
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT id FROM document_hashes WHERE namespace = ? AND id NOT IN "
+                "(SELECT id FROM seen_ids WHERE namespace = ?) ORDER BY id",
+                (namespace, namespace),
+            )
+            return [id_ for id_, in cursor]
+
+    def _forget_seen(self, namespace):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM seen_ids WHERE namespace = ?", (namespace,))
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
@@ -0,0 +1,184 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+from collections import namedtuple
+
+from elastic_transport import TransportError
+
+from ._sync import _apply_changes, _call_with_retry, _rate_limiter, _SyncReport
+
+__all__ = [
+    "ExternalIdentityChange",
+    "ExternalIdentitySyncReport",
+    "sync_external_identities",
+]
+
+
+class ExternalIdentityChange(
+    namedtuple("ExternalIdentityChange", ["source_user_id", "action", "user"])
+):
+    """A single request needed to give an external identity its desired user.
+
+    :arg source_user_id: The user's ID in the content source
+    :arg action: ``"create"`` to add a new external identity, ``"put"``
+        to map an existing one to a different user, or ``"delete"``
+    :arg user: The Workplace Search user sent with the request,
+        ``None`` when deleting
+    """
+
+    __slots__ = ()
+
+
+class ExternalIdentitySyncReport(_SyncReport):
+    """Progress and outcome of :func:`sync_external_identities`.
+
+    :ivar identities: Number of external identities compared
+    :ivar unchanged: Number of external identities already mapped to their user
+    :ivar changes: List of every :class:`ExternalIdentityChange` to apply
+    :ivar created: Number of ``"create"`` changes applied
+    :ivar updated: Number of ``"put"`` changes applied
+    :ivar deleted: Number of ``"delete"`` changes applied
+    :ivar failures: List of ``(change, error)`` for every change
+        which failed with an error from the server
+    :ivar duration: Number of seconds the sync took so far
+    """
+
+    _ACTIONS = (("create", "created"), ("put", "updated"), ("delete", "deleted"))
+    _NOUN = "identities"
+
+    def __init__(self):
+        super(ExternalIdentitySyncReport, self).__init__()
+        self.identities = 0
+
+
+def sync_external_identities(
+    client,
+    content_source_id,
+    identities,
+    delete_missing_identities=False,
+    thread_count=4,
+    page_size=100,
+    rate_limit=None,
+    retry_policy=None,
+    dry_run=False,
+    progress=None,
+    **kwargs
+):
+    """Maps the users of a content source to Workplace Search
+    users by creating, updating, and deleting external identities.
+
+    The current external identities are listed page by page with
+    :meth:`~elastic_enterprise_search.WorkplaceSearch.list_external_identities`
+    and compared to ``identities``. Identities which are missing are created,
+    identities mapped to a different user are updated and if
+    ``delete_missing_identities`` is set identities which aren't in
+    ``identities`` are deleted. Changes are applied concurrently
+    by a pool of threads.
+
+    .. code-block:: python
+
+        report = sync_external_identities(
+            workplace_search,
+            content_source_id,
+            {"alice@example.com": "alice", "bob@example.com": "bob"},
+            delete_missing_identities=True,
+            rate_limit=10,
+            retry_policy=RetryPolicy(max_retries=5),
+        )
+        report.write_summary("identities-sync.txt")
+
+    A change that fails with an error from the server is recorded in
+    :attr:`ExternalIdentitySyncReport.failures` and doesn't stop the others.
+
+    :arg client: :class:`~elastic_enterprise_search.WorkplaceSearch` instance to use
+    :arg content_source_id: Unique ID for a Custom API source
+    :arg identities: Mapping of every user ID in the content
+        source to the Workplace Search user it belongs to
+    :arg delete_missing_identities: Also delete external identities which
+        aren't in ``identities``. Otherwise they're left unchanged.
+    :arg thread_count: Number of changes applied concurrently
+    :arg page_size: The number of identities per page of ``list_external_identities()``
+    :arg rate_limit: Maximum number of changes applied per second, either
+        a number or a :class:`~elastic_enterprise_search.helpers.RateLimiter`
+    :arg retry_policy: :class:`~elastic_enterprise_search.RetryPolicy` used to
+        retry a change when the server responds that it's overloaded
+    :arg dry_run: Only compute the changes without applying them
+    :arg progress: Function called with the :class:`ExternalIdentitySyncReport`
+        after each change is applied or fails
+    :arg kwargs: Additional arguments passed to every request, like ``http_auth``
+    :returns: :class:`ExternalIdentitySyncReport`
+    """
+    report = ExternalIdentitySyncReport()
+    current = {}
+    for result in client.iter_external_identities(
+        content_source_id, page_size=page_size, prefetch=True, **kwargs
+    ):
+        current[result["source_user_id"]] = result.get("user")
+
+    for source_user_id, user in identities.items():
+        report.identities += 1
+        if source_user_id not in current:
+            report.changes.append(
+                ExternalIdentityChange(source_user_id, "create", user)
+            )
+        elif current.pop(source_user_id) != user:
+            report.changes.append(ExternalIdentityChange(source_user_id, "put", user))
+        else:
+            report.unchanged += 1
+
+    # Identities left in 'current' aren't in 'identities'.
+    if delete_missing_identities:
+        for source_user_id in current:
+            report.identities += 1
+            report.changes.append(
+                ExternalIdentityChange(source_user_id, "delete", None)
+            )
+
+    if dry_run or not report.changes:
+        report._finish()
+        return report
+
+    rate_limiter = _rate_limiter(rate_limit)
+
+    def request(change):
+        if change.action == "delete":
+            return client.delete_external_identity(
+                content_source_id=content_source_id,
+                user=change.source_user_id,
+                **kwargs
+            )
+        body = {"source_user_id": change.source_user_id, "user": change.user}
+        if change.action == "create":
+            return client.create_external_identity(
+                content_source_id=content_source_id, body=body, **kwargs
+            )
+        return client.put_external_identity(
+            content_source_id=content_source_id,
+            user=change.source_user_id,
+            body=body,
+            **kwargs
+        )
+
+    def apply_change(change):
+        try:
+            _call_with_retry(lambda: request(change), retry_policy, rate_limiter)
+        except TransportError as e:
+            return e
+        return None
+
+    _apply_changes(report, apply_change, thread_count, progress)
+    return report
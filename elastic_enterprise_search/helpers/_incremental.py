@@ -0,0 +1,471 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+from collections import deque
+from itertools import islice
+
+from elastic_transport import TransportError
+from six import ensure_binary, string_types, text_type
+
+from .._utils import SKIP_IN_PATH
+from ._bulk import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_CHUNK_BYTES, _send_chunk
+from ._hash_store import (
+    DocumentHashStore,
+    _changed_fields,
+    _document_hash,
+    _field_hashes,
+)
+from ._sync import _call_with_retry, _Report
+
+__all__ = ["DocumentSyncReport", "sync_documents", "sync_engine_documents"]
+
+# Number of documents whose hashes are looked up at once.
+_LOOKUP_BATCH_SIZE = 500
+# Number of hashes written to the store per transaction.
+_STORE_BATCH_SIZE = 1000
+
+
+class DocumentSyncReport(_Report):
+    """Outcome of :func:`sync_documents` and :func:`sync_engine_documents`.
+
+    :ivar documents: Number of documents compared
+    :ivar unchanged: Number of documents which didn't change since the last sync
+    :ivar indexed: Number of new or changed documents indexed as a whole
+    :ivar updated: Number of changed documents updated with only their changed fields
+    :ivar deleted: Number of documents deleted because they disappeared
+    :ivar failures: List of ``(document_id, error)`` for every document which
+        failed to be indexed or deleted. ``error`` is either the list of
+        errors from the document's result or the error from the server.
+    :ivar duration: Number of seconds the sync took so far
+    """
+
+    def __init__(self):
+        super(DocumentSyncReport, self).__init__()
+        self.documents = 0
+        self.unchanged = 0
+        self.indexed = 0
+        self.updated = 0
+        self.deleted = 0
+
+    def _summary_rows(self):
+        yield "documents", self.documents
+        yield "unchanged", self.unchanged
+        yield "indexed", self.indexed
+        yield "updated", self.updated
+        yield "deleted", self.deleted
+        yield "failed", len(self.failures)
+
+    def _failure_lines(self):
+        for document_id, error in self.failures:
+            yield "failed to sync %r: %s" % (document_id, error)
+
+    def __repr__(self):
+        return (
+            "<%s documents=%d unchanged=%d indexed=%d "
+            "updated=%d deleted=%d failures=%d>"
+            % (
+                type(self).__name__,
+                self.documents,
+                self.unchanged,
+                self.indexed,
+                self.updated,
+                self.deleted,
+                len(self.failures),
+            )
+        )
+
+
+# Counter of the report for the documents sent with each action.
+_ACTION_COUNTERS = {"index": "indexed", "put": "updated"}
+
+
+class _HashWriter(object):
+    """Buffers the hashes of indexed documents and
+    writes them to the store in batches
+    """
+
+    def __init__(self, store, namespace):
+        self.store = store
+        self.namespace = namespace
+        self.buffer = []
+
+    def add(self, document_id, hash_):
+        self.buffer.append((document_id, hash_))
+        if len(self.buffer) >= _STORE_BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.store.update(self.namespace, self.buffer)
+            self.buffer = []
+
+
+def _document_id(document):
+    document_id = document.get("id")
+    if document_id in SKIP_IN_PATH:
+        raise ValueError("Every document must have an 'id' to be synced")
+    return text_type(document_id)
+
+
+def _compare_documents(documents, store, namespace, serializer, report):
+    """Yields '(document_id, document, previous hash, digest)' for every
+    document whose digest differs from the start of its stored hash.
+    Hashes are looked up in batches and every compared document is
+    marked as seen.
+    """
+    documents = iter(documents)
+    while True:
+        batch = list(islice(documents, _LOOKUP_BATCH_SIZE))
+        if not batch:
+            break
+        ids = [_document_id(document) for document in batch]
+        previous = store.lookup(namespace, ids)
+        store._mark_seen(namespace, ids)
+
+        for document_id, document in zip(ids, batch):
+            report.documents += 1
+            digest = _document_hash(document, serializer)
+            previous_hash = previous.get(document_id)
+            if previous_hash is not None and previous_hash[: len(digest)] == digest:
+                report.unchanged += 1
+            else:
+                yield document_id, document, previous_hash, digest
+
+
+def _chunk_changes(changes, serializer, chunk_size, max_chunk_bytes):
+    """Splits an iterable of '(action, document_id, hash, body)' changes
+    into chunks of a single action which fit within both 'chunk_size' and
+    'max_chunk_bytes'. Yields tuples of (action, [(document_id, hash)],
+    serialized bodies).
+    """
+    chunks = {}
+    for action, document_id, hash_, body in changes:
+        data = serializer.dumps(body)
+        # Account for the ',' separator between documents.
+        data_bytes = len(ensure_binary(data, errors="surrogatepass")) + 1
+
+        items, chunk_data, chunk_bytes = chunks.get(action, ([], [], 2))
+        if items and (
+            len(items) >= chunk_size or chunk_bytes + data_bytes > max_chunk_bytes
+        ):
+            yield action, items, chunk_data
+            items, chunk_data, chunk_bytes = [], [], 2
+
+        items.append((document_id, hash_))
+        chunk_data.append(data)
+        chunks[action] = (items, chunk_data, chunk_bytes + data_bytes)
+
+    for action, (items, chunk_data, _) in sorted(chunks.items()):
+        yield action, items, chunk_data
+
+
+def _send_changes(chunks, apis, thread_count, retry_policy, writer, report):
+    """Sends chunks of changes from a pool of threads and stores the
+    hash of every document once the server accepted it.
+    """
+
+    def send(chunk):
+        action, _, data = chunk
+        try:
+            return _send_chunk(apis[action], data, retry_policy, None)
+        except TransportError as e:
+            return e
+
+    def record(chunk, result):
+        action, items, _ = chunk
+        resp = result.get()
+        if isinstance(resp, TransportError):
+            report.failures.extend((document_id, resp) for document_id, _ in items)
+            return
+        for (document_id, hash_), result in zip(items, resp):
+            if result.get("errors"):
+                report.failures.append((document_id, result["errors"]))
+            else:
+                writer.add(document_id, hash_)
+                counter = _ACTION_COUNTERS[action]
+                setattr(report, counter, getattr(report, counter) + 1)
+
+    from multiprocessing.pool import ThreadPool
+
+    # Chunks are submitted only as fast as their results are
+    # recorded so 'documents' isn't consumed ahead of the threads.
+    max_pending = max(thread_count, 1) * 2
+    pending = deque()
+    pool = ThreadPool(thread_count)
+    try:
+        for chunk in chunks:
+            pending.append((chunk, pool.apply_async(send, (chunk,))))
+            if len(pending) >= max_pending:
+                record(*pending.popleft())
+        while pending:
+            record(*pending.popleft())
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _delete_documents(
+    delete_api, document_ids, chunk_size, retry_policy, store, namespace, report
+):
+    """Deletes documents in chunks and removes their hashes from the store"""
+    for i in range(0, len(document_ids), chunk_size):
+        ids = document_ids[i : i + chunk_size]  # noqa: E203
+        try:
+            _call_with_retry(lambda: delete_api(ids), retry_policy, None)
+        except TransportError as e:
+            report.failures.extend((document_id, e) for document_id in ids)
+            continue
+        # Documents which didn't exist anymore are gone all the same.
+        store.delete(namespace, ids)
+        report.deleted += len(ids)
+
+
+def _sync(
+    store,
+    namespace,
+    documents,
+    serializer,
+    plan_change,
+    apis,
+    delete_api,
+    delete_missing,
+    thread_count,
+    chunk_size,
+    max_chunk_bytes,
+    retry_policy,
+):
+    """Compares 'documents' to their stored hashes, sends the change
+    returned by 'plan_change()' for every changed document and deletes
+    the documents which disappeared if 'delete_missing' is set. Every
+    stored hash starts with the digest of the document's content.
+    """
+    own_store = isinstance(store, string_types)
+    if own_store:
+        store = DocumentHashStore(store)
+
+    report = DocumentSyncReport()
+    writer = _HashWriter(store, namespace)
+    # Forget documents seen by an earlier sync which didn't finish.
+    store._forget_seen(namespace)
+    try:
+        changes = (
+            plan_change(document_id, document, previous_hash, digest)
+            for document_id, document, previous_hash, digest in _compare_documents(
+                documents, store, namespace, serializer, report
+            )
+        )
+        chunks = _chunk_changes(changes, serializer, chunk_size, max_chunk_bytes)
+        try:
+            _send_changes(chunks, apis, thread_count, retry_policy, writer, report)
+        finally:
+            writer.flush()
+
+        # Documents which weren't seen aren't in 'documents' anymore.
+        if delete_missing:
+            _delete_documents(
+                delete_api,
+                store._unseen(namespace),
+                chunk_size,
+                retry_policy,
+                store,
+                namespace,
+                report,
+            )
+        return report
+    finally:
+        report._finish()
+        store._forget_seen(namespace)
+        if own_store:
+            store.close()
+
+
+def sync_documents(
+    client,
+    content_source_id,
+    documents,
+    store,
+    delete_missing=True,
+    thread_count=1,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    max_chunk_bytes=DEFAULT_MAX_CHUNK_BYTES,
+    retry_policy=None,
+    **kwargs
+):
+    """Incrementally syncs the documents of a Workplace Search custom
+    content source so only what changed since the last sync is sent.
+
+    The hash of every document's content is kept in a
+    :class:`~elastic_enterprise_search.helpers.DocumentHashStore`. Documents
+    whose hash is unchanged aren't sent, new and changed documents are
+    indexed in chunks with ``index_documents()`` and documents which were
+    synced before but aren't in ``documents`` anymore are deleted with
+    ``delete_documents()``. The hash of a document is only stored once
+    the server accepted it so documents which failed are sent again by
+    the next sync.
+
+    .. code-block:: python
+
+        with DocumentHashStore("documents.sqlite3") as store:
+            report = sync_documents(workplace_search, content_source_id, documents, store)
+        print(report.summary())
+
+    :arg client: :class:`~elastic_enterprise_search.WorkplaceSearch` instance to use
+    :arg content_source_id: Unique ID for a Custom API source
+    :arg documents: Iterable of every document of the content source,
+        each document must have an ``id``
+    :arg store: :class:`~elastic_enterprise_search.helpers.DocumentHashStore`
+        or the path of its SQLite database file
+    :arg delete_missing: Delete documents synced before which aren't
+        in ``documents``. Otherwise they're left in the content source.
+    :arg thread_count: Number of chunks to send concurrently
+    :arg chunk_size: Number of documents to send in a single request
+    :arg max_chunk_bytes: Maximum size in bytes of a single request body
+    :arg retry_policy: :class:`~elastic_enterprise_search.RetryPolicy` used to
+        retry a request when the server responds that it's overloaded
+    :arg kwargs: Additional arguments passed to every request, like ``http_auth``
+    :returns: :class:`DocumentSyncReport`
+    """
+    if content_source_id in SKIP_IN_PATH:
+        raise ValueError("Empty value passed for a required argument")
+    if chunk_size < 1:
+        raise ValueError("'chunk_size' must be greater than zero")
+    serializer = client.transport.serializer
+
+    def plan_change(document_id, document, previous_hash, digest):
+        return "index", document_id, digest, document
+
+    def index_api(data):
+        # Workplace Search wraps the per-document results in an object
+        return client.index_documents(
+            content_source_id=content_source_id,
+            documents="[%s]" % ",".join(data),
+            **kwargs
+        )["results"]
+
+    return _sync(
+        store,
+        "workplace_search/%s" % content_source_id,
+        documents,
+        serializer,
+        plan_change,
+        {"index": index_api},
+        lambda ids: client.delete_documents(
+            content_source_id=content_source_id, document_ids=ids, **kwargs
+        ),
+        delete_missing,
+        thread_count,
+        chunk_size,
+        max_chunk_bytes,
+        retry_policy,
+    )
+
+
+def sync_engine_documents(
+    client,
+    engine_name,
+    documents,
+    store,
+    delete_missing=True,
+    partial_updates=True,
+    thread_count=1,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    max_chunk_bytes=DEFAULT_MAX_CHUNK_BYTES,
+    retry_policy=None,
+    **kwargs
+):
+    """Incrementally syncs the documents of an App Search
+    engine so only what changed since the last sync is sent.
+
+    A digest of every document and of each of its fields is kept in a
+    :class:`~elastic_enterprise_search.helpers.DocumentHashStore`. Documents
+    whose fields are unchanged aren't sent. New documents and documents which
+    gained or lost fields are indexed as a whole with ``index_documents()``,
+    documents with the same fields but different values are updated with
+    ``put_documents()`` which only sends the changed fields. Documents which
+    were synced before but aren't in ``documents`` anymore are deleted with
+    ``delete_documents()``. The hashes of a document are only stored once
+    the server accepted it so documents which failed are sent again by
+    the next sync.
+
+    .. code-block:: python
+
+        with DocumentHashStore("products.sqlite3") as store:
+            report = sync_engine_documents(app_search, "products", products, store)
+        print(report.summary())
+
+    :arg client: :class:`~elastic_enterprise_search.AppSearch` instance to use
+    :arg engine_name: Name of the engine
+    :arg documents: Iterable of every document of the engine,
+        each document must have an ``id``
+    :arg store: :class:`~elastic_enterprise_search.helpers.DocumentHashStore`
+        or the path of its SQLite database file
+    :arg delete_missing: Delete documents synced before which aren't
+        in ``documents``. Otherwise they're left in the engine.
+    :arg partial_updates: Send only the changed fields of documents whose
+        fields didn't change with ``put_documents()``. Otherwise every
+        changed document is indexed as a whole.
+    :arg thread_count: Number of chunks to send concurrently
+    :arg chunk_size: Number of documents to send in a single request
+    :arg max_chunk_bytes: Maximum size in bytes of a single request body
+    :arg retry_policy: :class:`~elastic_enterprise_search.RetryPolicy` used to
+        retry a request when the server responds that it's overloaded
+    :arg kwargs: Additional arguments passed to every request, like ``http_auth``
+    :returns: :class:`DocumentSyncReport`
+    """
+    if engine_name in SKIP_IN_PATH:
+        raise ValueError("Empty value passed for a required argument")
+    if chunk_size < 1:
+        raise ValueError("'chunk_size' must be greater than zero")
+    serializer = client.transport.serializer
+
+    def plan_change(document_id, document, previous_hash, digest):
+        # The digests of every field are only needed for changed documents.
+        hash_ = digest + _field_hashes(document, serializer)
+        if partial_updates and previous_hash is not None:
+            fields = _changed_fields(document, previous_hash, hash_)
+            if fields is not None:
+                body = dict((field, document[field]) for field in fields)
+                body["id"] = document["id"]
+                return "put", document_id, hash_, body
+        return "index", document_id, hash_, document
+
+    def index_api(data):
+        return client.index_documents(
+            engine_name=engine_name, documents="[%s]" % ",".join(data), **kwargs
+        )
+
+    def put_api(data):
+        return client.put_documents(
+            engine_name=engine_name, documents="[%s]" % ",".join(data), **kwargs
+        )
+
+    return _sync(
+        store,
+        "app_search/%s" % engine_name,
+        documents,
+        serializer,
+        plan_change,
+        {"index": index_api, "put": put_api},
+        lambda ids: client.delete_documents(
+            engine_name=engine_name, document_ids=ids, **kwargs
+        ),
+        delete_missing,
+        thread_count,
+        chunk_size,
+        max_chunk_bytes,
+        retry_policy,
+    )
@@ -0,0 +1,138 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import threading
+import time
+
+from .._utils import monotonic
+
+__all__ = ["AdaptiveConcurrencyLimiter", "RateLimiter"]
+
+
+class AdaptiveConcurrencyLimiter(object):
+    """Limits the number of concurrent requests with additive
+    increase / multiplicative decrease (AIMD) like TCP congestion
+    control. Every throttled request multiplies the limit by
+    ``decrease_factor``. Once as many requests as the current limit
+    succeed in a row the limit is increased by one, up to ``max_limit``.
+
+    Requests that were already in flight when the limit was decreased
+    don't decrease it again, so a burst of throttled responses to
+    concurrent requests only counts as a single decrease.
+
+    Helpers also count throttled responses retried by the client's
+    ``retry_policy``. Responses retried by the Transport because their
+    status is in its ``retry_on_status`` (by default 503 unless the
+    client has a ``retry_policy``) aren't seen until the Transport gives up.
+
+    :arg max_limit: Maximum and initial number of concurrent requests
+    :arg min_limit: Minimum number of concurrent requests
+    :arg decrease_factor: Factor the limit is multiplied by when throttled
+    """
+
+    def __init__(self, max_limit, min_limit=1, decrease_factor=0.5):
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError(
+                "'min_limit' must be at least 1 and not more than 'max_limit'"
+            )
+        if not 0 < decrease_factor < 1:
+            raise ValueError("'decrease_factor' must be between 0 and 1")
+
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.decrease_factor = decrease_factor
+        self.limit = max_limit
+
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._successes = 0
+        # Sequence numbers of requests, used to ignore throttled
+        # requests which started before the last decrease.
+        self._started = 0
+        self._last_decrease = 0
+
+    @property
+    def in_flight(self):
+        """Number of requests currently holding a slot"""
+        return self._in_flight
+
+    def acquire(self):
+        """Waits for a free slot and returns a token
+        which must be passed to :meth:`release`.
+        """
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+            self._started += 1
+            return self._started
+
+    def release(self, token, throttled=False):
+        """Frees the slot of a finished request. ``throttled``
+        should be ``True`` if the server rejected the request
+        because it's overloaded.
+        """
+        with self._cond:
+            self._in_flight -= 1
+            if throttled:
+                if token > self._last_decrease:
+                    self.limit = max(
+                        self.min_limit, int(self.limit * self.decrease_factor)
+                    )
+                    self._last_decrease = self._started
+                    self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.max_limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+
+class RateLimiter(object):
+    """Limits requests to ``rate`` per second. Up to ``burst`` requests
+    may be sent at once after a pause, after that requests are spaced
+    evenly. A single limiter can be shared between threads and helpers
+    to limit all of their requests together.
+
+    :arg rate: Maximum number of requests per second
+    :arg burst: Number of requests which may be sent without waiting
+    """
+
+    def __init__(self, rate, burst=1):
+        if rate <= 0:
+            raise ValueError("'rate' must be greater than zero")
+        if burst < 1:
+            raise ValueError("'burst' must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        # Time at which the next request would be sent if
+        # requests were spaced evenly without any bursts.
+        self._next = 0.0
+
+    def acquire(self):
+        """Waits until another request may be sent"""
+        interval = 1.0 / self.rate
+        with self._lock:
+            now = monotonic()
+            next_request = max(self._next, now)
+            wait = next_request - (self.burst - 1) * interval - now
+            self._next = next_request + interval
+        if wait > 0:
+            time.sleep(wait)
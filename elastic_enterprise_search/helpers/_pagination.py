@@ -0,0 +1,132 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+from six.moves.queue import Queue
+
+__all__ = ["iter_pages"]
+
+
+def iter_pages(list_api, page_size=None, prefetch=False, **kwargs):
+    """Lazily iterates over every page of a paginated ``list_*`` API
+    by following ``meta.page.total_pages`` in each response.
+
+    .. code-block:: python
+
+        for page in iter_pages(app_search.list_documents, engine_name="engine"):
+            for document in page["results"]:
+                ...
+
+    :arg list_api: Client method which accepts ``current_page``
+        and ``page_size``, for example ``AppSearch.list_documents``
+    :arg page_size: The number of results per page
+    :arg prefetch: Request the next page in a background thread
+        while the current page is being processed
+    :arg kwargs: Additional arguments passed to ``list_api``
+    """
+
+    def fetch_page(current_page):
+        return list_api(current_page=current_page, page_size=page_size, **kwargs)
+
+    from multiprocessing.pool import ThreadPool
+
+    pool = ThreadPool(1) if prefetch else None
+    try:
+        current_page = 1
+        resp = fetch_page(current_page)
+        while True:
+            has_next_page = (
+                bool(resp["results"])
+                and current_page < resp["meta"]["page"]["total_pages"]
+            )
+            next_resp = None
+            if pool is not None and has_next_page:
+                next_resp = pool.apply_async(fetch_page, (current_page + 1,))
+
+            yield resp
+
+            if not has_next_page:
+                break
+            current_page += 1
+            if next_resp is not None:
+                resp = next_resp.get()
+            else:
+                resp = fetch_page(current_page)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+
+def _iter_pages_parallel(
+    list_api, thread_count, preserve_order=True, page_size=None, **kwargs
+):
+    """Iterates over every page of a paginated ``list_*`` API by requesting
+    pages concurrently from a pool of threads once the total number of pages
+    is known from the first page. At most ``thread_count * 2`` pages are
+    in-flight or buffered at any time regardless of how slowly they're consumed.
+    """
+
+    def fetch_page(current_page):
+        try:
+            resp = list_api(current_page=current_page, page_size=page_size, **kwargs)
+            return current_page, resp, None
+        except Exception as e:
+            return current_page, None, e
+
+    _, resp, error = fetch_page(1)
+    if error is not None:
+        raise error
+    yield resp
+
+    total_pages = resp["meta"]["page"]["total_pages"]
+    if not resp["results"] or total_pages <= 1:
+        return
+
+    window = max(thread_count, 1) * 2
+    finished = Queue()
+    buffered = {}
+    next_page_to_submit = next_page_to_yield = 2
+
+    from multiprocessing.pool import ThreadPool
+
+    pool = ThreadPool(thread_count)
+    try:
+        while next_page_to_yield <= total_pages:
+            while (
+                next_page_to_submit <= total_pages
+                and next_page_to_submit - next_page_to_yield < window
+            ):
+                pool.apply_async(
+                    fetch_page, (next_page_to_submit,), callback=finished.put
+                )
+                next_page_to_submit += 1
+
+            current_page, resp, error = finished.get()
+            if error is not None:
+                raise error
+
+            if preserve_order:
+                buffered[current_page] = resp
+                while next_page_to_yield in buffered:
+                    yield buffered.pop(next_page_to_yield)
+                    next_page_to_yield += 1
+            else:
+                yield resp
+                next_page_to_yield += 1
+    finally:
+        pool.terminate()
+        pool.join()
@@ -0,0 +1,191 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+from collections import namedtuple
+
+from elastic_transport import TransportError
+
+from ._sync import _apply_changes, _call_with_retry, _rate_limiter, _SyncReport
+
+__all__ = ["PermissionChange", "PermissionSyncReport", "sync_permissions"]
+
+
+class PermissionChange(
+    namedtuple("PermissionChange", ["user", "action", "permissions"])
+):
+    """A single request needed to give a user their desired permissions.
+
+    :arg user: The username
+    :arg action: ``"add"`` to add permissions to the user's existing ones,
+        ``"remove"`` to remove some of them, or ``"put"`` to replace them
+    :arg permissions: Sorted list of permissions sent with the request
+    """
+
+    __slots__ = ()
+
+
+class PermissionSyncReport(_SyncReport):
+    """Progress and outcome of :func:`sync_permissions`.
+
+    :ivar users: Number of users compared
+    :ivar unchanged: Number of users which already had their desired permissions
+    :ivar changes: List of every :class:`PermissionChange` to apply
+    :ivar added: Number of ``"add"`` changes applied
+    :ivar removed: Number of ``"remove"`` changes applied
+    :ivar replaced: Number of ``"put"`` changes applied
+    :ivar failures: List of ``(change, error)`` for every change
+        which failed with an error from the server
+    :ivar duration: Number of seconds the sync took so far
+    """
+
+    _ACTIONS = (("add", "added"), ("remove", "removed"), ("put", "replaced"))
+    _NOUN = "users"
+
+    def __init__(self):
+        super(PermissionSyncReport, self).__init__()
+        self.users = 0
+
+
+def _permission_change(user, current, desired):
+    """Returns the single request which turns the 'current'
+    permissions into 'desired' or 'None' if they're equal.
+    """
+    added = desired - current
+    removed = current - desired
+    if added and removed:
+        return PermissionChange(user, "put", sorted(desired))
+    elif added:
+        return PermissionChange(user, "add", sorted(added))
+    elif removed:
+        return PermissionChange(user, "remove", sorted(removed))
+    return None
+
+
+def sync_permissions(
+    client,
+    content_source_id,
+    permissions,
+    remove_missing_users=False,
+    thread_count=4,
+    page_size=100,
+    rate_limit=None,
+    retry_policy=None,
+    dry_run=False,
+    progress=None,
+    **kwargs
+):
+    """Gives every user of a content source their desired document-level
+    permissions while sending as few requests as possible.
+
+    The current permissions are listed page by page with
+    :meth:`~elastic_enterprise_search.WorkplaceSearch.list_permissions`
+    and compared to ``permissions``. Users whose permissions already match
+    aren't sent any request, for every other user a single request either
+    adds the missing permissions, removes the extra permissions, or if both
+    are needed replaces all of them. Changes are applied concurrently
+    by a pool of threads.
+
+    .. code-block:: python
+
+        report = sync_permissions(
+            workplace_search,
+            content_source_id,
+            {"alice": ["engineering", "all-staff"], "bob": ["all-staff"]},
+            progress=lambda report: print(report.done, len(report.changes)),
+        )
+        for change, error in report.failures:
+            print(change.user, error)
+
+    A change that fails with an error from the server is recorded in
+    :attr:`PermissionSyncReport.failures` and doesn't stop the others.
+
+    :arg client: :class:`~elastic_enterprise_search.WorkplaceSearch` instance to use
+    :arg content_source_id: Unique ID for a Custom API source
+    :arg permissions: Mapping of every username to an iterable
+        of the permissions they should have
+    :arg remove_missing_users: Also remove every permission of users which
+        have permissions but aren't in ``permissions``. Otherwise those
+        users are left unchanged.
+    :arg thread_count: Number of changes applied concurrently
+    :arg page_size: The number of users per page of ``list_permissions()``
+    :arg rate_limit: Maximum number of changes applied per second, either
+        a number or a :class:`~elastic_enterprise_search.helpers.RateLimiter`
+    :arg retry_policy: :class:`~elastic_enterprise_search.RetryPolicy` used to
+        retry a change when the server responds that it's overloaded
+    :arg dry_run: Only compute the changes without applying them
+    :arg progress: Function called with the :class:`PermissionSyncReport`
+        after each change is applied or fails
+    :arg kwargs: Additional arguments passed to every request, like ``http_auth``
+    :returns: :class:`PermissionSyncReport`
+    """
+    report = PermissionSyncReport()
+    current = {}
+    for result in client.iter_permissions(
+        content_source_id, page_size=page_size, prefetch=True, **kwargs
+    ):
+        current[result["user"]] = frozenset(result.get("permissions") or ())
+
+    for user, desired in permissions.items():
+        change = _permission_change(
+            user, current.pop(user, frozenset()), frozenset(desired)
+        )
+        report.users += 1
+        if change is None:
+            report.unchanged += 1
+        else:
+            report.changes.append(change)
+
+    # Users left in 'current' aren't in 'permissions'.
+    if remove_missing_users:
+        for user, existing in current.items():
+            report.users += 1
+            if existing:
+                report.changes.append(
+                    PermissionChange(user, "remove", sorted(existing))
+                )
+            else:
+                report.unchanged += 1
+
+    if dry_run or not report.changes:
+        report._finish()
+        return report
+
+    apis = {
+        "add": client.add_user_permissions,
+        "remove": client.remove_user_permissions,
+        "put": client.put_user_permissions,
+    }
+    rate_limiter = _rate_limiter(rate_limit)
+
+    def apply_change(change):
+        try:
+            _call_with_retry(
+                lambda: apis[change.action](
+                    content_source_id=content_source_id,
+                    user=change.user,
+                    body={"permissions": change.permissions},
+                    **kwargs
+                ),
+                retry_policy,
+                rate_limiter,
+            )
+        except TransportError as e:
+            return e
+        return None
+
+    _apply_changes(report, apply_change, thread_count, progress)
+    return report
@@ -0,0 +1,176 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""Pieces shared by the helpers which reconcile a content source
+or an engine with a desired state.
+"""
+
+from collections import deque
+
+from elastic_transport import TransportError
+
+from .._utils import monotonic
+from ._limiter import RateLimiter
+
+
+class _Report(object):
+    """Base class of the reports returned by the sync helpers
+    which can write a plain text summary. Subclasses implement
+    '_summary_rows()' and '_failure_lines()'.
+    """
+
+    def __init__(self):
+        self.failures = []
+        self.duration = 0.0
+        self._start = monotonic()
+
+    def _finish(self):
+        self.duration = monotonic() - self._start
+
+    def summary(self):
+        """Returns a human readable summary of the
+        changes and every failure as a string
+        """
+        rows = list(self._summary_rows())
+        rows.append(("duration", "%.1fs" % self.duration))
+        lines = ["%-12s %s" % ("%s:" % name, value) for name, value in rows]
+        lines.extend(self._failure_lines())
+        return "\n".join(lines) + "\n"
+
+    def write_summary(self, output):
+        """Writes :meth:`summary` to a text file object or path"""
+        if hasattr(output, "write"):
+            output.write(self.summary())
+        else:
+            with open(output, "w") as f:
+                f.write(self.summary())
+
+
+class _SyncReport(_Report):
+    """Base class of the reports of helpers which apply a list of
+    changes. Subclasses set '_ACTIONS' to the pairs of (action, attribute)
+    counting the changes applied for each action and '_NOUN' to what's compared.
+    """
+
+    _ACTIONS = ()
+    _NOUN = None
+
+    def __init__(self):
+        super(_SyncReport, self).__init__()
+        self.unchanged = 0
+        self.changes = []
+        for _, attr in self._ACTIONS:
+            setattr(self, attr, 0)
+
+    @property
+    def applied(self):
+        """Number of changes applied"""
+        return sum(getattr(self, attr) for _, attr in self._ACTIONS)
+
+    @property
+    def done(self):
+        """Number of changes either applied or failed"""
+        return self.applied + len(self.failures)
+
+    def _record(self, change, error):
+        if error is not None:
+            self.failures.append((change, error))
+        else:
+            attr = dict(self._ACTIONS)[change.action]
+            setattr(self, attr, getattr(self, attr) + 1)
+        self._finish()
+
+    def _summary_rows(self):
+        yield self._NOUN, getattr(self, self._NOUN)
+        yield "unchanged", self.unchanged
+        for _, attr in self._ACTIONS:
+            yield attr, getattr(self, attr)
+        yield "failed", len(self.failures)
+        if len(self.changes) > self.done:
+            yield "not applied", len(self.changes) - self.done
+
+    def _failure_lines(self):
+        for change, error in self.failures:
+            yield "failed to %s %r: %s" % (change.action, change[0], error)
+
+    def __repr__(self):
+        return "<%s %s=%d unchanged=%d changes=%d applied=%d failures=%d>" % (
+            type(self).__name__,
+            self._NOUN,
+            getattr(self, self._NOUN),
+            self.unchanged,
+            len(self.changes),
+            self.applied,
+            len(self.failures),
+        )
+
+
+def _rate_limiter(rate_limit):
+    """Returns the 'RateLimiter' for the 'rate_limit' parameter
+    which is either a number of requests per second or a limiter.
+    """
+    if rate_limit is None or isinstance(rate_limit, RateLimiter):
+        return rate_limit
+    return RateLimiter(rate_limit)
+
+
+def _call_with_retry(func, retry_policy, rate_limiter):
+    """Calls 'func' once 'rate_limiter' allows, retrying it
+    if the server is overloaded and 'retry_policy' allows.
+    """
+    retry = 0
+    while True:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            return func()
+        except TransportError as e:
+            if retry_policy is None or not retry_policy._should_retry(retry, e):
+                raise
+            retry_policy._sleep(retry, e)
+        retry += 1
+
+
+def _apply_changes(report, apply_change, thread_count, progress):
+    """Applies every change of the report from a pool of threads and
+    records whether each one succeeded. 'apply_change' is called with
+    a change and returns 'None' or the 'TransportError' it failed with.
+    """
+
+    def record(change, result):
+        report._record(change, result.get())
+        if progress is not None:
+            progress(report)
+
+    from multiprocessing.pool import ThreadPool
+
+    # Changes are submitted only as fast as their results are
+    # recorded so stopping early leaves the rest unapplied.
+    max_pending = max(thread_count, 1) * 2
+    pending = deque()
+    pool = ThreadPool(thread_count)
+    try:
+        for change in report.changes:
+            pending.append((change, pool.apply_async(apply_change, (change,))))
+            if len(pending) >= max_pending:
+                record(*pending.popleft())
+        while pending:
+            record(*pending.popleft())
+    finally:
+        pool.terminate()
+        pool.join()
+        report._finish()
@@ -75,3 +75,19 @@ def tests_impl(session):
 @nox.session(python=["2.7", "3.6", "3.7", "3.8", "3.9"])
 def test(session):
     tests_impl(session)
+
+
+@nox.session(python="3")
+def benchmark(session):
+    session.install(".[orjson]")
+    for script in (
+        "throughput",
+        "overhead",
+        "memory",
+        "serializer",
+        "format_datetime",
+        "import_time",
+        "compression",
+        "incremental_sync",
+    ):
+        session.run("python", "utils/benchmarks/%s.py" % script)
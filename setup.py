@@ -78,6 +78,8 @@ setup(
     python_requires=">=2.7, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*, !=3.4.*, !=3.5.*",
     extras_require={
         "requests": ["requests>=2.4, <3"],
+        "async": ["aiohttp>=3,<4; python_version>='3.6'"],
+        "orjson": ["orjson>=3; python_version>='3.6'"],
         "develop": [
             "pytest",
             "pytest-cov",
@@ -86,6 +88,9 @@ setup(
             "pytest-freezegun",
             "mock",
             "requests",
+            "aiohttp; python_version>='3.6'",
+            "pytest-asyncio; python_version>='3.6'",
+            "pandas; python_version>='3.6'",
         ],
     },
     classifiers=[
@@ -0,0 +1,405 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import asyncio
+import inspect
+import json
+
+import pytest
+from aiohttp import web
+from elastic_transport import Connection
+
+from elastic_enterprise_search import (
+    AppSearch,
+    AsyncAppSearch,
+    AsyncEnterpriseSearch,
+    AsyncWorkplaceSearch,
+    EnterpriseSearch,
+    NotFoundError,
+    ResponseCache,
+    RetryPolicy,
+    WorkplaceSearch,
+)
+from elastic_enterprise_search._utils import DEFAULT
+
+pytestmark = pytest.mark.asyncio
+
+
+class AsyncDummyConnection(Connection):
+    def __init__(self, **kwargs):
+        self.status, self.data = kwargs.pop("status", 200), kwargs.pop("data", "{}")
+        self.headers = kwargs.pop("headers", {})
+        self.calls = []
+        self.closed = False
+        super(AsyncDummyConnection, self).__init__(**kwargs)
+
+    async def perform_request(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.status, self.headers, self.data
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize(
+    ["sync_class", "async_class"],
+    [
+        (AppSearch, AsyncAppSearch),
+        (EnterpriseSearch, AsyncEnterpriseSearch),
+        (WorkplaceSearch, AsyncWorkplaceSearch),
+    ],
+)
+async def test_async_client_has_same_apis(sync_class, async_class):
+    def public_methods(cls):
+        return {
+            name
+            for name, _ in inspect.getmembers(cls, predicate=inspect.isfunction)
+            if not name.startswith("_")
+        }
+
+    assert public_methods(sync_class) == public_methods(async_class)
+    for name in public_methods(sync_class) - {
+        "create_signed_search_key",
+        "oauth_authorize_url",
+        "pool_stats",
+    }:
+        # iter_*() methods return async generators
+        if not name.startswith("iter_"):
+            assert inspect.iscoroutinefunction(getattr(async_class, name)), name
+
+
+async def test_async_perform_request():
+    client = AsyncEnterpriseSearch(
+        connection_class=AsyncDummyConnection,
+        meta_header=False,
+        http_auth=("user", "pass"),
+    )
+    resp = await client.get_version(request_timeout=3)
+    assert resp == {}
+
+    calls = client.transport.get_connection().calls
+    assert calls == [
+        (
+            ("GET", "/api/ent/v1/internal/version", None),
+            {
+                "headers": {
+                    "user-agent": client._user_agent_header,
+                    "authorization": "Basic dXNlcjpwYXNz",
+                },
+                "ignore_status": (),
+                "request_timeout": 3,
+            },
+        )
+    ]
+
+
+async def test_async_sub_clients_share_transport():
+    client = AsyncEnterpriseSearch(connection_class=AsyncDummyConnection)
+    assert client.app_search.transport is client.transport
+    assert client.workplace_search.transport is client.transport
+
+    client.app_search.http_auth = "private-key"
+    await client.app_search.search(engine_name="engine", body={"query": "tree"})
+
+    calls = client.transport.get_connection().calls
+    assert calls[-1][0] == (
+        "POST",
+        "/api/as/v1/engines/engine/search",
+        b'{"query":"tree"}',
+    )
+    assert calls[-1][1]["headers"]["authorization"] == "Bearer private-key"
+
+
+async def test_async_index_documents_columnar():
+    np = pytest.importorskip("numpy")
+
+    client = AsyncAppSearch(connection_class=AsyncDummyConnection, meta_header=False)
+    await client.index_documents(
+        engine_name="engine",
+        documents={
+            "id": np.array(["1", "2"]),
+            "created_at": np.array(["2020-01-01", "2020-01-02"], dtype="datetime64[s]"),
+        },
+    )
+
+    calls = client.transport.get_connection().calls
+    documents = json.loads(calls[-1][0][2])
+    assert [doc["id"] for doc in documents] == ["1", "2"]
+    assert documents[0]["created_at"].startswith("2020-01-01T00:00:00")
+
+
+async def test_async_retry_policy(monkeypatch):
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+    class ThrottledConnection(AsyncDummyConnection):
+        async def perform_request(self, *args, **kwargs):
+            self.calls.append((args, kwargs))
+            if len(self.calls) < 3:
+                self._raise_error(429, {"Retry-After": "2"}, "{}")
+            return self.status, self.headers, self.data
+
+    client = AsyncAppSearch(
+        connection_class=ThrottledConnection,
+        retry_policy=RetryPolicy(),
+    )
+    assert await client.index_documents(engine_name="engine", documents=[]) == {}
+    assert len(client.transport.get_connection().calls) == 3
+    assert sleeps == [2.0, 2.0]
+
+
+async def test_async_oauth_exchange_for_access_token():
+    client = AsyncWorkplaceSearch(
+        connection_class=AsyncDummyConnection, meta_header=False, http_auth="token"
+    )
+    await client.oauth_exchange_for_access_token(
+        client_id="client-id",
+        client_secret="client-secret",
+        redirect_uri="redirect-uri",
+        code="code",
+    )
+
+    calls = client.transport.get_connection().calls
+    assert calls == [
+        (
+            (
+                "POST",
+                "/ws/oauth/token?grant_type=authorization_code&client_id=client-id"
+                "&client_secret=client-secret&redirect_uri=redirect-uri&code=code",
+                None,
+            ),
+            {
+                "headers": {"user-agent": client._user_agent_header},
+                "ignore_status": (),
+                "request_timeout": DEFAULT,
+            },
+        )
+    ]
+
+    with pytest.raises(ValueError):
+        await client.oauth_exchange_for_access_token(
+            client_id="client-id",
+            client_secret="client-secret",
+            redirect_uri="redirect-uri",
+        )
+
+
+async def test_async_context_manager_closes_connections():
+    async with AsyncAppSearch(connection_class=AsyncDummyConnection) as client:
+        connection = client.transport.get_connection()
+    assert connection.closed
+
+
+async def test_aiohttp_connection():
+    requests = []
+
+    async def handler(request):
+        requests.append((request.method, request.path_qs, await request.read()))
+        if request.match_info["engine"] == "missing":
+            return web.json_response({"errors": ["Could not find engine."]}, status=404)
+        return web.json_response(
+            [{"id": doc["id"], "errors": []} for doc in await request.json()]
+        )
+
+    app = web.Application()
+    app.router.add_post("/api/as/v1/engines/{engine}/documents", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    try:
+        async with AsyncAppSearch(
+            "http://127.0.0.1:%d" % port, http_auth="private-key"
+        ) as client:
+            resp = await client.index_documents(
+                engine_name="engine", documents=[{"id": "1"}]
+            )
+            assert resp.status == 200
+            assert resp == [{"id": "1", "errors": []}]
+
+            with pytest.raises(NotFoundError) as e:
+                await client.index_documents(
+                    engine_name="missing", documents=[{"id": "1"}]
+                )
+            assert e.value.status == 404
+            assert e.value.message == {"errors": ["Could not find engine."]}
+    finally:
+        await runner.cleanup()
+
+    assert [(method, path) for method, path, _ in requests] == [
+        ("POST", "/api/as/v1/engines/engine/documents"),
+        ("POST", "/api/as/v1/engines/missing/documents"),
+    ]
+    assert json.loads(requests[0][2]) == [{"id": "1"}]
+
+
+async def test_aiohttp_connection_http_compress():
+    requests = []
+
+    async def handler(request):
+        requests.append(
+            (
+                request.headers.get("content-encoding"),
+                request.headers.get("accept-encoding"),
+            )
+        )
+        documents = await request.json()
+        if request.match_info["action"] == "search":
+            response = web.json_response({"results": documents})
+            response.enable_compression()
+            return response
+        return web.json_response([{"id": doc["id"], "errors": []} for doc in documents])
+
+    app = web.Application()
+    app.router.add_post("/api/as/v1/engines/engine/{action}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    documents = [{"id": str(i), "title": "National park"} for i in range(100)]
+    try:
+        async with AsyncAppSearch(
+            "http://127.0.0.1:%d" % port, http_auth="private-key", http_compress=True
+        ) as client:
+            resp = await client.index_documents(
+                engine_name="engine", documents=documents
+            )
+            assert resp == [{"id": doc["id"], "errors": []} for doc in documents]
+
+            resp = await client.search(engine_name="engine", body=documents)
+            assert resp == {"results": documents}
+    finally:
+        await runner.cleanup()
+
+    # aiohttp sends its own 'Accept-Encoding' header by default.
+    assert [content_encoding for content_encoding, _ in requests] == ["gzip", "gzip"]
+    assert requests[1][1] == "gzip"
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+async def test_async_iter_documents(prefetch):
+    class AsyncPagedConnection(AsyncDummyConnection):
+        async def perform_request(self, method, target, *args, **kwargs):
+            self.calls.append(((method, target) + args, kwargs))
+            current = len(self.calls)
+            data = {
+                "meta": {"page": {"current": current, "total_pages": 3}},
+                "results": [{"id": "%d-%d" % (current, i)} for i in range(2)],
+            }
+            return 200, {}, json.dumps(data)
+
+    client = AsyncAppSearch(connection_class=AsyncPagedConnection)
+    documents = [
+        doc["id"]
+        async for doc in client.iter_documents(engine_name="engine", prefetch=prefetch)
+    ]
+    assert documents == ["1-0", "1-1", "2-0", "2-1", "3-0", "3-1"]
+    assert [call[0][1] for call in client.transport.get_connection().calls] == [
+        "/api/as/v1/engines/engine/documents/list?page[current]=%d" % i
+        for i in (1, 2, 3)
+    ]
+
+
+async def test_async_response_cache():
+    cache = ResponseCache()
+    client = AsyncAppSearch(connection_class=AsyncDummyConnection, response_cache=cache)
+    calls = client.transport.get_connection().calls
+
+    for _ in range(2):
+        assert await client.search(engine_name="engine", body={"query": "a"}) == {}
+    assert len(calls) == 1 and len(cache) == 1
+
+    await client.index_documents(engine_name="engine", documents=[{"id": "1"}])
+    assert len(calls) == 2 and len(cache) == 0
+
+
+async def test_async_coalesce_requests():
+    release = asyncio.Event()
+
+    class SlowConnection(AsyncDummyConnection):
+        async def perform_request(self, *args, **kwargs):
+            await release.wait()
+            return await super(SlowConnection, self).perform_request(*args, **kwargs)
+
+    client = AsyncAppSearch(connection_class=SlowConnection, coalesce_requests=True)
+    tasks = [
+        asyncio.ensure_future(client.search(engine_name="engine", body={"query": "a"}))
+        for _ in range(8)
+    ]
+    # Cancelling a waiter doesn't cancel the shared request.
+    await asyncio.sleep(0)
+    tasks.pop().cancel()
+    release.set()
+    responses = await asyncio.gather(*tasks)
+
+    assert len(client.transport.get_connection().calls) == 1
+    assert all(resp == {} for resp in responses)
+    assert len(set(id(resp) for resp in responses)) == 7
+    assert client._single_flight._calls == {}
+
+
+async def test_async_coalesce_requests_leader_cancelled():
+    release = asyncio.Event()
+    cancelled = []
+
+    class SlowConnection(AsyncDummyConnection):
+        async def perform_request(self, *args, **kwargs):
+            try:
+                await release.wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return await super(SlowConnection, self).perform_request(*args, **kwargs)
+
+    client = AsyncAppSearch(connection_class=SlowConnection, coalesce_requests=True)
+    tasks = [
+        asyncio.ensure_future(client.search(engine_name="engine", body={"query": "a"}))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    # Cancelling the task which started the request
+    # doesn't cancel it for the tasks which joined it.
+    leader = tasks.pop(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*tasks) == [{}, {}]
+    assert leader.cancelled()
+    assert cancelled == []
+    assert len(client.transport.get_connection().calls) == 1
+
+    # Once every caller is cancelled the request is too.
+    release.clear()
+    tasks = [
+        asyncio.ensure_future(client.search(engine_name="engine", body={"query": "b"}))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await asyncio.sleep(0)
+    assert cancelled == [True]
+    assert client._single_flight._calls == {}
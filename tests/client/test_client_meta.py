@@ -75,3 +75,18 @@ def test_client_meta_header_type_error(client_class):
     with pytest.raises(TypeError) as e:
         client_class(meta_header=1)
     assert str(e.value) == "meta_header must be of type bool"
+
+
+def test_client_meta_header_toggle(client_class):
+    client = client_class(connection_class=DummyConnection)
+    client.perform_request("GET", "/")
+    client.meta_header = False
+    client.perform_request("GET", "/")
+    client.meta_header = True
+    client.perform_request("GET", "/", headers={"x-elastic-client-meta": "x=1"})
+
+    calls = client.transport.get_connection().calls
+    headers = [kwargs["headers"] for _, kwargs in calls]
+    assert headers[0]["x-elastic-client-meta"].startswith("ent=")
+    assert "x-elastic-client-meta" not in headers[1]
+    assert headers[2]["x-elastic-client-meta"] == headers[0]["x-elastic-client-meta"]
@@ -0,0 +1,135 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import gzip
+import io
+import json
+
+import pytest
+from elastic_transport import JSONSerializer
+
+from elastic_enterprise_search import AppSearch, EnterpriseSearch, WorkplaceSearch
+from elastic_enterprise_search._compress import DEFAULT_COMPRESS_MIN_SIZE
+from tests.conftest import DummyConnection
+
+DOCUMENTS = [{"id": str(i), "title": "National park %d" % i} for i in range(100)]
+
+
+def make_client(client_class=AppSearch, **kwargs):
+    return client_class(connection_class=DummyConnection, meta_header=False, **kwargs)
+
+
+def last_request(client):
+    args, kwargs = client.transport.get_connection().calls[-1]
+    return args[2], kwargs["headers"]
+
+
+def test_compression_disabled_by_default():
+    client = make_client()
+    client.index_documents(engine_name="engine", documents=DOCUMENTS)
+
+    body, headers = last_request(client)
+    assert json.loads(body) == DOCUMENTS
+    assert "content-encoding" not in headers
+    assert "accept-encoding" not in headers
+
+
+@pytest.mark.parametrize("http_compress", [True, 100])
+def test_compresses_large_request_bodies(http_compress):
+    client = make_client(http_compress=http_compress)
+    client.index_documents(engine_name="engine", documents=DOCUMENTS)
+
+    body, headers = last_request(client)
+    assert headers["content-encoding"] == "gzip"
+    assert json.loads(gzip.GzipFile(fileobj=io.BytesIO(body)).read()) == DOCUMENTS
+    # Responses to writes aren't requested compressed.
+    assert "accept-encoding" not in headers
+
+
+def test_small_request_bodies_not_compressed():
+    client = make_client(http_compress=True)
+    client.index_documents(engine_name="engine", documents=[{"id": "1"}])
+
+    body, headers = last_request(client)
+    assert body == b'[{"id":"1"}]'
+    assert "content-encoding" not in headers
+
+    client = make_client(http_compress=DEFAULT_COMPRESS_MIN_SIZE * 100)
+    client.index_documents(engine_name="engine", documents=DOCUMENTS)
+    assert "content-encoding" not in last_request(client)[1]
+
+
+def test_reads_accept_compressed_responses():
+    client = make_client(http_compress=True)
+
+    client.search(engine_name="engine", body={"query": "tree"})
+    body, headers = last_request(client)
+    assert body == b'{"query":"tree"}'
+    assert headers["accept-encoding"] == "gzip"
+    assert "content-encoding" not in headers
+
+    client.list_documents(engine_name="engine")
+    body, headers = last_request(client)
+    assert body is None
+    assert headers["accept-encoding"] == "gzip"
+
+    # The client's own headers aren't modified.
+    assert "accept-encoding" not in client._base_headers
+
+
+def test_compressed_bodies_are_deterministic():
+    client = make_client(http_compress=True)
+    client.index_documents(engine_name="engine", documents=DOCUMENTS)
+    client.index_documents(engine_name="engine", documents=DOCUMENTS)
+
+    calls = client.transport.get_connection().calls
+    assert calls[0][0][2] == calls[1][0][2]
+
+
+def test_compresses_workplace_search_bulk_create():
+    client = make_client(WorkplaceSearch, http_compress=True)
+    client.index_documents(content_source_id="source", documents=DOCUMENTS)
+
+    body, headers = last_request(client)
+    assert headers["content-encoding"] == "gzip"
+
+
+def test_enterprise_search_subclients_compress():
+    client = make_client(EnterpriseSearch, http_compress=100)
+    assert client.app_search._compress_min_size == 100
+    assert client.workplace_search._compress_min_size == 100
+
+    assert make_client(EnterpriseSearch).app_search._compress_min_size is None
+
+
+@pytest.mark.parametrize("http_compress", [-1, 1.5, "gzip"])
+def test_invalid_http_compress(http_compress):
+    with pytest.raises(ValueError) as e:
+        make_client(http_compress=http_compress)
+    assert str(e.value) == (
+        "'http_compress' must be a bool or the minimum number of bytes to compress"
+    )
+
+
+def test_http_compress_requires_client_serializer():
+    with pytest.raises(ValueError) as e:
+        make_client(
+            http_compress=True, serializers={"application/json": JSONSerializer()}
+        )
+    assert str(e.value) == (
+        "'http_compress' requires the client's JSONSerializer or OrjsonSerializer"
+    )
@@ -153,3 +153,38 @@ def test_auth_not_sent_with_oauth_exchange(http_auth):
             },
         )
     ]
+
+
+def test_http_auth_change_updates_headers(client_class):
+    client = client_class(http_auth="token-1", connection_class=DummyConnection)
+    client.perform_request("GET", "/")
+    client.http_auth = ("user", "pass")
+    client.perform_request("GET", "/")
+    client.http_auth = None
+    client.perform_request("GET", "/")
+
+    calls = client.transport.get_connection().calls
+    assert [kwargs["headers"].get("authorization") for _, kwargs in calls] == [
+        "Bearer token-1",
+        "Basic dXNlcjpwYXNz",
+        None,
+    ]
+
+
+def test_per_request_headers_take_precedence(client_class):
+    client = client_class(
+        http_auth="token", connection_class=DummyConnection, meta_header=False
+    )
+    client.perform_request(
+        "GET",
+        "/",
+        headers={"Authorization": "Bearer other", "User-Agent": "custom"},
+        http_auth="ignored",
+    )
+    client.perform_request("GET", "/")
+
+    calls = client.transport.get_connection().calls
+    assert [kwargs["headers"] for _, kwargs in calls] == [
+        {"authorization": "Bearer other", "user-agent": "custom"},
+        {"authorization": "Bearer token", "user-agent": client._user_agent_header},
+    ]
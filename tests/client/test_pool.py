@@ -0,0 +1,197 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import threading
+import time
+
+import pytest
+import urllib3
+from six.moves import BaseHTTPServer, socketserver
+
+from elastic_enterprise_search import (
+    AppSearch,
+    EnterpriseSearch,
+    PoolStats,
+    Urllib3HttpConnection,
+)
+
+
+class KeepAliveHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        with self.lock:
+            KeepAliveHandler.connections += 1
+
+    def log_message(self, *_):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith("/api/as/v1/engines/slow"):
+            time.sleep(0.2)
+        body = b'{"results":[]}'
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ThreadingServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture()
+def server_url():
+    KeepAliveHandler.connections = 0
+    httpd = ThreadingServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.01,))
+    thread.daemon = True
+    thread.start()
+    try:
+        yield "http://127.0.0.1:%d" % httpd.server_address[1]
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_default_connection_class(server_url):
+    client = AppSearch(server_url)
+    connection = client.transport.get_connection()
+    assert isinstance(connection, Urllib3HttpConnection)
+    assert client.pool_stats() == {
+        server_url: PoolStats(
+            maxsize=10,
+            in_use=0,
+            idle=0,
+            max_in_use=0,
+            waits=0,
+            wait_time=0.0,
+            connects=0,
+            reaped=0,
+        )
+    }
+
+    client.get_engine(engine_name="engine")
+    client.get_engine(engine_name="engine")
+    stats = client.pool_stats()[server_url]
+    assert (stats.in_use, stats.idle, stats.max_in_use) == (0, 1, 1)
+    assert stats.connects == 1
+    assert KeepAliveHandler.connections == 1
+
+    # Sub-clients share the connections of the EnterpriseSearch client.
+    ent_search = EnterpriseSearch(server_url)
+    assert ent_search.app_search.pool_stats() == ent_search.pool_stats()
+
+
+def test_prewarm_connections(server_url):
+    client = AppSearch(server_url, prewarm_connections=3)
+    stats = client.pool_stats()[server_url]
+    assert (stats.connects, stats.idle, stats.max_in_use) == (3, 3, 0)
+
+    for _ in range(3):
+        client.get_engine(engine_name="engine")
+    assert client.pool_stats()[server_url].connects == 3
+    assert KeepAliveHandler.connections == 3
+
+    # Connections which are already open aren't opened again.
+    assert client.transport.get_connection().prewarm(5) == 2
+    assert client.pool_stats()[server_url].idle == 5
+
+
+def test_prewarm_connections_host_down():
+    client = AppSearch("http://127.0.0.1:1", prewarm_connections=2)
+    stats = client.pool_stats()["http://127.0.0.1:1"]
+    assert (stats.connects, stats.idle) == (0, 0)
+
+
+def test_pool_saturation(server_url):
+    client = AppSearch(server_url, connections_per_host=1)
+
+    threads = [
+        threading.Thread(target=client.get_engine, kwargs={"engine_name": "slow"})
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = client.pool_stats()[server_url]
+    assert stats.max_in_use == 1
+    assert stats.waits == 2
+    assert stats.wait_time >= 0.2
+    assert stats.connects == 1
+
+
+def test_connection_idle_timeout(server_url):
+    client = AppSearch(server_url, connection_idle_timeout=0.05)
+    connection = client.transport.get_connection()
+
+    client.get_engine(engine_name="engine")
+    time.sleep(0.1)
+    # Idle connections aren't reused by requests.
+    client.get_engine(engine_name="engine")
+    stats = client.pool_stats()[server_url]
+    assert (stats.connects, stats.reaped, stats.idle) == (2, 1, 1)
+
+    time.sleep(0.1)
+    assert connection.reap_idle_connections() == 1
+    stats = client.pool_stats()[server_url]
+    assert (stats.reaped, stats.idle) == (2, 0)
+    assert KeepAliveHandler.connections == 2
+
+
+@pytest.mark.parametrize(
+    ["kwargs", "message"],
+    [
+        (
+            {"prewarm_connections": 11},
+            "'prewarm_connections' must be between zero and 'connections_per_host'",
+        ),
+        (
+            {"prewarm_connections": -1},
+            "'prewarm_connections' must be between zero and 'connections_per_host'",
+        ),
+        (
+            {"connection_idle_timeout": 0},
+            "'connection_idle_timeout' must be greater than zero",
+        ),
+    ],
+)
+def test_invalid_pool_options(kwargs, message):
+    with pytest.raises(ValueError) as e:
+        AppSearch(**kwargs)
+    assert str(e.value) == message
+
+
+def test_unsupported_pool_class(monkeypatch):
+    class ProxyConnectionPool(urllib3.HTTPConnectionPool):
+        pass
+
+    # elastic_transport creates the pool with the class in the urllib3 module.
+    monkeypatch.setattr(urllib3, "HTTPConnectionPool", ProxyConnectionPool)
+    with pytest.raises(TypeError) as e:
+        Urllib3HttpConnection()
+    assert str(e.value) == (
+        "Can't measure connection pools of type '%s.ProxyConnectionPool', only "
+        "'urllib3.HTTPConnectionPool' and 'urllib3.HTTPSConnectionPool' "
+        "are supported" % __name__
+    )
@@ -0,0 +1,189 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import pytest
+
+from elastic_enterprise_search import AppSearch, ResponseCache
+from elastic_enterprise_search import _cache as cache_module
+from tests.conftest import DummyConnection
+
+
+class SearchConnection(DummyConnection):
+    def __init__(self, **kwargs):
+        kwargs.setdefault("data", '{"results":[{"id":"1"}]}')
+        super(SearchConnection, self).__init__(**kwargs)
+
+
+class NotFoundConnection(DummyConnection):
+    def __init__(self, **kwargs):
+        super(NotFoundConnection, self).__init__(
+            status=404, data='{"errors":["Not found"]}', **kwargs
+        )
+
+
+@pytest.fixture()
+def cache():
+    return ResponseCache(ttl=60, max_entries=3)
+
+
+@pytest.fixture()
+def app_search(cache):
+    return AppSearch(
+        http_auth="private-key",
+        connection_class=SearchConnection,
+        response_cache=cache,
+    )
+
+
+def calls(client):
+    return [tuple(args[:2]) for args, _ in client.transport.get_connection().calls]
+
+
+def test_cache_disabled_by_default():
+    client = AppSearch(connection_class=DummyConnection)
+    assert client.response_cache is None
+
+    client.search(engine_name="engine", body={"query": "tree"})
+    client.search(engine_name="engine", body={"query": "tree"})
+    assert len(calls(client)) == 2
+
+
+def test_search_responses_are_cached(app_search, cache):
+    resp1 = app_search.search(engine_name="engine", body={"query": "tree", "page": {}})
+    resp2 = app_search.search(engine_name="engine", body={"page": {}, "query": "tree"})
+
+    assert resp1 == resp2 == {"results": [{"id": "1"}]}
+    assert resp2.status == 200
+    assert calls(app_search) == [("POST", "/api/as/v1/engines/engine/search")]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Every hit gets its own copy of the response.
+    resp2["results"].append({"id": "2"})
+    assert app_search.search(engine_name="engine", body={"query": "tree"}) == resp1
+
+
+def test_multi_search_and_query_suggestion_are_cached(app_search):
+    for _ in range(2):
+        app_search.multi_search(
+            engine_name="engine", body={"queries": [{"query": "a"}]}
+        )
+        app_search.query_suggestion(engine_name="engine", query="a")
+
+    assert calls(app_search) == [
+        ("POST", "/api/as/v1/engines/engine/multi_search"),
+        ("POST", "/api/as/v1/engines/engine/query_suggestion?query=a"),
+    ]
+
+
+def test_cache_key_includes_auth_and_body(app_search):
+    app_search.response_cache.max_entries = 10
+    app_search.search(engine_name="engine", body={"query": "tree"})
+    app_search.search(engine_name="engine", body={"query": "trees"})
+    app_search.search(engine_name="engine", body={"query": "tree"}, http_auth="other")
+    app_search.search(engine_name="other", body={"query": "tree"})
+    app_search.search(engine_name="engine", body={"query": "tree"})
+
+    assert len(calls(app_search)) == 4
+
+
+@pytest.mark.parametrize(
+    ["method", "kwargs"],
+    [
+        ("index_documents", {"documents": [{"id": "1"}]}),
+        ("put_documents", {"documents": [{"id": "1"}]}),
+        ("delete_documents", {"document_ids": ["1"]}),
+    ],
+)
+def test_document_changes_invalidate_engine(app_search, cache, method, kwargs):
+    app_search.search(engine_name="engine", body={"query": "tree"})
+    app_search.search(engine_name="other", body={"query": "tree"})
+    assert len(cache) == 2
+
+    getattr(app_search, method)(engine_name="engine", **kwargs)
+    assert len(cache) == 1
+
+    app_search.search(engine_name="engine", body={"query": "tree"})
+    app_search.search(engine_name="other", body={"query": "tree"})
+    assert len(calls(app_search)) == 4
+
+
+def test_reading_documents_doesnt_invalidate(app_search, cache):
+    app_search.search(engine_name="engine", body={"query": "tree"})
+    app_search.get_documents(engine_name="engine", document_ids=["1"])
+    assert len(cache) == 1
+
+
+def test_lru_eviction(app_search, cache):
+    for query in ("a", "b", "c"):
+        app_search.search(engine_name="engine", body={"query": query})
+    # Mark 'a' as recently used so 'b' is evicted.
+    app_search.search(engine_name="engine", body={"query": "a"})
+    app_search.search(engine_name="engine", body={"query": "d"})
+    assert len(cache) == 3
+
+    app_search.search(engine_name="engine", body={"query": "a"})
+    app_search.search(engine_name="engine", body={"query": "b"})
+    assert len(calls(app_search)) == 5
+
+
+def test_max_bytes_eviction(app_search):
+    cache = app_search.response_cache = ResponseCache(max_bytes=50)
+    app_search.search(engine_name="engine", body={"query": "a"})
+    assert cache.nbytes == len('{"results":[{"id":"1"}]}')
+    app_search.search(engine_name="engine", body={"query": "b"})
+    assert len(cache) == 2
+    app_search.search(engine_name="engine", body={"query": "c"})
+    assert len(cache) == 2
+    assert cache.nbytes <= 50
+
+    cache.max_bytes = 10
+    app_search.search(engine_name="engine", body={"query": "d"})
+    assert len(cache) == 2
+
+
+def test_ttl_expiry(app_search, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module, "_monotonic", lambda: now[0])
+
+    app_search.search(engine_name="engine", body={"query": "tree"})
+    now[0] += 59
+    app_search.search(engine_name="engine", body={"query": "tree"})
+    assert len(calls(app_search)) == 1
+
+    now[0] += 2
+    app_search.search(engine_name="engine", body={"query": "tree"})
+    assert len(calls(app_search)) == 2
+
+
+def test_errors_arent_cached(cache):
+    client = AppSearch(
+        connection_class=NotFoundConnection,
+        response_cache=cache,
+    )
+    for _ in range(2):
+        client.search(engine_name="engine", body={}, ignore_status=404)
+    assert len(cache) == 0
+    assert len(calls(client)) == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"ttl": 0}, {"max_entries": 0}],
+)
+def test_invalid_options(kwargs):
+    with pytest.raises(ValueError):
+        ResponseCache(**kwargs)
@@ -0,0 +1,205 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import time
+from email.utils import formatdate
+
+import pytest
+from elastic_transport import ConnectionError, ServiceUnavailableError
+
+from elastic_enterprise_search import (
+    APIError,
+    AppSearch,
+    BadRequestError,
+    EnterpriseSearch,
+    RetryPolicy,
+)
+from tests.conftest import DummyConnection
+
+
+class ThrottledConnection(DummyConnection):
+    """Responds with each of 'statuses' in turn then with 200"""
+
+    statuses = ()
+    retry_after = None
+
+    def __init__(self, **kwargs):
+        super(ThrottledConnection, self).__init__(**kwargs)
+        self.statuses = list(self.statuses)
+
+    def perform_request(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.statuses:
+            status = self.statuses.pop(0)
+            headers = {}
+            if self.retry_after is not None:
+                headers["Retry-After"] = self.retry_after
+            self._raise_error(status, headers, '{"errors":["Throttled"]}')
+        return 200, {}, "{}"
+
+
+def make_client(statuses, retry_policy, retry_after=None, **kwargs):
+    connection_class = type(
+        "Connection",
+        (ThrottledConnection,),
+        {"statuses": statuses, "retry_after": retry_after},
+    )
+    return AppSearch(
+        connection_class=connection_class,
+        meta_header=False,
+        retry_policy=retry_policy,
+        **kwargs
+    )
+
+
+def test_retries_disabled_by_default():
+    client = make_client([429], None)
+    assert client.retry_policy is None
+    with pytest.raises(APIError) as e:
+        client.index_documents(engine_name="engine", documents=[{"id": "1"}])
+    assert e.value.status == 429
+    assert len(client.transport.get_connection().calls) == 1
+
+
+def test_retry_throttled_requests(sleeps):
+    client = make_client([429, 503], RetryPolicy(backoff_factor=1.0))
+    assert client.index_documents(engine_name="engine", documents=[]) == {}
+
+    calls = client.transport.get_connection().calls
+    assert len(calls) == 3
+    assert all(
+        args[:2] == ("POST", "/api/as/v1/engines/engine/documents") for args, _ in calls
+    )
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 1.0
+    assert 0 <= sleeps[1] <= 2.0
+
+
+def test_retry_gives_up_after_max_retries(sleeps):
+    client = make_client([429] * 10, RetryPolicy(max_retries=2))
+    with pytest.raises(APIError) as e:
+        client.index_documents(engine_name="engine", documents=[])
+    assert e.value.status == 429
+    assert len(client.transport.get_connection().calls) == 3
+    assert len(sleeps) == 2
+
+
+def test_retry_only_throttled_statuses(sleeps):
+    client = make_client([400], RetryPolicy())
+    with pytest.raises(BadRequestError):
+        client.index_documents(engine_name="engine", documents=[])
+    assert len(client.transport.get_connection().calls) == 1
+    assert sleeps == []
+
+
+def test_retry_after_header(sleeps):
+    client = make_client([429, 429], RetryPolicy(max_backoff=10), retry_after="7")
+    client.index_documents(engine_name="engine", documents=[])
+    assert sleeps == [7.0, 7.0]
+
+    # Never waits longer than 'max_backoff'
+    client = make_client([429], RetryPolicy(max_backoff=3), retry_after="120")
+    client.index_documents(engine_name="engine", documents=[])
+    assert sleeps[-1] == 3
+
+    # Ignored if 'respect_retry_after' is disabled
+    client = make_client(
+        [429], RetryPolicy(backoff_factor=0.1, respect_retry_after=False), "7"
+    )
+    client.index_documents(engine_name="engine", documents=[])
+    assert sleeps[-1] <= 0.1
+
+
+def test_retry_after_http_date():
+    policy = RetryPolicy(max_backoff=100)
+    error = APIError(
+        "Throttled",
+        status=429,
+        headers={"Retry-After": formatdate(time.time() + 30, usegmt=True)},
+    )
+    assert 25 <= policy._backoff(0, error) <= 30
+
+    error = APIError(
+        "Throttled",
+        status=429,
+        headers={"Retry-After": "Thu, 01 Jan 1970 00:00:00 GMT"},
+    )
+    assert policy._backoff(0, error) == 0
+
+    # Invalid values fall back to the exponential backoff
+    error = APIError("Throttled", status=429, headers={"Retry-After": "soon"})
+    policy = RetryPolicy(backoff_factor=0.5)
+    assert 0 <= policy._backoff(3, error) <= 4.0
+
+
+def test_backoff_is_capped():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+    error = ServiceUnavailableError("Unavailable", status=503)
+    assert all(0 <= policy._backoff(10, error) <= 5 for _ in range(100))
+
+
+def test_retry_on_connection_error(sleeps):
+    class FailingConnection(DummyConnection):
+        def perform_request(self, *args, **kwargs):
+            self.calls.append((args, kwargs))
+            if len(self.calls) == 1:
+                raise ConnectionError("Connection refused")
+            return 200, {}, "{}"
+
+    for policy, calls in (
+        (RetryPolicy(), 1),
+        (RetryPolicy(retry_on_connection_error=True), 2),
+    ):
+        client = AppSearch(
+            connection_class=FailingConnection,
+            retry_policy=policy,
+            # Don't let the Transport retry connection errors itself.
+            max_retries=0,
+        )
+        try:
+            client.get_engine(engine_name="engine")
+        except ConnectionError:
+            pass
+        assert len(client.transport.get_connection().calls) == calls
+
+
+def test_transport_doesnt_retry_policy_statuses():
+    client = AppSearch(retry_policy=RetryPolicy())
+    assert client.transport.retry_on_status == (502, 504)
+
+    client = AppSearch(retry_policy=RetryPolicy(), retry_on_status=(503,))
+    assert client.transport.retry_on_status == (503,)
+
+    client = AppSearch()
+    assert client.transport.retry_on_status == (502, 503, 504)
+
+
+def test_enterprise_search_shares_retry_policy():
+    policy = RetryPolicy()
+    client = EnterpriseSearch(retry_policy=policy)
+    assert client.retry_policy is policy
+    assert client.app_search.retry_policy is policy
+    assert client.workplace_search.retry_policy is policy
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_retries": -1}, {"backoff_factor": -1}, {"max_backoff": -1}],
+)
+def test_invalid_retry_policy(kwargs):
+    with pytest.raises(ValueError):
+        RetryPolicy(**kwargs)
@@ -0,0 +1,168 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import threading
+import time
+
+import pytest
+
+from elastic_enterprise_search import AppSearch, EnterpriseSearch, NotFoundError
+from elastic_enterprise_search._singleflight import _is_idempotent_read
+from tests.conftest import DummyConnection
+
+
+class SlowConnection(DummyConnection):
+    """Holds every request until 'release' is set"""
+
+    release = None
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("data", '{"results":[{"id":"1"}]}')
+        super(SlowConnection, self).__init__(**kwargs)
+
+    def perform_request(self, *args, **kwargs):
+        self.release.wait()
+        return super(SlowConnection, self).perform_request(*args, **kwargs)
+
+
+@pytest.fixture()
+def release():
+    SlowConnection.release = threading.Event()
+    return SlowConnection.release
+
+
+def run_concurrently(func, count=8):
+    results = [None] * count
+    errors = [None] * count
+
+    def target(i):
+        try:
+            results[i] = func()
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def join(threads, release):
+    # Give every thread a chance to join the in-flight request.
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+
+def test_identical_searches_share_request(release):
+    client = AppSearch(connection_class=SlowConnection, coalesce_requests=True)
+    threads, results, errors = run_concurrently(
+        lambda: client.search(engine_name="engine", body={"query": "tree"})
+    )
+    join(threads, release)
+
+    assert errors == [None] * 8
+    assert len(client.transport.get_connection().calls) == 1
+    assert all(resp == {"results": [{"id": "1"}]} for resp in results)
+    assert all(resp.status == 200 for resp in results)
+    # Every caller gets their own copy of the response.
+    assert len(set(id(resp) for resp in results)) == 8
+
+
+def test_coalescing_disabled_by_default(release):
+    client = AppSearch(connection_class=SlowConnection)
+    threads, _, _ = run_concurrently(
+        lambda: client.search(engine_name="engine", body={"query": "tree"})
+    )
+    join(threads, release)
+
+    assert len(client.transport.get_connection().calls) == 8
+
+
+def test_different_requests_arent_shared(release):
+    client = AppSearch(connection_class=SlowConnection, coalesce_requests=True)
+    queries = iter(range(8))
+    lock = threading.Lock()
+
+    def search():
+        with lock:
+            query = str(next(queries) % 2)
+        return client.search(engine_name="engine", body={"query": query})
+
+    threads, _, _ = run_concurrently(search)
+    join(threads, release)
+
+    assert len(client.transport.get_connection().calls) == 2
+
+
+def test_writes_arent_shared(release):
+    client = AppSearch(connection_class=SlowConnection, coalesce_requests=True)
+    threads, _, _ = run_concurrently(
+        lambda: client.index_documents(engine_name="engine", documents=[{"id": "1"}])
+    )
+    join(threads, release)
+
+    assert len(client.transport.get_connection().calls) == 8
+
+
+def test_errors_are_shared(release):
+    class NotFoundConnection(SlowConnection):
+        def __init__(self, **kwargs):
+            super(NotFoundConnection, self).__init__(
+                exception=NotFoundError(message="Not Found"), **kwargs
+            )
+
+    client = AppSearch(connection_class=NotFoundConnection, coalesce_requests=True)
+    threads, results, errors = run_concurrently(
+        lambda: client.get_engine(engine_name="engine")
+    )
+    join(threads, release)
+
+    assert len(client.transport.get_connection().calls) == 1
+    assert all(isinstance(e, NotFoundError) for e in errors)
+
+    # Nothing is left in-flight after the request completes.
+    assert client._single_flight._calls == {}
+
+
+def test_enterprise_search_sub_clients():
+    client = EnterpriseSearch(coalesce_requests=True)
+    assert client._single_flight is not None
+    assert client.app_search._single_flight is not None
+    assert client.workplace_search._single_flight is not None
+
+    assert EnterpriseSearch().app_search._single_flight is None
+
+
+@pytest.mark.parametrize(
+    ["method", "path", "idempotent"],
+    [
+        ("GET", "/api/as/v1/engines", True),
+        ("HEAD", "/", True),
+        ("POST", "/api/as/v1/engines/engine/search", True),
+        ("POST", "/api/as/v1/engines/engine/multi_search", True),
+        ("POST", "/api/as/v1/engines/engine/query_suggestion?query=a", True),
+        ("POST", "/api/ws/v1/search", True),
+        ("POST", "/api/as/v1/engines/engine/documents", False),
+        ("POST", "/api/as/v1/engines/engine/click", False),
+        ("PUT", "/api/as/v1/engines/engine/search_settings", False),
+        ("DELETE", "/api/as/v1/engines/engine", False),
+    ],
+)
+def test_is_idempotent_read(method, path, idempotent):
+    assert _is_idempotent_read(method, path) is idempotent
@@ -15,11 +15,18 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import sys
+
 import pytest
 import urllib3
 from elastic_transport import Connection
 
 from elastic_enterprise_search import AppSearch, EnterpriseSearch, WorkplaceSearch
+from elastic_enterprise_search import _retry as retry_module
+
+# asyncio clients are only available on Python 3.6+
+if sys.version_info < (3, 6):
+    collect_ignore_glob = ["client/test_async_*.py"]
 
 
 @pytest.fixture(scope="module")
@@ -32,6 +39,14 @@ def client_class(request):
     return request.param
 
 
+@pytest.fixture()
+def sleeps(monkeypatch):
+    """Records the backoff of every retry instead of sleeping"""
+    sleeps = []
+    monkeypatch.setattr(retry_module.time, "sleep", sleeps.append)
+    return sleeps
+
+
 @pytest.fixture(scope="session")
 def ent_search_url():
     host = "localhost"
@@ -0,0 +1,90 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import json
+import threading
+
+from six.moves.urllib.parse import unquote
+
+from tests.conftest import DummyConnection
+
+
+class PagingConnection(DummyConnection):
+    """Records the requests sent from any thread in 'self.calls' and
+    passes them with their query parameters to 'handle()' which returns
+    the response body. 'page()' answers paginated list APIs.
+    """
+
+    def __init__(self, **kwargs):
+        super(PagingConnection, self).__init__(**kwargs)
+        self.lock = threading.Lock()
+
+    def perform_request(self, method, target, body=None, **kwargs):
+        with self.lock:
+            self.calls.append(((method, target, body), kwargs))
+        path, _, query = target.partition("?")
+        params = query_params(query)
+        return (
+            200,
+            {"content-type": "application/json"},
+            json.dumps(self.handle(method, path, params, body)),
+        )
+
+    def handle(self, method, path, params, body):
+        raise NotImplementedError()
+
+    def page(self, params, results, total_results=None):
+        """Returns the page of 'results' requested with the 'page[current]'
+        and 'page[size]' query parameters, like App Search the first page
+        of 10 results is returned without them
+        """
+        current = int(params.get("page[current]", 1))
+        size = int(params.get("page[size]", 10))
+        if total_results is None:
+            total_results = len(results)
+        start = (current - 1) * size
+        return {
+            "meta": {
+                "page": {
+                    "current": current,
+                    "size": size,
+                    "total_results": total_results,
+                    "total_pages": -(-total_results // size),
+                }
+            },
+            "results": results[start:][:size],
+        }
+
+
+class PagedConnection(PagingConnection):
+    """Serves 'total_results' results split into pages"""
+
+    total_results = 25
+
+    def handle(self, method, path, params, body):
+        return self.page(params, [{"id": str(i)} for i in range(self.total_results)])
+
+
+def query_params(query):
+    """Parses a query string into a dict of parameters"""
+    if not query:
+        return {}
+    return dict(unquote(param).split("=", 1) for param in query.split("&"))
+
+
+def connection(client):
+    return client.transport.get_connection()
@@ -0,0 +1,273 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import datetime
+import json
+import random
+import sys
+import time
+
+import pytest
+from dateutil import parser, tz
+from six import StringIO
+
+from elastic_enterprise_search import AppSearch
+from elastic_enterprise_search._utils import parse_datetime
+from elastic_enterprise_search.helpers import export_api_logs
+from tests.helpers.conftest import PagingConnection, connection, query_params
+
+START = datetime.datetime(2021, 1, 1, tzinfo=tz.tzutc())
+
+
+class ApiLogsConnection(PagingConnection):
+    """Answers 'get_api_logs()' from the entries in 'self.entries' which
+    are sorted by timestamp. Like App Search only the first 'max_results'
+    entries of a query are returned.
+    """
+
+    max_results = 100
+
+    def __init__(self, **kwargs):
+        super(ApiLogsConnection, self).__init__(**kwargs)
+        self.entries = []
+
+    def handle(self, method, path, params, body):
+        # Pages complete out of order
+        time.sleep(random.random() * 0.002)
+
+        assert path == "/api/as/v1/engines/engine/logs/api"
+        assert params["sort_direction"] == "asc"
+        from_date = parse_datetime(params["filters[date][from]"])
+        to_date = parse_datetime(params["filters[date][to]"])
+        entries = [
+            entry
+            for entry in self.entries
+            if from_date <= parser.isoparse(entry["timestamp"]) <= to_date
+        ]
+        return self.page(
+            params, entries[: self.max_results], total_results=len(entries)
+        )
+
+
+def make_entries(seconds):
+    """Returns an API log entry for every offset in seconds from 'START'
+    with a timestamp in milliseconds like the ones App Search returns
+    """
+    return [
+        {
+            "timestamp": (START + datetime.timedelta(seconds=second)).strftime(
+                "%Y-%m-%dT%H:%M:%S.%f"
+            )[:-3]
+            + "Z",
+            "full_request_path": "/api/as/v1/engines/engine/search?i=%d" % i,
+            "status": 200,
+        }
+        for i, second in enumerate(seconds)
+    ]
+
+
+@pytest.fixture()
+def app_search():
+    return AppSearch(connection_class=ApiLogsConnection, meta_header=False)
+
+
+def requested_windows(client):
+    windows = set()
+    for (_, target, _), _ in connection(client).calls:
+        params = query_params(target.partition("?")[2])
+        windows.add((params["filters[date][from]"], params["filters[date][to]"]))
+    return windows
+
+
+def test_export_api_logs_single_window(app_search):
+    entries = make_entries(range(0, 500, 10))
+    connection(app_search).entries = entries
+
+    output = StringIO()
+    exported = export_api_logs(
+        app_search,
+        "engine",
+        from_date=START,
+        to_date=START + datetime.timedelta(hours=1),
+        output=output,
+        page_size=10,
+    )
+    assert exported == 50
+    assert [json.loads(line) for line in output.getvalue().splitlines()] == entries
+    # One request counts the entries, then one request per page
+    assert len(connection(app_search).calls) == 6
+    assert requested_windows(app_search) == {
+        ("2021-01-01T00:00:00Z", "2021-01-01T01:00:00Z")
+    }
+
+
+def test_export_api_logs_splits_windows(app_search):
+    # Most entries are in the first minute so its windows are split again.
+    seconds = sorted(
+        [random.randint(0, 59) for _ in range(900)]
+        + [random.randint(60, 3599) for _ in range(300)]
+    )
+    entries = make_entries(seconds)
+    connection(app_search).entries = entries
+
+    exported = []
+    assert (
+        export_api_logs(
+            app_search,
+            "engine",
+            from_date=START,
+            to_date=START + datetime.timedelta(seconds=3599),
+            output=exported.append,
+            page_size=20,
+            thread_count=8,
+            max_window_results=100,
+        )
+        == 1200
+    )
+    assert exported == entries
+    assert len(requested_windows(app_search)) > 12
+
+
+def test_export_api_logs_sub_second_entries_at_split(app_search):
+    # Splitting the window at 60s must neither miss the entries
+    # between 59s and 60s nor export the ones at 60s twice.
+    seconds = [second + 0.5 for second in range(120)] + [60, 60, 60, 60.001]
+    entries = make_entries(sorted(seconds))
+    connection(app_search).entries = entries
+
+    exported = []
+    assert (
+        export_api_logs(
+            app_search,
+            "engine",
+            from_date=START,
+            to_date=START + datetime.timedelta(seconds=120),
+            output=exported.append,
+            page_size=2,
+            max_window_results=100,
+        )
+        == 124
+    )
+    assert exported == entries
+    assert requested_windows(app_search) == {
+        ("2021-01-01T00:00:00Z", "2021-01-01T00:02:00Z"),
+        ("2021-01-01T00:00:00Z", "2021-01-01T00:01:00Z"),
+        ("2021-01-01T00:01:00Z", "2021-01-01T00:02:00Z"),
+    }
+
+
+def test_export_api_logs_single_second_over_limit(app_search):
+    connection(app_search).entries = make_entries([0] * 150 + [1.5] * 10)
+
+    exported = []
+    with pytest.warns(UserWarning) as w:
+        export_api_logs(
+            app_search,
+            "engine",
+            from_date=START,
+            to_date=START + datetime.timedelta(seconds=2),
+            output=exported.append,
+            max_window_results=100,
+        )
+    assert (
+        "150 API log entries between 2021-01-01 00:00:00+00:00 "
+        "and 2021-01-01 00:00:01+00:00" in str(w[0].message)
+    )
+    assert len(exported) == 110
+
+
+def test_export_api_logs_no_entries(app_search):
+    output = StringIO()
+    assert (
+        export_api_logs(
+            app_search, "engine", "2021-01-01T00:00:00Z", "2021-01-02T00:00:00Z", output
+        )
+        == 0
+    )
+    assert output.getvalue() == ""
+    assert len(connection(app_search).calls) == 1
+
+
+def test_export_api_logs_columns(app_search):
+    entries = make_entries(range(25))
+    entries[3]["error"] = "Not found"
+    connection(app_search).entries = entries
+
+    batches = []
+    export_api_logs(
+        app_search,
+        "engine",
+        from_date=START,
+        to_date=START + datetime.timedelta(minutes=1),
+        output=batches.append,
+        format="columns",
+        batch_size=10,
+    )
+    assert [len(batch["status"]) for batch in batches] == [10, 10, 5]
+    assert batches[0]["error"] == [None] * 3 + ["Not found"] + [None] * 6
+    assert "error" not in batches[1]
+    assert batches[2]["timestamp"] == [entry["timestamp"] for entry in entries[20:]]
+
+
+def test_export_api_logs_parquet(app_search, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    entries = make_entries(range(25))
+    connection(app_search).entries = entries
+
+    path = str(tmp_path / "api-logs.parquet")
+    export_api_logs(
+        app_search,
+        "engine",
+        from_date=START,
+        to_date=START + datetime.timedelta(minutes=1),
+        output=path,
+        format="parquet",
+        batch_size=10,
+    )
+    parquet_file = pq.ParquetFile(path)
+    assert parquet_file.num_row_groups == 3
+    table = parquet_file.read().to_pydict()
+    assert table["timestamp"] == [entry["timestamp"] for entry in entries]
+    assert table["status"] == ["200"] * 25
+
+
+@pytest.mark.parametrize(
+    ["kwargs", "message"],
+    [
+        ({"format": "csv"}, "'format' must be one of ndjson, columns, parquet"),
+        ({"page_size": 0}, "'page_size' must be between 1 and 'max_window_results'"),
+        (
+            {"from_date": START + datetime.timedelta(days=1)},
+            "'from_date' must be before 'to_date'",
+        ),
+    ],
+)
+def test_export_api_logs_invalid(app_search, kwargs, message):
+    params = dict(from_date=START, to_date=START, output=[].append)
+    params.update(kwargs)
+    with pytest.raises(ValueError) as e:
+        export_api_logs(app_search, "engine", **params)
+    assert str(e.value) == message
+
+
+def test_export_api_logs_parquet_requires_pyarrow(app_search, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError) as e:
+        export_api_logs(app_search, "engine", START, START, "out.parquet", "parquet")
+    assert str(e.value) == (
+        "You must have 'pyarrow' installed to export API logs to Parquet"
+    )
@@ -0,0 +1,188 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import json
+import threading
+
+import pytest
+from elastic_transport import BadRequestError, ConnectionError
+
+from elastic_enterprise_search import AppSearch
+from elastic_enterprise_search.helpers import SearchBatcher
+from tests.conftest import DummyConnection
+
+
+class SearchConnection(DummyConnection):
+    """Echoes the query of every search back as its only result"""
+
+    def perform_request(self, method, target, body=None, **kwargs):
+        self.calls.append(((method, target, body), kwargs))
+        data = json.loads(body)
+        if target.endswith("/multi_search"):
+            queries = [q["query"] for q in data["queries"]]
+        else:
+            queries = [data["query"]]
+        if "bad" in queries:
+            raise BadRequestError(message="Bad Request")
+        if "unavailable" in queries:
+            raise ConnectionError("Connection refused")
+
+        results = [{"meta": {}, "results": [{"query": q}]} for q in queries]
+        if not target.endswith("/multi_search"):
+            results = results[0]
+        return 200, {"content-type": "application/json"}, json.dumps(results)
+
+
+@pytest.fixture()
+def client():
+    return AppSearch(connection_class=SearchConnection, max_retries=0)
+
+
+def targets(client):
+    return [args[1] for args, _ in client.transport.get_connection().calls]
+
+
+def test_searches_are_batched(client):
+    with SearchBatcher(client, max_wait=60) as batcher:
+        futures = [
+            batcher.submit(engine_name="engine", body={"query": str(i)})
+            for i in range(25)
+        ]
+    responses = [future.result(timeout=5) for future in futures]
+
+    assert [resp["results"][0]["query"] for resp in responses] == [
+        str(i) for i in range(25)
+    ]
+    assert all(resp.status == 200 for resp in responses)
+    # Full batches are sent right away, the rest when the batcher is closed.
+    assert targets(client) == ["/api/as/v1/engines/engine/multi_search"] * 3
+
+
+def test_batches_sent_after_max_wait(client):
+    with SearchBatcher(client, max_wait=0.01) as batcher:
+        resp1 = batcher.submit(engine_name="engine", body={"query": "a"})
+        resp2 = batcher.submit(engine_name="engine", body={"query": "b"})
+        assert resp1.result(timeout=5)["results"] == [{"query": "a"}]
+        assert resp2.result(timeout=5)["results"] == [{"query": "b"}]
+        assert resp1.done() and resp2.done()
+
+        # A single search is sent with search() instead of multi_search().
+        assert batcher.search(engine_name="engine", body={"query": "c"}) == {
+            "meta": {},
+            "results": [{"query": "c"}],
+        }
+
+    assert targets(client) == [
+        "/api/as/v1/engines/engine/multi_search",
+        "/api/as/v1/engines/engine/search",
+    ]
+
+
+def test_batches_per_engine_and_auth(client):
+    with SearchBatcher(client, max_wait=60) as batcher:
+        for engine_name in ("engine1", "engine2"):
+            for http_auth in ("key1", "key2"):
+                for query in ("a", "b"):
+                    batcher.submit(
+                        engine_name=engine_name,
+                        body={"query": query},
+                        http_auth=http_auth,
+                    )
+
+    calls = client.transport.get_connection().calls
+    assert len(calls) == 4
+    assert sorted(
+        (args[1], kwargs["headers"]["authorization"]) for args, kwargs in calls
+    ) == [
+        ("/api/as/v1/engines/engine1/multi_search", "Bearer key1"),
+        ("/api/as/v1/engines/engine1/multi_search", "Bearer key2"),
+        ("/api/as/v1/engines/engine2/multi_search", "Bearer key1"),
+        ("/api/as/v1/engines/engine2/multi_search", "Bearer key2"),
+    ]
+
+
+def test_bad_request_retries_searches_individually(client):
+    with SearchBatcher(client, max_wait=60) as batcher:
+        futures = [
+            batcher.submit(engine_name="engine", body={"query": query})
+            for query in ("a", "bad", "c")
+        ]
+
+    assert futures[0].result()["results"] == [{"query": "a"}]
+    assert isinstance(futures[1].exception(), BadRequestError)
+    with pytest.raises(BadRequestError):
+        futures[1].result()
+    assert futures[2].result()["results"] == [{"query": "c"}]
+    assert (
+        targets(client)
+        == ["/api/as/v1/engines/engine/multi_search"]
+        + ["/api/as/v1/engines/engine/search"] * 3
+    )
+
+
+def test_errors_are_set_on_every_future(client):
+    with SearchBatcher(client, max_wait=60) as batcher:
+        futures = [
+            batcher.submit(engine_name="engine", body={"query": query})
+            for query in ("a", "unavailable")
+        ]
+
+    assert all(isinstance(f.exception(), ConnectionError) for f in futures)
+    assert len(targets(client)) == 1
+
+
+def test_concurrent_searches(client):
+    batcher = SearchBatcher(client, max_wait=0.05)
+    results = {}
+
+    def search(i):
+        results[i] = batcher.search(engine_name="engine", body={"query": str(i)})
+
+    threads = [threading.Thread(target=search, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.close()
+
+    assert {i: resp["results"][0]["query"] for i, resp in results.items()} == {
+        i: str(i) for i in range(8)
+    }
+    assert len(targets(client)) < 8
+
+
+def test_result_timeout(client):
+    with SearchBatcher(client, max_wait=60) as batcher:
+        future = batcher.submit(engine_name="engine", body={"query": "a"})
+        with pytest.raises(Exception) as e:
+            future.result(timeout=0.01)
+        assert "Search didn't complete within 0.01 seconds" in str(e.value)
+    assert future.result()["results"] == [{"query": "a"}]
+
+
+def test_submit_after_close(client):
+    batcher = SearchBatcher(client)
+    batcher.close()
+    with pytest.raises(RuntimeError):
+        batcher.submit(engine_name="engine", body={})
+
+
+@pytest.mark.parametrize("engine_name", [None, ""])
+def test_empty_engine_name(client, engine_name):
+    with SearchBatcher(client) as batcher:
+        with pytest.raises(ValueError):
+            batcher.submit(engine_name=engine_name, body={})
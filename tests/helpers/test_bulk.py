@@ -0,0 +1,635 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+
+import json
+import threading
+import time
+
+import pytest
+
+from elastic_enterprise_search import APIError, AppSearch, RetryPolicy, WorkplaceSearch
+from elastic_enterprise_search.helpers import (
+    AdaptiveConcurrencyLimiter,
+    BulkIndexError,
+    parallel_bulk,
+    streaming_bulk,
+)
+from elastic_enterprise_search.helpers._bulk import _is_retryable_result
+from tests.conftest import DummyConnection
+
+
+class IndexDocumentsConnection(DummyConnection):
+    """Responds to 'index_documents' with a result per document,
+    documents with a 'fail' field are reported as errors.
+    """
+
+    def perform_request(self, method, target, body=None, **kwargs):
+        self.calls.append(((method, target, body), kwargs))
+        results = [
+            {"id": doc["id"], "errors": ["Invalid field"] if "fail" in doc else []}
+            for doc in json.loads(body)
+        ]
+        if target.startswith("/api/ws/"):
+            results = {"results": results}
+        return 200, {"content-type": "application/json"}, json.dumps(results)
+
+
+@pytest.fixture()
+def app_search():
+    return AppSearch(connection_class=IndexDocumentsConnection, meta_header=False)
+
+
+@pytest.fixture()
+def workplace_search():
+    return WorkplaceSearch(connection_class=IndexDocumentsConnection, meta_header=False)
+
+
+def test_streaming_bulk_chunks_by_count(app_search):
+    documents = ({"id": str(i)} for i in range(250))
+    results = list(streaming_bulk(app_search, documents, engine_name="engine"))
+
+    assert results == [(True, {"id": str(i), "errors": []}) for i in range(250)]
+
+    calls = app_search.transport.get_connection().calls
+    assert [len(json.loads(call[0][2])) for call in calls] == [100, 100, 50]
+    assert all(
+        call[0][:2] == ("POST", "/api/as/v1/engines/engine/documents") for call in calls
+    )
+
+
+def test_streaming_bulk_chunks_by_bytes(app_search):
+    documents = [{"id": str(i), "body": "x" * 100} for i in range(10)]
+    results = list(
+        streaming_bulk(app_search, documents, engine_name="engine", max_chunk_bytes=400)
+    )
+    assert len(results) == 10
+
+    calls = app_search.transport.get_connection().calls
+    assert [len(json.loads(call[0][2])) for call in calls] == [3, 3, 3, 1]
+    assert all(len(call[0][2]) <= 400 for call in calls)
+
+
+def test_streaming_bulk_oversized_document_sent_alone(app_search):
+    documents = [{"id": "1"}, {"id": "2", "body": "x" * 100}, {"id": "3"}]
+    list(
+        streaming_bulk(app_search, documents, engine_name="engine", max_chunk_bytes=50)
+    )
+
+    calls = app_search.transport.get_connection().calls
+    assert [len(json.loads(call[0][2])) for call in calls] == [1, 1, 1]
+
+
+def test_streaming_bulk_consumes_lazily(app_search):
+    consumed = []
+
+    def documents():
+        for i in range(300):
+            consumed.append(i)
+            yield {"id": str(i)}
+
+    results = streaming_bulk(app_search, documents(), engine_name="engine")
+    next(results)
+    assert len(consumed) == 101
+
+
+def test_streaming_bulk_errors(app_search):
+    documents = [{"id": "1"}, {"id": "2", "fail": True}, {"id": "3"}]
+
+    with pytest.raises(BulkIndexError) as e:
+        list(streaming_bulk(app_search, documents, engine_name="engine"))
+    assert str(e.value) == "1 document(s) failed to index."
+    assert e.value.errors == [
+        {"id": "2", "errors": ["Invalid field"], "document": {"id": "2", "fail": True}}
+    ]
+
+    results = list(
+        streaming_bulk(
+            app_search, documents, engine_name="engine", raise_on_error=False
+        )
+    )
+    assert results == [
+        (True, {"id": "1", "errors": []}),
+        (False, {"id": "2", "errors": ["Invalid field"]}),
+        (True, {"id": "3", "errors": []}),
+    ]
+
+
+@pytest.mark.parametrize("engine_name", [None, ""])
+def test_streaming_bulk_requires_engine_name(app_search, engine_name):
+    with pytest.raises(ValueError) as e:
+        list(streaming_bulk(app_search, [{"id": "1"}], engine_name=engine_name))
+    assert str(e.value) == "Empty value passed for a required argument"
+
+
+def test_streaming_bulk_workplace_search(workplace_search):
+    documents = ({"id": str(i)} for i in range(150))
+    results = list(
+        streaming_bulk(workplace_search, documents, content_source_id="source")
+    )
+    assert results == [(True, {"id": str(i), "errors": []}) for i in range(150)]
+
+    calls = workplace_search.transport.get_connection().calls
+    assert [call[0][:2] for call in calls] == [
+        ("POST", "/api/ws/v1/sources/source/documents/bulk_create")
+    ] * 2
+
+
+def test_bulk_engine_name_and_content_source_id_exclusive(app_search):
+    with pytest.raises(ValueError) as e:
+        list(
+            streaming_bulk(
+                app_search, [{"id": "1"}], engine_name="a", content_source_id="b"
+            )
+        )
+    assert str(e.value) == (
+        "'engine_name' and 'content_source_id' parameters are mutually exclusive"
+    )
+
+
+@pytest.mark.parametrize("thread_count", [1, 4])
+def test_parallel_bulk_preserves_order(app_search, thread_count):
+    documents = ({"id": str(i)} for i in range(1000))
+    results = list(
+        parallel_bulk(
+            app_search,
+            documents,
+            engine_name="engine",
+            chunk_size=10,
+            thread_count=thread_count,
+        )
+    )
+    assert results == [(True, {"id": str(i), "errors": []}) for i in range(1000)]
+    assert len(app_search.transport.get_connection().calls) == 100
+
+
+def test_parallel_bulk_sends_chunks_concurrently():
+    lock = threading.Lock()
+    in_flight = [0, 0]  # (current, max)
+
+    class SlowConnection(IndexDocumentsConnection):
+        def perform_request(self, *args, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+            return super(SlowConnection, self).perform_request(*args, **kwargs)
+
+    app_search = AppSearch(connection_class=SlowConnection, meta_header=False)
+    documents = ({"id": str(i)} for i in range(600))
+    results = list(
+        parallel_bulk(app_search, documents, engine_name="engine", thread_count=3)
+    )
+    assert len(results) == 600
+    assert in_flight[1] == 3
+
+
+def test_parallel_bulk_backpressure():
+    consumed = []
+    release = threading.Event()
+
+    class BlockedConnection(IndexDocumentsConnection):
+        def perform_request(self, *args, **kwargs):
+            release.wait(timeout=5)
+            return super(BlockedConnection, self).perform_request(*args, **kwargs)
+
+    def documents():
+        for i in range(10000):
+            consumed.append(i)
+            yield {"id": str(i)}
+
+    app_search = AppSearch(connection_class=BlockedConnection, meta_header=False)
+    results = parallel_bulk(
+        app_search,
+        documents(),
+        engine_name="engine",
+        chunk_size=10,
+        thread_count=2,
+        queue_size=2,
+    )
+
+    thread = threading.Thread(target=lambda: next(results))
+    thread.start()
+    thread.join(timeout=0.5)
+
+    # 2 chunks in-flight, 2 chunks queued, 1 chunk being
+    # built and 1 chunk blocked waiting to be queued.
+    assert len(consumed) <= 61
+
+    release.set()
+    thread.join()
+    assert len(list(results)) == 9999
+
+
+def test_parallel_bulk_errors(app_search):
+    documents = [{"id": str(i)} for i in range(50)] + [{"id": "50", "fail": True}]
+    with pytest.raises(BulkIndexError) as e:
+        list(parallel_bulk(app_search, documents, engine_name="engine", chunk_size=10))
+    assert [error["id"] for error in e.value.errors] == ["50"]
+
+
+class ThrottledConnection(IndexDocumentsConnection):
+    """Responds with 'throttled_status' to the first request for
+    each chunk whose first document ID is in 'throttled_ids'.
+    """
+
+    throttled_ids = ()
+    throttled_status = 429
+
+    def __init__(self, **kwargs):
+        super(ThrottledConnection, self).__init__(**kwargs)
+        self.throttled_ids = set(self.throttled_ids)
+        self.lock = threading.Lock()
+
+    def perform_request(self, method, target, body=None, **kwargs):
+        with self.lock:
+            first_id = json.loads(body)[0]["id"]
+            throttled = first_id in self.throttled_ids
+            self.throttled_ids.discard(first_id)
+        if throttled:
+            self.calls.append(((method, target, body), kwargs))
+            self._raise_error(self.throttled_status, {"Retry-After": "0"}, "{}")
+        return super(ThrottledConnection, self).perform_request(
+            method, target, body=body, **kwargs
+        )
+
+
+def throttled_app_search(throttled_ids, throttled_status=429, **kwargs):
+    connection_class = type(
+        "Connection",
+        (ThrottledConnection,),
+        {"throttled_ids": throttled_ids, "throttled_status": throttled_status},
+    )
+    return AppSearch(connection_class=connection_class, meta_header=False, **kwargs)
+
+
+class RecordingLimiter(AdaptiveConcurrencyLimiter):
+    """Records whether each released request was throttled"""
+
+    def __init__(self, *args, **kwargs):
+        super(RecordingLimiter, self).__init__(*args, **kwargs)
+        self.throttled = []
+
+    def release(self, token, throttled=False):
+        self.throttled.append(throttled)
+        super(RecordingLimiter, self).release(token, throttled=throttled)
+
+
+def test_streaming_bulk_retries_only_throttled_chunk(sleeps):
+    app_search = throttled_app_search({"10"})
+    documents = ({"id": str(i)} for i in range(30))
+    results = list(
+        streaming_bulk(
+            app_search,
+            documents,
+            engine_name="engine",
+            chunk_size=10,
+            retry_policy=RetryPolicy(),
+        )
+    )
+    assert results == [(True, {"id": str(i), "errors": []}) for i in range(30)]
+
+    calls = app_search.transport.get_connection().calls
+    assert [json.loads(call[0][2])[0]["id"] for call in calls] == [
+        "0",
+        "10",
+        "10",
+        "20",
+    ]
+    assert sleeps == [0.0]
+
+
+def test_streaming_bulk_without_retry_policy_raises():
+    app_search = throttled_app_search({"10"})
+    documents = ({"id": str(i)} for i in range(30))
+    with pytest.raises(APIError) as e:
+        list(streaming_bulk(app_search, documents, engine_name="engine", chunk_size=10))
+    assert e.value.status == 429
+
+
+def test_parallel_bulk_adaptive_concurrency(sleeps):
+    app_search = throttled_app_search({"0", "10", "20", "30"})
+    limiter = AdaptiveConcurrencyLimiter(4)
+    documents = ({"id": str(i)} for i in range(1000))
+    results = list(
+        parallel_bulk(
+            app_search,
+            documents,
+            engine_name="engine",
+            chunk_size=10,
+            thread_count=4,
+            retry_policy=RetryPolicy(),
+            adaptive_concurrency=limiter,
+        )
+    )
+    assert results == [(True, {"id": str(i), "errors": []}) for i in range(1000)]
+    assert len(app_search.transport.get_connection().calls) == 104
+    assert len(sleeps) == 4
+    # The limit recovered after being lowered by the throttled chunks
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+def test_parallel_bulk_adaptive_concurrency_client_retries(sleeps):
+    # The client retries the throttled chunks with its own
+    # retry policy, the limiter still counts them as throttled.
+    app_search = throttled_app_search({"0", "50"}, retry_policy=RetryPolicy())
+    limiter = RecordingLimiter(4)
+    documents = ({"id": str(i)} for i in range(100))
+    results = list(
+        parallel_bulk(
+            app_search,
+            documents,
+            engine_name="engine",
+            chunk_size=10,
+            thread_count=4,
+            adaptive_concurrency=limiter,
+        )
+    )
+    assert results == [(True, {"id": str(i), "errors": []}) for i in range(100)]
+    assert len(app_search.transport.get_connection().calls) == 12
+    assert len(sleeps) == 2
+    assert sorted(limiter.throttled) == [False] * 8 + [True] * 2
+
+
+def test_parallel_bulk_adaptive_concurrency_transport_retries(sleeps):
+    # Statuses in the Transport's 'retry_on_status' are retried by
+    # the Transport right away and never reach the limiter.
+    app_search = throttled_app_search({"0", "50"}, throttled_status=503)
+    assert 503 in app_search.transport.retry_on_status
+    limiter = RecordingLimiter(4)
+    documents = ({"id": str(i)} for i in range(100))
+    results = list(
+        parallel_bulk(
+            app_search,
+            documents,
+            engine_name="engine",
+            chunk_size=10,
+            thread_count=4,
+            retry_policy=RetryPolicy(),
+            adaptive_concurrency=limiter,
+        )
+    )
+    assert results == [(True, {"id": str(i), "errors": []}) for i in range(100)]
+    assert len(app_search.transport.get_connection().calls) == 12
+    assert sleeps == []
+    assert limiter.throttled == [False] * 10
+
+
+def test_adaptive_concurrency_limiter_aimd():
+    limiter = AdaptiveConcurrencyLimiter(8, min_limit=2)
+
+    # Concurrent throttled requests only decrease the limit once
+    tokens = [limiter.acquire() for _ in range(8)]
+    for token in tokens:
+        limiter.release(token, throttled=True)
+    assert limiter.limit == 4
+
+    # Throttled requests started after the decrease decrease it again
+    limiter.release(limiter.acquire(), throttled=True)
+    assert limiter.limit == 2
+    limiter.release(limiter.acquire(), throttled=True)
+    assert limiter.limit == 2
+
+    # Increases by one after 'limit' successful requests
+    for _ in range(2):
+        limiter.release(limiter.acquire())
+    assert limiter.limit == 3
+    for _ in range(3 + 4 + 5 + 6 + 7):
+        limiter.release(limiter.acquire())
+    assert limiter.limit == 8
+
+
+def test_adaptive_concurrency_limiter_blocks():
+    limiter = AdaptiveConcurrencyLimiter(1)
+    token = limiter.acquire()
+    acquired = threading.Event()
+
+    def acquire():
+        limiter.release(limiter.acquire())
+        acquired.set()
+
+    thread = threading.Thread(target=acquire)
+    thread.start()
+    assert not acquired.wait(0.05)
+    limiter.release(token)
+    assert acquired.wait(1)
+    thread.join()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_limit": 0},
+        {"max_limit": 2, "min_limit": 3},
+        {"max_limit": 2, "decrease_factor": 1},
+    ],
+)
+def test_adaptive_concurrency_limiter_invalid(kwargs):
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(**kwargs)
+
+
+class FlakyDocumentsConnection(IndexDocumentsConnection):
+    """Rejects documents with a 'transient' field the first
+    'transient' times they're sent with a retryable error
+    and documents with a 'fail' field with a permanent error.
+    """
+
+    def __init__(self, **kwargs):
+        super(FlakyDocumentsConnection, self).__init__(**kwargs)
+        self.lock = threading.Lock()
+        self.attempts = {}
+
+    def perform_request(self, method, target, body=None, **kwargs):
+        results = []
+        with self.lock:
+            self.calls.append(((method, target, body), kwargs))
+            for doc in json.loads(body):
+                attempt = self.attempts[doc["id"]] = self.attempts.get(doc["id"], 0) + 1
+                if "fail" in doc:
+                    errors = ["Invalid field"]
+                elif attempt <= doc.get("transient", 0):
+                    errors = ["Request timed out, please try again"]
+                else:
+                    errors = []
+                results.append({"id": doc["id"], "errors": errors})
+        return 200, {"content-type": "application/json"}, json.dumps(results)
+
+
+@pytest.fixture()
+def flaky_app_search():
+    return AppSearch(connection_class=FlakyDocumentsConnection, meta_header=False)
+
+
+def chunk_ids(client):
+    return [
+        [doc["id"] for doc in json.loads(call[0][2])]
+        for call in client.transport.get_connection().calls
+    ]
+
+
+def test_streaming_bulk_retries_only_failed_documents(flaky_app_search):
+    documents = [{"id": str(i)} for i in range(10)]
+    documents[2]["transient"] = 1
+    documents[6]["transient"] = 2
+
+    results = list(
+        streaming_bulk(
+            flaky_app_search,
+            documents,
+            engine_name="engine",
+            chunk_size=4,
+            max_document_retries=3,
+        )
+    )
+    assert sorted(results, key=lambda x: int(x[1]["id"])) == [
+        (True, {"id": str(i), "errors": []}) for i in range(10)
+    ]
+    # Retried documents are yielded once they're indexed.
+    assert [result["id"] for _, result in results] == [
+        "0",
+        "1",
+        "3",
+        "4",
+        "2",
+        "5",
+        "7",
+        "8",
+        "9",
+        "6",
+    ]
+    # Only the failed documents were sent again, within later chunks.
+    assert chunk_ids(flaky_app_search) == [
+        ["0", "1", "2", "3"],
+        ["4", "2", "5", "6"],
+        ["7", "6", "8", "9"],
+        ["6"],
+    ]
+
+
+def test_streaming_bulk_dead_letter(flaky_app_search):
+    documents = [
+        {"id": "1"},
+        {"id": "2", "fail": True},
+        {"id": "3", "transient": 5},
+        {"id": "4"},
+    ]
+    dead_letters = []
+    results = list(
+        streaming_bulk(
+            flaky_app_search,
+            documents,
+            engine_name="engine",
+            max_document_retries=2,
+            dead_letter=lambda document, result: dead_letters.append(
+                (document, result)
+            ),
+        )
+    )
+    assert results == [
+        (True, {"id": "1", "errors": []}),
+        (False, {"id": "2", "errors": ["Invalid field"]}),
+        (True, {"id": "4", "errors": []}),
+        (False, {"id": "3", "errors": ["Request timed out, please try again"]}),
+    ]
+    assert dead_letters == [
+        (documents[1], {"id": "2", "errors": ["Invalid field"]}),
+        (documents[2], {"id": "3", "errors": ["Request timed out, please try again"]}),
+    ]
+    assert chunk_ids(flaky_app_search) == [["1", "2", "3", "4"], ["3"], ["3"]]
+
+
+def test_streaming_bulk_permanent_errors_raise(flaky_app_search):
+    documents = [{"id": "1", "transient": 1}, {"id": "2", "fail": True}]
+    with pytest.raises(BulkIndexError) as e:
+        list(
+            streaming_bulk(
+                flaky_app_search,
+                documents,
+                engine_name="engine",
+                max_document_retries=1,
+            )
+        )
+    assert [error["id"] for error in e.value.errors] == ["2"]
+
+
+def test_streaming_bulk_custom_is_retryable(flaky_app_search):
+    documents = [{"id": "1", "fail": True}]
+    results = list(
+        streaming_bulk(
+            flaky_app_search,
+            documents,
+            engine_name="engine",
+            raise_on_error=False,
+            max_document_retries=2,
+            is_retryable=lambda result: result["errors"] == ["Invalid field"],
+        )
+    )
+    assert results == [(False, {"id": "1", "errors": ["Invalid field"]})]
+    assert chunk_ids(flaky_app_search) == [["1"], ["1"], ["1"]]
+
+
+@pytest.mark.parametrize("thread_count", [1, 4])
+def test_parallel_bulk_retries_failed_documents(flaky_app_search, thread_count):
+    documents = [{"id": str(i), "transient": i % 3} for i in range(500)]
+    results = list(
+        parallel_bulk(
+            flaky_app_search,
+            documents,
+            engine_name="engine",
+            chunk_size=10,
+            thread_count=thread_count,
+            max_document_retries=2,
+        )
+    )
+    assert sorted(results, key=lambda x: int(x[1]["id"])) == [
+        (True, {"id": str(i), "errors": []}) for i in range(500)
+    ]
+    attempts = flaky_app_search.transport.get_connection().attempts
+    assert attempts == {str(i): i % 3 + 1 for i in range(500)}
+
+
+def test_parallel_bulk_document_retries_stopped_early(flaky_app_search):
+    documents = ({"id": str(i), "transient": 1} for i in range(1000))
+    results = parallel_bulk(
+        flaky_app_search,
+        documents,
+        engine_name="engine",
+        chunk_size=10,
+        max_document_retries=2,
+    )
+    assert next(results)[0] is True
+    results.close()
+
+
+@pytest.mark.parametrize(
+    ["errors", "retryable"],
+    [
+        (["Request timed out"], True),
+        (["Internal server error"], True),
+        (["Service temporarily unavailable"], True),
+        (["Too Many Requests"], True),
+        (["Invalid field value"], False),
+        (["Request timed out", "Invalid field value"], False),
+        ([], False),
+    ],
+)
+def test_is_retryable_result(errors, retryable):
+    assert _is_retryable_result({"id": "1", "errors": errors}) is retryable
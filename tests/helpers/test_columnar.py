@@ -0,0 +1,192 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import datetime
+import json
+import os
+import time
+
+import pytest
+from dateutil import tz
+
+from elastic_enterprise_search import AppSearch, JSONSerializer
+from elastic_enterprise_search.helpers import encode_columns
+from tests.conftest import DummyConnection
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+
+def as_python(value):
+    if value is None or value is pd.NaT:
+        return None
+    elif isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    elif isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def encode_rows(df):
+    """Encodes a DataFrame one document dict at a time"""
+    return JSONSerializer().dumps(
+        [
+            {key: as_python(value) for key, value in row.items()}
+            for row in df.to_dict("records")
+        ]
+    )
+
+
+@pytest.fixture(params=["UTC", "Europe/Berlin", "America/St_Johns"])
+def local_timezone(request):
+    if not hasattr(time, "tzset"):
+        pytest.skip("Requires time.tzset()")
+    tz_env = os.environ.get("TZ")
+    os.environ["TZ"] = request.param
+    time.tzset()
+    try:
+        yield request.param
+    finally:
+        if tz_env is None:
+            os.environ.pop("TZ", None)
+        else:
+            os.environ["TZ"] = tz_env
+        time.tzset()
+
+
+def test_encode_columns_matches_rows(local_timezone):
+    # Every 7 hours across a DST change in both Europe and North America.
+    index = pd.date_range("2020-03-07 00:30", periods=100, freq="7h")
+    df = pd.DataFrame(
+        {
+            "id": [str(i) for i in range(100)],
+            "views": np.arange(100),
+            "score": np.linspace(0, 1, 100),
+            "active": np.arange(100) % 2 == 0,
+            "naive": index,
+            "utc": index.tz_localize("UTC"),
+            "berlin": index.tz_localize("UTC").tz_convert("Europe/Berlin"),
+            "kolkata": index.tz_localize("UTC").tz_convert("Asia/Kolkata"),
+        }
+    )
+    df.loc[3, "naive"] = pd.NaT
+    df.loc[4, "berlin"] = pd.NaT
+
+    assert encode_columns(df) == encode_rows(df)
+
+
+def test_encode_columns_dict_of_arrays():
+    columns = {
+        "id": np.array(["a", "b"]),
+        "created_at": np.array(
+            ["2020-01-02T03:04:05.999", "1969-12-31T23:59:59.5"],
+            dtype="datetime64[ms]",
+        ),
+        "tags": [["x", "y"], None],
+        "nested": [{"a": 1}, {"b": datetime.datetime(2020, 1, 1, tzinfo=tz.UTC)}],
+        "text": ['quote " and ü', "percent %s"],
+    }
+    assert json.loads(encode_columns(columns)) == [
+        {
+            "id": "a",
+            "created_at": JSONSerializer().default(
+                datetime.datetime(2020, 1, 2, 3, 4, 5)
+            ),
+            "tags": ["x", "y"],
+            "nested": {"a": 1},
+            "text": 'quote " and ü',
+        },
+        {
+            "id": "b",
+            "created_at": JSONSerializer().default(
+                datetime.datetime(1969, 12, 31, 23, 59, 59)
+            ),
+            "tags": None,
+            "nested": {"b": "2020-01-01T00:00:00Z"},
+            "text": "percent %s",
+        },
+    ]
+
+
+def test_encode_columns_nullable_dtypes():
+    df = pd.DataFrame(
+        {
+            "views": pd.array([1, None, 2**53 + 1], dtype="Int64"),
+            "score": pd.array([1.5, None, 2.0], dtype="Float64"),
+            "active": pd.array([True, None, False], dtype="boolean"),
+            "title": pd.array(["a", None, "c"], dtype="string"),
+            "tag": pd.Categorical(["x", None, "x"]),
+        }
+    )
+    assert json.loads(encode_columns(df)) == [
+        {"views": 1, "score": 1.5, "active": True, "title": "a", "tag": "x"},
+        {"views": None, "score": None, "active": None, "title": None, "tag": None},
+        {"views": 2**53 + 1, "score": 2.0, "active": False, "title": "c", "tag": "x"},
+    ]
+    # Without missing values the columns are encoded like NumPy arrays.
+    assert encode_columns(df.dropna()) == (
+        '[{"views":1,"score":1.5,"active":true,"title":"a","tag":"x"},'
+        '{"views":9007199254740993,"score":2.0,"active":false,"title":"c","tag":"x"}]'
+    )
+
+
+def test_encode_columns_old_and_out_of_range_dates():
+    values = np.array(["0999-01-02T03:04:05"], dtype="datetime64[s]")
+    assert encode_columns({"d": values}) == JSONSerializer().dumps(
+        [{"d": datetime.datetime(999, 1, 2, 3, 4, 5)}]
+    )
+
+    values = np.array(["10000-01-01"], dtype="datetime64[s]")
+    with pytest.raises(ValueError) as e:
+        encode_columns({"d": values})
+    assert "out of the range of datetime" in str(e.value)
+
+
+def test_encode_columns_different_lengths():
+    with pytest.raises(ValueError) as e:
+        encode_columns({"a": np.arange(2), "b": np.arange(3)})
+    assert str(e.value) == "All columns must have the same length, got lengths [2, 3]"
+
+    assert encode_columns({}) == "[]"
+    assert encode_columns(pd.DataFrame({"a": []})) == "[]"
+
+
+def test_index_documents_columnar():
+    client = AppSearch(connection_class=DummyConnection, meta_header=False)
+    df = pd.DataFrame(
+        {
+            "id": ["1", "2"],
+            "created_at": pd.to_datetime(["2020-01-01", "2020-01-02"]).tz_localize(
+                "UTC"
+            ),
+        }
+    )
+    client.index_documents(engine_name="engine", documents=df)
+    client.index_documents(
+        engine_name="engine", documents={"id": df["id"], "views": np.arange(2)}
+    )
+    # Mappings of lists are always a single document.
+    client.index_documents(engine_name="engine", documents={"id": ["1", "2"]})
+
+    calls = client.transport.get_connection().calls
+    bodies = [args[2] for args, _ in calls]
+    assert bodies == [
+        b'[{"id":"1","created_at":"2020-01-01T00:00:00Z"},'
+        b'{"id":"2","created_at":"2020-01-02T00:00:00Z"}]',
+        b'[{"id":"1","views":0},{"id":"2","views":1}]',
+        b'{"id":["1","2"]}',
+    ]
@@ -0,0 +1,93 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import json
+import random
+import time
+
+import pytest
+from six import StringIO
+
+from elastic_enterprise_search import AppSearch, NotFoundError
+from elastic_enterprise_search.helpers import export_documents
+from tests.helpers.conftest import PagedConnection
+
+
+class SlowPagedConnection(PagedConnection):
+    total_results = 1000
+
+    def perform_request(self, *args, **kwargs):
+        # Pages complete out of order
+        time.sleep(random.random() * 0.01)
+        return super(SlowPagedConnection, self).perform_request(*args, **kwargs)
+
+
+@pytest.fixture()
+def app_search():
+    return AppSearch(connection_class=SlowPagedConnection, meta_header=False)
+
+
+def test_export_documents_ndjson(app_search):
+    output = StringIO()
+    exported = export_documents(
+        app_search, "engine", output, page_size=10, thread_count=8
+    )
+    assert exported == 1000
+
+    lines = output.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == [{"id": str(i)} for i in range(1000)]
+    assert len(app_search.transport.get_connection().calls) == 100
+
+
+def test_export_documents_unordered_callback(app_search):
+    documents = []
+    exported = export_documents(
+        app_search,
+        "engine",
+        documents.append,
+        page_size=10,
+        thread_count=8,
+        preserve_order=False,
+    )
+    assert exported == 1000
+    assert sorted(documents, key=lambda doc: int(doc["id"])) == [
+        {"id": str(i)} for i in range(1000)
+    ]
+
+
+def test_export_documents_single_page(app_search):
+    documents = []
+    assert export_documents(app_search, "engine", documents.append) == 1000
+    assert len(app_search.transport.get_connection().calls) == 10
+
+    documents = []
+    export_documents(app_search, "engine", documents.append, page_size=1000)
+    assert len(documents) == 1000
+
+
+def test_export_documents_error():
+    class ErrorConnection(SlowPagedConnection):
+        def perform_request(self, method, target, *args, **kwargs):
+            if "page[current]=5&" in target:
+                self._raise_error(404, {}, '{"errors":["Not found"]}')
+            return super(ErrorConnection, self).perform_request(
+                method, target, *args, **kwargs
+            )
+
+    app_search = AppSearch(connection_class=ErrorConnection, meta_header=False)
+    with pytest.raises(NotFoundError):
+        export_documents(app_search, "engine", lambda _: None, page_size=10)
@@ -0,0 +1,255 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import json
+import re
+
+import pytest
+from six import StringIO
+
+from elastic_enterprise_search import BadRequestError, RetryPolicy, WorkplaceSearch
+from elastic_enterprise_search.helpers import (
+    ExternalIdentityChange,
+    ExternalIdentitySyncReport,
+    RateLimiter,
+)
+from elastic_enterprise_search.helpers import _limiter as limiter_module
+from elastic_enterprise_search.helpers import sync_external_identities
+from tests.helpers.conftest import PagingConnection, connection
+
+IDENTITIES_RE = re.compile(r"^/api/ws/v1/sources/source/external_identities(?:/(.+))?$")
+
+
+class IdentitiesConnection(PagingConnection):
+    """Stores the user of every external identity in 'self.identities'
+    and answers the external identities APIs from it. Requests changing
+    identities in 'self.rejected' are answered with '400 Bad Request'
+    and the first request changing each identity in 'self.throttled'
+    is answered with '429 Too Many Requests'.
+    """
+
+    def __init__(self, **kwargs):
+        super(IdentitiesConnection, self).__init__(**kwargs)
+        self.identities = {}
+        self.rejected = set()
+        self.throttled = set()
+
+    def handle(self, method, path, params, body):
+        with self.lock:
+            source_user_id = IDENTITIES_RE.match(path).group(1)
+            if method == "GET":
+                return self.page(
+                    params,
+                    [
+                        {"source_user_id": i, "user": self.identities[i]}
+                        for i in sorted(self.identities)
+                    ],
+                )
+
+            if source_user_id is None:
+                source_user_id = json.loads(body)["source_user_id"]
+            if source_user_id in self.rejected:
+                self._raise_error(400, {}, '{"errors":["Invalid user"]}')
+            if source_user_id in self.throttled:
+                self.throttled.discard(source_user_id)
+                self._raise_error(429, {"Retry-After": "0"}, "{}")
+            if method == "DELETE":
+                del self.identities[source_user_id]
+                return "ok"
+            self.identities[source_user_id] = json.loads(body)["user"]
+            return json.loads(body)
+
+
+@pytest.fixture()
+def workplace_search():
+    return WorkplaceSearch(connection_class=IdentitiesConnection, meta_header=False)
+
+
+def change_requests(client):
+    return sorted(
+        (method, target, json.loads(body) if body else None)
+        for (method, target, body), _ in connection(client).calls
+        if method != "GET"
+    )
+
+
+def test_sync_external_identities(workplace_search):
+    connection(workplace_search).identities = {
+        "1": "alice",
+        "2": "bob",
+        "3": "carol",
+    }
+    desired = {
+        "1": "alice",  # Unchanged
+        "2": "robert",  # Update
+        "4": "dave",  # Create
+    }
+
+    progress = []
+    report = sync_external_identities(
+        workplace_search,
+        "source",
+        desired,
+        page_size=2,
+        progress=lambda report: progress.append(report.done),
+    )
+
+    assert isinstance(report, ExternalIdentitySyncReport)
+    assert (report.identities, report.unchanged) == (3, 1)
+    assert sorted(report.changes) == [
+        ExternalIdentityChange("2", "put", "robert"),
+        ExternalIdentityChange("4", "create", "dave"),
+    ]
+    assert (report.created, report.updated, report.deleted) == (1, 1, 0)
+    assert report.applied == report.done == 2
+    assert progress == [1, 2]
+    assert repr(report) == (
+        "<ExternalIdentitySyncReport identities=3 "
+        "unchanged=1 changes=2 applied=2 failures=0>"
+    )
+
+    # '3' isn't in the desired identities so is left as-is.
+    assert connection(workplace_search).identities == {
+        "1": "alice",
+        "2": "robert",
+        "3": "carol",
+        "4": "dave",
+    }
+    assert change_requests(workplace_search) == [
+        (
+            "POST",
+            "/api/ws/v1/sources/source/external_identities",
+            {"source_user_id": "4", "user": "dave"},
+        ),
+        (
+            "PUT",
+            "/api/ws/v1/sources/source/external_identities/2",
+            {"source_user_id": "2", "user": "robert"},
+        ),
+    ]
+
+    # Running again finds nothing to change.
+    report = sync_external_identities(workplace_search, "source", desired)
+    assert (report.identities, report.unchanged, report.changes) == (3, 3, [])
+
+
+def test_sync_external_identities_delete_missing(workplace_search):
+    connection(workplace_search).identities = {"1": "alice", "2": "bob"}
+    report = sync_external_identities(
+        workplace_search, "source", {"1": "alice"}, delete_missing_identities=True
+    )
+    assert report.changes == [ExternalIdentityChange("2", "delete", None)]
+    assert report.deleted == 1
+    assert connection(workplace_search).identities == {"1": "alice"}
+    assert change_requests(workplace_search) == [
+        ("DELETE", "/api/ws/v1/sources/source/external_identities/2", None)
+    ]
+
+
+def test_sync_external_identities_dry_run(workplace_search):
+    connection(workplace_search).identities = {"1": "alice"}
+    report = sync_external_identities(
+        workplace_search,
+        "source",
+        {"2": "bob"},
+        delete_missing_identities=True,
+        dry_run=True,
+    )
+    assert sorted(report.changes) == [
+        ExternalIdentityChange("1", "delete", None),
+        ExternalIdentityChange("2", "create", "bob"),
+    ]
+    assert report.applied == 0
+    assert change_requests(workplace_search) == []
+
+
+def test_sync_external_identities_retry_and_failures(workplace_search, sleeps):
+    connection(workplace_search).rejected = {"3"}
+    connection(workplace_search).throttled = {"5", "7"}
+    desired = {str(i): "user-%d" % i for i in range(10)}
+
+    report = sync_external_identities(
+        workplace_search, "source", desired, retry_policy=RetryPolicy()
+    )
+    assert (report.created, report.done) == (9, 10)
+    assert [change.source_user_id for change, _ in report.failures] == ["3"]
+    assert isinstance(report.failures[0][1], BadRequestError)
+    assert sorted(sleeps) == [0.0, 0.0]
+    assert len(connection(workplace_search).identities) == 9
+
+    summary = StringIO()
+    report.write_summary(summary)
+    lines = summary.getvalue().splitlines()
+    assert lines[:6] == [
+        "identities:  10",
+        "unchanged:   0",
+        "created:     9",
+        "updated:     0",
+        "deleted:     0",
+        "failed:      1",
+    ]
+    assert lines[6].startswith("duration:    ")
+    assert lines[7].startswith("failed to create '3': ")
+    assert len(lines) == 8
+
+
+def test_sync_external_identities_throttled_without_retry_policy(workplace_search):
+    connection(workplace_search).throttled = {"1"}
+    report = sync_external_identities(workplace_search, "source", {"1": "alice"})
+    assert report.failures[0][1].status == 429
+    assert connection(workplace_search).identities == {}
+
+
+def test_sync_external_identities_rate_limit(workplace_search, monkeypatch):
+    limiter = RateLimiter(5, burst=2)
+    acquired = []
+    monkeypatch.setattr(limiter, "acquire", lambda: acquired.append(None))
+
+    desired = {str(i): "user-%d" % i for i in range(6)}
+    sync_external_identities(workplace_search, "source", desired, rate_limit=limiter)
+    assert len(acquired) == 6
+
+
+def test_rate_limiter(monkeypatch):
+    now = [100.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(round(seconds, 3))
+        now[0] += seconds
+
+    monkeypatch.setattr(limiter_module, "monotonic", lambda: now[0])
+    monkeypatch.setattr(limiter_module.time, "sleep", sleep)
+
+    # The first 'burst' requests aren't delayed, then requests are spaced out.
+    limiter = RateLimiter(10, burst=3)
+    for _ in range(6):
+        limiter.acquire()
+    assert sleeps == [0.1, 0.1, 0.1]
+
+    # Being idle refills the burst.
+    now[0] += 10
+    del sleeps[:]
+    for _ in range(4):
+        limiter.acquire()
+    assert sleeps == [0.1]
+
+
+@pytest.mark.parametrize("kwargs", [{"rate": 0}, {"rate": 1, "burst": 0}])
+def test_rate_limiter_invalid(kwargs):
+    with pytest.raises(ValueError):
+        RateLimiter(**kwargs)
@@ -0,0 +1,413 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import datetime
+import json
+import threading
+
+import pytest
+from six import StringIO
+
+from elastic_enterprise_search import AppSearch, JSONSerializer, WorkplaceSearch
+from elastic_enterprise_search.helpers import (
+    DocumentHashStore,
+    DocumentSyncReport,
+    sync_documents,
+    sync_engine_documents,
+)
+from elastic_enterprise_search.helpers._hash_store import (
+    _changed_fields,
+    _document_hash,
+    _field_hashes,
+)
+from tests.conftest import DummyConnection
+from tests.helpers.conftest import connection
+
+
+class DocumentsConnection(DummyConnection):
+    """Stores the documents of a content source in 'self.documents'.
+    Documents with a 'fail' field are rejected and deleting while
+    'self.fail_deletes' is set responds with '500 Internal Server Error'.
+    """
+
+    def __init__(self, **kwargs):
+        super(DocumentsConnection, self).__init__(**kwargs)
+        self.lock = threading.Lock()
+        self.documents = {}
+        self.fail_deletes = False
+
+    def perform_request(self, method, target, body=None, **kwargs):
+        with self.lock:
+            self.calls.append(((method, target, body), kwargs))
+            data = json.loads(body)
+            if target.endswith("/bulk_create"):
+                results = []
+                for document in data:
+                    errors = ["Invalid field"] if "fail" in document else []
+                    if not errors:
+                        self.documents[document["id"]] = document
+                    results.append({"id": document["id"], "errors": errors})
+            else:
+                if self.fail_deletes:
+                    self._raise_error(500, {}, "{}")
+                results = [
+                    {"id": id_, "success": self.documents.pop(id_, None) is not None}
+                    for id_ in data
+                ]
+            return (
+                200,
+                {"content-type": "application/json"},
+                json.dumps({"results": results}),
+            )
+
+
+@pytest.fixture()
+def workplace_search():
+    return WorkplaceSearch(connection_class=DocumentsConnection, meta_header=False)
+
+
+@pytest.fixture()
+def store():
+    with DocumentHashStore(":memory:") as store:
+        yield store
+
+
+def requests(client):
+    """Returns the (API, document IDs) of every
+    request sent since the last call
+    """
+    calls = connection(client).calls[:]
+    del connection(client).calls[:]
+    return [
+        (
+            target.rsplit("/", 1)[-1],
+            [doc["id"] if isinstance(doc, dict) else doc for doc in json.loads(body)],
+        )
+        for (_, target, body), _ in calls
+    ]
+
+
+def catalog(count, version=0):
+    return [{"id": str(i), "title": "Title %d" % i, "v": version} for i in range(count)]
+
+
+def test_sync_documents_only_sends_changes(workplace_search, store):
+    report = sync_documents(workplace_search, "source", catalog(250), store)
+    assert isinstance(report, DocumentSyncReport)
+    assert (report.documents, report.unchanged, report.indexed) == (250, 0, 250)
+    assert [target for target, _ in requests(workplace_search)] == ["bulk_create"] * 3
+
+    # Nothing changed so nothing is sent.
+    report = sync_documents(workplace_search, "source", catalog(250), store)
+    assert (report.documents, report.unchanged, report.indexed) == (250, 250, 0)
+    assert requests(workplace_search) == []
+
+    # Only changed and new documents are indexed, missing ones are deleted.
+    documents = catalog(250)[5:] + [{"id": "250"}]
+    documents[0]["title"] = "Changed"
+    report = sync_documents(workplace_search, "source", documents, store)
+    assert (report.unchanged, report.indexed, report.deleted) == (244, 2, 5)
+    assert requests(workplace_search) == [
+        ("bulk_create", ["5", "250"]),
+        ("bulk_destroy", ["0", "1", "2", "3", "4"]),
+    ]
+    assert sorted(connection(workplace_search).documents, key=int) == [
+        str(i) for i in range(5, 251)
+    ]
+    assert repr(report) == (
+        "<DocumentSyncReport documents=246 unchanged=244 "
+        "indexed=2 updated=0 deleted=5 failures=0>"
+    )
+
+
+def test_sync_documents_key_order_doesnt_matter(workplace_search, store):
+    sync_documents(workplace_search, "source", [{"id": "1", "a": 1, "b": 2}], store)
+    requests(workplace_search)
+    report = sync_documents(
+        workplace_search, "source", [{"b": 2, "a": 1, "id": "1"}], store
+    )
+    assert report.unchanged == 1
+    assert requests(workplace_search) == []
+
+
+def test_sync_documents_failures_are_retried_next_sync(workplace_search, store):
+    documents = catalog(3)
+    documents[1]["fail"] = True
+    report = sync_documents(workplace_search, "source", documents, store)
+    assert report.indexed == 2
+    assert report.failures == [("1", ["Invalid field"])]
+
+    del documents[1]["fail"]
+    requests(workplace_search)
+    report = sync_documents(workplace_search, "source", documents, store)
+    assert (report.unchanged, report.indexed, report.failures) == (2, 1, [])
+    assert requests(workplace_search) == [("bulk_create", ["1"])]
+
+
+def test_sync_documents_delete_failures(workplace_search, store):
+    sync_documents(workplace_search, "source", catalog(3), store)
+    connection(workplace_search).fail_deletes = True
+    report = sync_documents(workplace_search, "source", catalog(1), store)
+    assert report.deleted == 0
+    assert [document_id for document_id, _ in report.failures] == ["1", "2"]
+    assert report.failures[0][1].status == 500
+
+    # The deletes are attempted again by the next sync.
+    connection(workplace_search).fail_deletes = False
+    requests(workplace_search)
+    report = sync_documents(workplace_search, "source", catalog(1), store)
+    assert (report.unchanged, report.deleted) == (1, 2)
+    assert requests(workplace_search) == [("bulk_destroy", ["1", "2"])]
+
+
+def test_sync_documents_without_delete_missing(workplace_search, store):
+    sync_documents(workplace_search, "source", catalog(3), store)
+    requests(workplace_search)
+    report = sync_documents(
+        workplace_search, "source", catalog(1), store, delete_missing=False
+    )
+    assert (report.unchanged, report.deleted) == (1, 0)
+    assert requests(workplace_search) == []
+    assert len(connection(workplace_search).documents) == 3
+
+
+def test_sync_documents_parallel(workplace_search, store):
+    report = sync_documents(
+        workplace_search, "source", catalog(1000), store, thread_count=4, chunk_size=10
+    )
+    assert report.indexed == 1000
+    assert len(store.hashes("workplace_search/source")) == 1000
+
+
+def test_sync_documents_store_path(workplace_search, tmp_path):
+    path = str(tmp_path / "hashes.sqlite3")
+    sync_documents(workplace_search, "source", catalog(10), path)
+    requests(workplace_search)
+
+    report = sync_documents(workplace_search, "source", catalog(10), path)
+    assert report.unchanged == 10
+    assert requests(workplace_search) == []
+
+    # Content sources are synced independently.
+    report = sync_documents(workplace_search, "other", catalog(10), path)
+    assert report.indexed == 10
+
+
+def test_sync_documents_summary(workplace_search, store):
+    documents = catalog(2)
+    documents[0]["fail"] = True
+    report = sync_documents(workplace_search, "source", documents, store)
+    summary = StringIO()
+    report.write_summary(summary)
+    lines = summary.getvalue().splitlines()
+    assert lines[:6] == [
+        "documents:   2",
+        "unchanged:   0",
+        "indexed:     1",
+        "updated:     0",
+        "deleted:     0",
+        "failed:      1",
+    ]
+    assert lines[6].startswith("duration:    ")
+    assert lines[7:] == ["failed to sync '0': ['Invalid field']"]
+
+
+def test_sync_documents_requires_ids(workplace_search, store):
+    with pytest.raises(ValueError) as e:
+        sync_documents(workplace_search, "source", [{"title": "No ID"}], store)
+    assert str(e.value) == "Every document must have an 'id' to be synced"
+
+
+def test_document_hash_store(store):
+    store.update("a", [("1", b"x" * 16), ("2", b"y" * 16)])
+    store.update("b", [("1", b"z" * 16)])
+    store.update("a", [("2", b"w" * 16)])
+    assert store.hashes("a") == {"1": b"x" * 16, "2": b"w" * 16}
+
+    store.delete("a", ["1", "3"])
+    assert store.hashes("a") == {"2": b"w" * 16}
+    store.clear("a")
+    assert store.hashes("a") == {}
+    assert store.hashes("b") == {"1": b"z" * 16}
+
+
+def test_document_hash():
+    serializer = JSONSerializer()
+    dt = datetime.datetime(2020, 1, 1, 12, 30)
+    hash_ = _document_hash({"id": "1", "a": [1, 2], "when": dt}, serializer)
+    assert len(hash_) == 16
+    assert hash_ == _document_hash({"when": dt, "a": [1, 2], "id": "1"}, serializer)
+    assert hash_ != _document_hash({"id": "1", "a": [2, 1], "when": dt}, serializer)
+
+
+class EngineConnection(DummyConnection):
+    """Stores the documents of an engine in 'self.documents'. Documents
+    with a 'fail' field are rejected and requests while 'self.status'
+    is set respond with that status.
+    """
+
+    def __init__(self, **kwargs):
+        super(EngineConnection, self).__init__(**kwargs)
+        self.lock = threading.Lock()
+        self.documents = {}
+        self.status = None
+
+    def perform_request(self, method, target, body=None, **kwargs):
+        with self.lock:
+            self.calls.append(((method, target, body), kwargs))
+            if self.status is not None:
+                self._raise_error(self.status, {}, "{}")
+            data = json.loads(body)
+            if method == "DELETE":
+                results = [
+                    {"id": id_, "deleted": self.documents.pop(id_, None) is not None}
+                    for id_ in data
+                ]
+            else:
+                results = []
+                for document in data:
+                    errors = ["Invalid field"] if "fail" in document else []
+                    if not errors:
+                        if method == "PATCH":
+                            self.documents[document["id"]].update(document)
+                        else:
+                            self.documents[document["id"]] = dict(document)
+                    results.append({"id": document["id"], "errors": errors})
+            return 200, {"content-type": "application/json"}, json.dumps(results)
+
+
+@pytest.fixture()
+def app_search():
+    return AppSearch(connection_class=EngineConnection, meta_header=False)
+
+
+def engine_requests(client):
+    """Returns the (method, body) of every request sent since the last call"""
+    calls = connection(client).calls[:]
+    del connection(client).calls[:]
+    return [(method, json.loads(body)) for (method, _, body), _ in calls]
+
+
+def products(count):
+    return [
+        {"id": str(i), "name": "Product %d" % i, "price": i, "tags": ["a"]}
+        for i in range(count)
+    ]
+
+
+def test_sync_engine_documents(app_search, store):
+    report = sync_engine_documents(app_search, "engine", products(150), store)
+    assert (report.documents, report.indexed, report.updated) == (150, 150, 0)
+    assert [method for method, _ in engine_requests(app_search)] == ["POST"] * 2
+
+    report = sync_engine_documents(app_search, "engine", products(150), store)
+    assert (report.documents, report.unchanged) == (150, 150)
+    assert engine_requests(app_search) == []
+
+    documents = products(150)[:-2]
+    documents[1]["price"] = 100  # Only sends the changed field
+    documents[2]["tags"] = ["a", "b"]
+    documents[2]["name"] = "Renamed"
+    documents[3]["color"] = "red"  # New fields send the whole document
+    del documents[4]["tags"]  # So do removed fields
+    report = sync_engine_documents(app_search, "engine", documents, store)
+    assert (report.unchanged, report.indexed, report.updated, report.deleted) == (
+        144,
+        2,
+        2,
+        2,
+    )
+    assert engine_requests(app_search) == [
+        ("POST", [documents[3], documents[4]]),
+        (
+            "PATCH",
+            [
+                {"id": "1", "price": 100},
+                {"id": "2", "name": "Renamed", "tags": ["a", "b"]},
+            ],
+        ),
+        ("DELETE", ["148", "149"]),
+    ]
+    assert connection(app_search).documents == {
+        document["id"]: document for document in documents
+    }
+
+    report = sync_engine_documents(app_search, "engine", documents, store)
+    assert report.unchanged == 148
+    assert engine_requests(app_search) == []
+
+
+def test_sync_engine_documents_without_partial_updates(app_search, store):
+    documents = products(3)
+    sync_engine_documents(app_search, "engine", documents, store)
+    engine_requests(app_search)
+
+    documents[1]["price"] = 100
+    report = sync_engine_documents(
+        app_search, "engine", documents, store, partial_updates=False
+    )
+    assert (report.indexed, report.updated) == (1, 0)
+    assert engine_requests(app_search) == [("POST", [documents[1]])]
+
+
+def test_sync_engine_documents_many_lookup_batches(app_search, store):
+    sync_engine_documents(app_search, "engine", products(1200), store, thread_count=4)
+    engine_requests(app_search)
+
+    documents = products(1200)[100:]
+    documents[-1]["price"] = -1
+    report = sync_engine_documents(
+        app_search, "engine", documents, store, thread_count=4
+    )
+    assert (report.documents, report.unchanged) == (1100, 1099)
+    assert (report.updated, report.deleted) == (1, 100)
+    assert sorted(connection(app_search).documents, key=int) == [
+        str(i) for i in range(100, 1200)
+    ]
+
+
+def test_sync_engine_documents_request_errors(app_search, store):
+    connection(app_search).status = 400
+    report = sync_engine_documents(app_search, "engine", products(3), store)
+    assert report.indexed == 0
+    assert [document_id for document_id, _ in report.failures] == ["0", "1", "2"]
+    assert report.failures[0][1].status == 400
+    assert store.hashes("app_search/engine") == {}
+
+    connection(app_search).status = None
+    engine_requests(app_search)
+    report = sync_engine_documents(app_search, "engine", products(3), store)
+    assert report.indexed == 3
+
+
+def test_changed_fields():
+    serializer = JSONSerializer()
+
+    def hashes(document):
+        return _document_hash(document, serializer) + _field_hashes(
+            document, serializer
+        )
+
+    document = {"id": "1", "a": 1, "b": [1, 2]}
+    previous = hashes(document)
+    assert _changed_fields(document, previous, previous) == []
+
+    changed = dict(document, b=[2, 1])
+    assert _changed_fields(changed, previous, hashes(changed)) == ["b"]
+
+    added = dict(document, c=None)
+    assert _changed_fields(added, previous, hashes(added)) is None
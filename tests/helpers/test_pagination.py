@@ -0,0 +1,105 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import threading
+
+import pytest
+
+from elastic_enterprise_search import AppSearch, WorkplaceSearch
+from elastic_enterprise_search.helpers import iter_pages
+from tests.helpers.conftest import PagedConnection
+
+
+@pytest.fixture()
+def app_search():
+    return AppSearch(connection_class=PagedConnection, meta_header=False)
+
+
+def test_iter_pages(app_search):
+    pages = list(iter_pages(app_search.list_documents, engine_name="engine"))
+    assert [page["meta"]["page"]["current"] for page in pages] == [1, 2, 3]
+    assert [len(page["results"]) for page in pages] == [10, 10, 5]
+
+    calls = app_search.transport.get_connection().calls
+    assert [call[0][1] for call in calls] == [
+        "/api/as/v1/engines/engine/documents/list?page[current]=1",
+        "/api/as/v1/engines/engine/documents/list?page[current]=2",
+        "/api/as/v1/engines/engine/documents/list?page[current]=3",
+    ]
+
+
+def test_iter_pages_is_lazy(app_search):
+    pages = iter_pages(app_search.list_documents, engine_name="engine")
+    connection = app_search.transport.get_connection()
+    assert connection.calls == []
+
+    next(pages)
+    assert len(connection.calls) == 1
+    next(pages)
+    assert len(connection.calls) == 2
+
+
+def test_iter_pages_prefetch():
+    fetched = threading.Event()
+
+    class PrefetchConnection(PagedConnection):
+        def perform_request(self, method, target, *args, **kwargs):
+            if "page[current]=2" in target:
+                fetched.set()
+            return super(PrefetchConnection, self).perform_request(
+                method, target, *args, **kwargs
+            )
+
+    app_search = AppSearch(connection_class=PrefetchConnection, meta_header=False)
+    pages = iter_pages(app_search.list_documents, prefetch=True, engine_name="engine")
+
+    # The second page is requested while the caller holds the first page.
+    next(pages)
+    assert fetched.wait(timeout=5)
+
+    assert [page["meta"]["page"]["current"] for page in pages] == [2, 3]
+    assert len(app_search.transport.get_connection().calls) == 3
+
+
+def test_iter_pages_empty(app_search):
+    PagedConnection.total_results, total_results = 0, PagedConnection.total_results
+    try:
+        pages = list(iter_pages(app_search.list_engines))
+    finally:
+        PagedConnection.total_results = total_results
+    assert len(pages) == 1
+    assert pages[0]["results"] == []
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_app_search_iter_documents(app_search, prefetch):
+    documents = list(
+        app_search.iter_documents(engine_name="engine", page_size=7, prefetch=prefetch)
+    )
+    assert documents == [{"id": str(i)} for i in range(25)]
+    assert len(app_search.transport.get_connection().calls) == 4
+
+
+def test_workplace_search_iter_permissions():
+    workplace_search = WorkplaceSearch(
+        connection_class=PagedConnection, meta_header=False
+    )
+    permissions = list(workplace_search.iter_permissions(content_source_id="source"))
+    assert len(permissions) == 25
+
+    calls = workplace_search.transport.get_connection().calls
+    assert calls[0][0][1] == ("/api/ws/v1/sources/source/permissions?page[current]=1")
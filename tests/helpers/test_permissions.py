@@ -0,0 +1,218 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+import json
+import re
+
+import pytest
+
+from elastic_enterprise_search import BadRequestError, WorkplaceSearch
+from elastic_enterprise_search.helpers import (
+    PermissionChange,
+    PermissionSyncReport,
+    sync_permissions,
+)
+from tests.helpers.conftest import PagingConnection, connection
+
+PERMISSIONS_RE = re.compile(
+    r"^/api/ws/v1/sources/source/permissions(?:/([^/]+)(?:/(add|remove))?)?$"
+)
+
+
+class PermissionsConnection(PagingConnection):
+    """Stores the permissions of every user in 'self.permissions'
+    and answers the document-level permissions APIs from it.
+    Users in 'self.rejected' are answered with '400 Bad Request'.
+    """
+
+    def __init__(self, **kwargs):
+        super(PermissionsConnection, self).__init__(**kwargs)
+        self.permissions = {}
+        self.rejected = set()
+
+    def handle(self, method, path, params, body):
+        with self.lock:
+            user, action = PERMISSIONS_RE.match(path).groups()
+            if user is None:
+                return self.page(
+                    params,
+                    [
+                        {"user": u, "permissions": sorted(self.permissions[u])}
+                        for u in sorted(self.permissions)
+                    ],
+                )
+
+            if user in self.rejected:
+                self._raise_error(400, {}, '{"errors":["Invalid user"]}')
+            permissions = set(json.loads(body)["permissions"])
+            existing = self.permissions.get(user, set())
+            if action == "add":
+                existing = existing | permissions
+            elif action == "remove":
+                existing = existing - permissions
+            else:
+                existing = permissions
+            self.permissions[user] = existing
+            return {"user": user, "permissions": sorted(existing)}
+
+
+@pytest.fixture()
+def workplace_search():
+    return WorkplaceSearch(connection_class=PermissionsConnection, meta_header=False)
+
+
+def change_requests(client):
+    return sorted(
+        (method, target, json.loads(body))
+        for (method, target, body), _ in connection(client).calls
+        if body is not None
+    )
+
+
+def test_sync_permissions_minimal_changes(workplace_search):
+    connection(workplace_search).permissions = {
+        "alice": {"a", "b"},
+        "bob": {"a"},
+        "carol": {"a", "b"},
+        "dave": {"a"},
+        "erin": {"a", "b"},
+    }
+    desired = {
+        "alice": ["a", "b"],  # Unchanged
+        "bob": ["a", "c", "b"],  # Add
+        "carol": ["b"],  # Remove
+        "dave": ["b"],  # Replace
+        "frank": ["a"],  # New user
+    }
+
+    progress = []
+    report = sync_permissions(
+        workplace_search,
+        "source",
+        desired,
+        page_size=2,
+        progress=lambda report: progress.append(report.done),
+    )
+
+    assert isinstance(report, PermissionSyncReport)
+    assert (report.users, report.unchanged) == (5, 1)
+    assert sorted(report.changes) == [
+        PermissionChange("bob", "add", ["b", "c"]),
+        PermissionChange("carol", "remove", ["a"]),
+        PermissionChange("dave", "put", ["b"]),
+        PermissionChange("frank", "add", ["a"]),
+    ]
+    assert (report.added, report.removed, report.replaced) == (2, 1, 1)
+    assert report.applied == report.done == 4
+    assert report.failures == []
+    assert progress == [1, 2, 3, 4]
+    assert repr(report) == (
+        "<PermissionSyncReport users=5 unchanged=1 changes=4 applied=4 failures=0>"
+    )
+
+    # 'erin' isn't in the desired permissions so is left as-is.
+    assert connection(workplace_search).permissions == {
+        "alice": {"a", "b"},
+        "bob": {"a", "b", "c"},
+        "carol": {"b"},
+        "dave": {"b"},
+        "erin": {"a", "b"},
+        "frank": {"a"},
+    }
+    assert change_requests(workplace_search) == [
+        (
+            "POST",
+            "/api/ws/v1/sources/source/permissions/bob/add",
+            {"permissions": ["b", "c"]},
+        ),
+        (
+            "POST",
+            "/api/ws/v1/sources/source/permissions/carol/remove",
+            {"permissions": ["a"]},
+        ),
+        (
+            "POST",
+            "/api/ws/v1/sources/source/permissions/frank/add",
+            {"permissions": ["a"]},
+        ),
+        ("PUT", "/api/ws/v1/sources/source/permissions/dave", {"permissions": ["b"]}),
+    ]
+
+    # Running again finds nothing to change.
+    report = sync_permissions(workplace_search, "source", desired, page_size=2)
+    assert (report.users, report.unchanged, report.changes) == (5, 5, [])
+
+
+def test_sync_permissions_remove_missing_users(workplace_search):
+    connection(workplace_search).permissions = {
+        "alice": {"a"},
+        "bob": {"a", "b"},
+        "carol": set(),
+    }
+    report = sync_permissions(
+        workplace_search, "source", {"alice": ["a"]}, remove_missing_users=True
+    )
+    assert (report.users, report.unchanged) == (3, 2)
+    assert report.changes == [PermissionChange("bob", "remove", ["a", "b"])]
+    assert connection(workplace_search).permissions == {
+        "alice": {"a"},
+        "bob": set(),
+        "carol": set(),
+    }
+
+
+def test_sync_permissions_dry_run(workplace_search):
+    connection(workplace_search).permissions = {"alice": {"a"}}
+    report = sync_permissions(
+        workplace_search, "source", {"alice": ["b"], "bob": []}, dry_run=True
+    )
+    assert report.changes == [PermissionChange("alice", "put", ["b"])]
+    assert (report.unchanged, report.applied) == (1, 0)
+    assert change_requests(workplace_search) == []
+
+
+@pytest.mark.parametrize("thread_count", [1, 8])
+def test_sync_permissions_failures(workplace_search, thread_count):
+    connection(workplace_search).rejected = {"user-3", "user-7"}
+    desired = {"user-%d" % i: ["a"] for i in range(50)}
+
+    report = sync_permissions(
+        workplace_search, "source", desired, thread_count=thread_count
+    )
+    assert (report.added, report.done) == (48, 50)
+    assert sorted(change.user for change, _ in report.failures) == [
+        "user-3",
+        "user-7",
+    ]
+    for _, error in report.failures:
+        assert isinstance(error, BadRequestError)
+    assert len(connection(workplace_search).permissions) == 48
+
+
+def test_sync_permissions_progress_error_stops(workplace_search):
+    desired = {"user-%d" % i: ["a"] for i in range(100)}
+
+    def progress(report):
+        if report.done == 5:
+            raise KeyboardInterrupt()
+
+    with pytest.raises(KeyboardInterrupt):
+        sync_permissions(
+            workplace_search, "source", desired, thread_count=1, progress=progress
+        )
+    # Only the changes already submitted to the thread were applied.
+    assert len(connection(workplace_search).permissions) <= 7
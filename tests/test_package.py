@@ -15,6 +15,11 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import subprocess
+import sys
+
+import pytest
+
 import elastic_enterprise_search
 from elastic_enterprise_search import _utils, client
 
@@ -25,3 +30,23 @@ def test_all_is_sorted():
     )
     assert _utils.__all__ == sorted(_utils.__all__)
     assert client.__all__ == sorted(client.__all__)
+
+
+def test_all_names_are_importable():
+    for name in elastic_enterprise_search.__all__:
+        assert getattr(elastic_enterprise_search, name) is not None
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="Requires module __getattr__")
+def test_slow_modules_are_imported_lazily():
+    modules = ("aiohttp", "dateutil", "jwt", "multiprocessing.pool")
+    out = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "import sys, elastic_enterprise_search; "
+            "print(','.join(m for m in %r if m in sys.modules))" % (modules,),
+        ],
+        universal_newlines=True,
+    )
+    assert out.strip() == ""
@@ -16,10 +16,14 @@
 #  under the License.
 
 import datetime
+import decimal
+import json
+import uuid
 
+import pytest
 from dateutil import tz
 
-from elastic_enterprise_search import JSONSerializer
+from elastic_enterprise_search import JSONSerializer, SerializationError
 
 
 def test_serializer_formatting():
@@ -44,3 +48,103 @@ def test_serializer_formatting():
         serializer.dumps({"t": datetime.date(year=2020, month=1, day=29)})
         == '{"t":"2020-01-29"}'
     )
+
+
+def test_default_serializer_is_orjson_when_installed():
+    from elastic_enterprise_search import AppSearch, OrjsonSerializer
+    from elastic_enterprise_search._serializer import orjson
+
+    client = AppSearch()
+    serializer = client.transport.serializer
+    if orjson is None:
+        assert type(serializer) is JSONSerializer
+    else:
+        assert type(serializer) is OrjsonSerializer
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"a": 1, "b": [1.5, None, True, False], "c": {"d": "e"}},
+        [{"id": "1", "title": "éè☃"}, {"id": "2", "title": "‘"}],
+        {"d": datetime.datetime(2020, 12, 11, 10, 9, 8, tzinfo=tz.UTC)},
+        {"d": datetime.datetime(2020, 12, 11, 10, 9, 8, 123456, tzinfo=tz.UTC)},
+        {
+            "d": datetime.datetime(
+                2020, 12, 11, 10, 9, 8, tzinfo=tz.tzoffset(None, -3600)
+            )
+        },
+        {"t": datetime.date(2020, 1, 29)},
+        {"u": uuid.UUID("0f41f52a-d6e6-4a33-a4aa-9e21e2e0b16d")},
+        {"n": decimal.Decimal("1.5")},
+        {"big": 2**70},
+        {"nan": float("nan"), "inf": [float("inf"), float("-inf"), None]},
+        {"n": [decimal.Decimal("NaN"), decimal.Decimal("-Infinity")]},
+        {float("nan"): None},
+        {"exp": [1e20, 1.1e-7, -2.5e-5, 1.5e300, 1.2345678901234568e17]},
+        "[already serialized]",
+    ],
+)
+def test_orjson_serializer_matches_json_serializer(data):
+    pytest.importorskip("orjson")
+    from elastic_enterprise_search import OrjsonSerializer
+
+    encoded = OrjsonSerializer().dumps(data)
+    expected = JSONSerializer().dumps(data)
+    if isinstance(data, dict) and "exp" in data:
+        # Floats with exponents are written in another notation,
+        # like '1e20' instead of '1e+20', for the same values.
+        assert encoded != expected
+        assert json.loads(encoded) == json.loads(expected)
+    else:
+        assert encoded == expected
+
+
+def test_orjson_serializer_loads():
+    pytest.importorskip("orjson")
+    from elastic_enterprise_search import OrjsonSerializer
+
+    serializer = OrjsonSerializer()
+    assert serializer.loads('{"a":[1,"☃",null]}') == {"a": [1, "☃", None]}
+    with pytest.raises(SerializationError):
+        serializer.loads("{")
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        '{"a":[1.5,null,"b"]}',
+        '{"nan":NaN,"inf":[Infinity,-Infinity,null]}',
+        '{"big":[18446744073709551616,-9223372036854775809,1180591620717411303424]}',
+        '{"id":"123456789012345678901234","score":1.2345678901234567890123}',
+        '{"big":-9223372036854775809}',
+        '{"big":18446744073709551615,"small":-9223372036854775808}',
+        b'{"big":18446744073709551616,"nan":NaN}',
+        bytearray(b'{"big":18446744073709551616}'),
+    ],
+)
+def test_orjson_serializer_loads_matches_json_serializer(body):
+    pytest.importorskip("orjson")
+    from elastic_enterprise_search import OrjsonSerializer
+
+    # repr() tells ints and floats apart and
+    # unlike '==' treats NaN as equal to NaN.
+    assert repr(OrjsonSerializer().loads(body)) == repr(JSONSerializer().loads(body))
+
+
+def test_orjson_serializer_unserializable():
+    pytest.importorskip("orjson")
+    from elastic_enterprise_search import OrjsonSerializer
+
+    with pytest.raises(SerializationError):
+        OrjsonSerializer().dumps({"t": datetime.time(10, 9, 8)})
+
+
+def test_serializers_pass_through_encoded_bodies():
+    assert JSONSerializer().dumps(b"\x1f\x8b\x08") == b"\x1f\x8b\x08"
+    assert JSONSerializer().dumps('{"a":1}') == '{"a":1}'
+
+    pytest.importorskip("orjson")
+    from elastic_enterprise_search import OrjsonSerializer
+
+    assert OrjsonSerializer().dumps(b"\x1f\x8b\x08") == b"\x1f\x8b\x08"
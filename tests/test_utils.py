@@ -16,6 +16,8 @@
 #  under the License.
 
 import datetime
+import os
+import time
 
 import pytest
 from dateutil import tz
@@ -47,6 +49,93 @@ def test_format_datetime_tz_naive():
         assert _utils.format_datetime(dt) != _utils.format_datetime(dt2)
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime.datetime(2020, 1, 2, 3, 4, 5),
+        datetime.datetime(2020, 1, 2, 3, 4, 5, 678901),
+        datetime.datetime(2020, 7, 1, 12),
+        datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=tz.UTC),
+        datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=tz.tzoffset(None, 0)),
+        datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=tz.tzoffset(None, 19800)),
+        datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=tz.tzoffset(None, -3601)),
+        datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=tz.tzoffset(None, -36059)),
+        datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=tz.gettz("HST")),
+        datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=tz.gettz("Europe/Berlin")),
+        datetime.datetime(2020, 7, 2, 3, 4, 5, tzinfo=tz.gettz("Europe/Berlin")),
+        datetime.datetime(1, 1, 1, tzinfo=tz.UTC),
+        datetime.datetime(999, 12, 31, 23, 59, 59, tzinfo=tz.UTC),
+        datetime.datetime(9999, 12, 31, 23, 59, 59, 999999, tzinfo=tz.UTC),
+    ],
+)
+def test_format_datetime_matches_strftime(value):
+    assert _utils.format_datetime(value) == _utils._format_datetime_strftime(value)
+
+
+@pytest.mark.skipif(_utils.PY2, reason="datetime.timezone requires Python 3")
+def test_format_datetime_stdlib_timezones():
+    utc = datetime.timezone.utc
+    value = datetime.datetime(2020, 1, 2, 3, 4, 5, 6, tzinfo=utc)
+    assert _utils.format_datetime(value) == "2020-01-02T03:04:05Z"
+
+    offset = datetime.timezone(datetime.timedelta(hours=-5, minutes=-30))
+    value = datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=offset)
+    assert _utils.format_datetime(value) == "2020-01-02T03:04:05-05:30"
+    assert _utils.format_datetime(value) == _utils._format_datetime_strftime(value)
+
+
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="Requires time.tzset()")
+def test_format_datetime_local_timezone_changes():
+    value = datetime.datetime(2020, 1, 2, 3, 4, 5)
+    tz_env = os.environ.get("TZ")
+    try:
+        os.environ["TZ"] = "UTC"
+        time.tzset()
+        assert _utils.format_datetime(value) == "2020-01-02T03:04:05Z"
+
+        os.environ["TZ"] = "Asia/Kolkata"
+        time.tzset()
+        assert _utils.format_datetime(value) == "2020-01-02T03:04:05+05:30"
+    finally:
+        if tz_env is None:
+            os.environ.pop("TZ", None)
+        else:
+            os.environ["TZ"] = tz_env
+        time.tzset()
+
+
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="Requires time.tzset()")
+@pytest.mark.parametrize("tz_name", ["America/St_Johns", "Asia/Kolkata"])
+def test_format_datetime_naive_non_utc_local_timezone(tz_name):
+    values = [
+        datetime.datetime(2020, 1, 2, 3, 4, 5),
+        datetime.datetime(2020, 7, 2, 3, 4, 5, 678901),
+    ]
+    tz_env = os.environ.get("TZ")
+    try:
+        os.environ["TZ"] = tz_name
+        time.tzset()
+        for value in values:
+            formatted = _utils.format_datetime(value)
+            assert not formatted.endswith("Z")
+            assert formatted == _utils._format_datetime_strftime(value)
+    finally:
+        if tz_env is None:
+            os.environ.pop("TZ", None)
+        else:
+            os.environ["TZ"] = tz_env
+        time.tzset()
+
+
+def test_format_datetime_subclass():
+    class Datetime(datetime.datetime):
+        def strftime(self, fmt):
+            return "strftime"
+
+    value = Datetime(2020, 1, 2, tzinfo=tz.UTC)
+    assert _utils.format_datetime(value) == "strftimeZ"
+
+
 def test_to_params():
     params = QueryParams(
         [
@@ -70,12 +159,15 @@ def test_to_params():
             ("g", (True, False)),
             ("h", b"hello-world"),
             ("i", None),
+            ("j", datetime.datetime(2020, 2, 3, 4, 5, 6, 7, tzinfo=tz.UTC)),
+            ("k", datetime.datetime(2020, 2, 3, 4, 5, tzinfo=tz.tzoffset(None, 19800))),
             ("z", "[]1234567890-_~. `=!@#$%^&*()+;'{}:,<>?/\\\""),
         ]
     )
     assert _utils.default_params_encoder(params) == (
         "a=1&b=z&c=d,2&e=2020-01-01&f=2020-02-03T04:05:06-10:00&"
-        "g=true,false&h=hello-world&i&z=[]1234567890-_~."
+        "g=true,false&h=hello-world&i&j=2020-02-03T04:05:06Z&"
+        "k=2020-02-03T04:05:00%2B05:30&z=[]1234567890-_~."
         "%20%60%3D%21%40%23%24%25%5E%26*%28%29%2B%3B%27%7B%7D:,%3C%3E%3F%2F%5C%22"
     )
 
@@ -106,6 +198,29 @@ def test_make_path():
     )
 
 
+def test_make_path_cached_values_dont_collide():
+    # Values which compare equal but encode differently
+    # must never be served from each other's cache entry.
+    assert _utils.to_path("a", 1) == "/a/1"
+    assert _utils.to_path("a", True) == "/a/true"
+    assert _utils.to_path("a", 1.0) == "/a/1.0"
+    assert _utils.to_path("a", b"1") == "/a/1"
+
+    utc = datetime.datetime(2020, 1, 1, 10, tzinfo=tz.UTC)
+    offset = datetime.datetime(2020, 1, 1, 11, tzinfo=tz.tzoffset(None, 3600))
+    assert utc == offset
+    assert _utils.to_path(utc) == "/2020-01-01T10:00:00Z"
+    assert _utils.to_path(offset) == "/2020-01-01T11:00:00%2B01:00"
+
+    assert _utils.quote_param(0) == "0"
+    assert _utils.quote_param(False) == "false"
+
+
+def test_make_path_unhashable_parts():
+    for _ in range(2):
+        assert _utils.to_path("a", ["b", "c"], None, "") == "/a/b,c"
+
+
 def test_to_deep_object():
     assert _utils.to_deep_object("key", {"field": [1, False, {"val": 2}]}) == [
         ("key[field][]", "1"),
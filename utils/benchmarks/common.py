@@ -0,0 +1,186 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""Shared pieces of the benchmark suite including a stand-in
+Enterprise Search HTTP server so benchmarks can run offline.
+"""
+
+import gzip
+import json
+import os
+import re
+import socket
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Benchmark the checkout instead of an installed version of the package.
+base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, base_dir)
+
+ENGINE_PATH_RE = re.compile(r"^/api/as/v1/engines/([^/]+)/([a-z_/]+)$")
+
+
+def make_document(i):
+    return {
+        "id": "park_%d" % i,
+        "title": "Park number %d" % i,
+        "description": "A national park with lakes, trees, and mountains " * 4,
+        "visitors": i * 1000,
+        "acres": i * 1.5,
+        "states": ["California", "Nevada"],
+        "date_established": "1915-01-26T06:00:00Z",
+    }
+
+
+def search_response(page_size=10):
+    return {
+        "meta": {
+            "alerts": [],
+            "warnings": [],
+            "page": {
+                "current": 1,
+                "total_pages": 100,
+                "total_results": 100 * page_size,
+                "size": page_size,
+            },
+            "request_id": "6266df8b-8d11-41b5-a4a3-fa3ac8ea4d61",
+        },
+        "results": [
+            {k: {"raw": v} for k, v in make_document(i).items()}
+            for i in range(page_size)
+        ],
+    }
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Answers the App Search APIs used by the benchmarks with
+    canned responses. Every other path responds with a 404.
+    """
+
+    protocol_version = "HTTP/1.1"
+    total_documents = 1000
+    search_body = json.dumps(search_response()).encode()
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        # Headers and body are written separately so disable
+        # Nagle's algorithm to avoid delayed ACK stalls.
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, *_):
+        pass
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+    def read_body(self):
+        length = int(self.headers.get("content-length") or 0)
+        body = self.rfile.read(length) if length else b""
+        if self.headers.get("content-encoding") == "gzip":
+            body = gzip.decompress(body)
+        return body
+
+    def handle_request(self, method):
+        body = self.read_body()
+        path, _, query = self.path.partition("?")
+
+        match = ENGINE_PATH_RE.match(path)
+        action = match.group(2) if match else None
+        if method == "POST" and action == "search":
+            self.respond(200, self.search_body)
+        elif method == "POST" and action == "documents":
+            documents = json.loads(body)
+            self.respond(200, [{"id": doc["id"], "errors": []} for doc in documents])
+        elif method == "GET" and action == "documents/list":
+            params = dict(p.split("=", 1) for p in query.split("&") if "=" in p)
+            current = int(params.get("page[current]", 1))
+            size = int(params.get("page[size]", 100))
+            start = (current - 1) * size
+            self.respond(
+                200,
+                {
+                    "meta": {
+                        "page": {
+                            "current": current,
+                            "total_pages": -(-self.total_documents // size),
+                            "total_results": self.total_documents,
+                            "size": size,
+                        }
+                    },
+                    "results": [
+                        make_document(i)
+                        for i in range(start, min(start + size, self.total_documents))
+                    ],
+                },
+            )
+        else:
+            self.respond(404, {"errors": ["Could not find resource"]})
+
+    def respond(self, status, data):
+        if not isinstance(data, bytes):
+            data = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("content-type", "application/json; charset=utf-8")
+        # Large responses are compressed if the client accepts gzip.
+        if len(data) >= 1024 and "gzip" in self.headers.get("accept-encoding", ""):
+            data = gzip.compress(data, 6)
+            self.send_header("content-encoding", "gzip")
+        self.send_header("content-length", str(len(data)))
+        self.end_headers()
+        self.write_body(data)
+
+    def write_body(self, data):
+        self.wfile.write(data)
+
+
+class MockServer(object):
+    """Runs a MockHandler server on a random local port
+    in a background thread while used as a context manager.
+    """
+
+    def __init__(self, handler_class=MockHandler):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+        self.httpd.daemon_threads = True
+        self.url = "http://127.0.0.1:%d" % self.httpd.server_address[1]
+        self._thread = threading.Thread(target=self.httpd.serve_forever)
+        self._thread.daemon = True
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = max(int(round(percent / 100.0 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+def print_table(headers, rows):
+    widths = [max(len(str(x)) for x in column) for column in zip(headers, *rows)]
+    for row in [headers] + list(rows):
+        print("  ".join(str(x).rjust(w) for x, w in zip(row, widths)))
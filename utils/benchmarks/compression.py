@@ -0,0 +1,150 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""Measures the bytes sent and received and the p50/p99 latency of
+index_documents(), search() and list_documents() with and without
+'http_compress' over a simulated slow network link.
+
+Usage: python utils/benchmarks/compression.py [--requests=100] [--bandwidth=50] [--rtt=20]
+"""
+
+import argparse
+import json
+import threading
+import time
+
+from common import MockHandler, MockServer, make_document, percentile, print_table
+
+from elastic_enterprise_search import AppSearch
+
+ENGINE_NAME = "benchmark"
+DOCUMENTS = [make_document(i) for i in range(100)]
+
+OPERATIONS = {
+    "index_documents": lambda client, i: client.index_documents(
+        engine_name=ENGINE_NAME, documents=DOCUMENTS
+    ),
+    "search": lambda client, i: client.search(
+        engine_name=ENGINE_NAME, body={"query": "park %d" % i}
+    ),
+    "list_documents": lambda client, i: client.list_documents(
+        engine_name=ENGINE_NAME, current_page=i % 10 + 1, page_size=100
+    ),
+}
+
+
+class LinkHandler(MockHandler):
+    """Delays each response by the time a link with 'bandwidth'
+    bytes per second and a round trip time of 'rtt' seconds takes
+    to transfer the request and response bodies. Counts the bytes.
+    """
+
+    bandwidth = None
+    rtt = None
+    lock = threading.Lock()
+    request_bytes = 0
+    response_bytes = 0
+
+    def read_body(self):
+        self.body_bytes = int(self.headers.get("content-length") or 0)
+        return MockHandler.read_body(self)
+
+    def write_body(self, data):
+        with self.lock:
+            LinkHandler.request_bytes += self.body_bytes
+            LinkHandler.response_bytes += len(data)
+        time.sleep(self.rtt + (self.body_bytes + len(data)) / self.bandwidth)
+        MockHandler.write_body(self, data)
+
+
+def run_operation(client, operation, requests):
+    LinkHandler.request_bytes = LinkHandler.response_bytes = 0
+
+    latencies = []
+    for i in range(requests):
+        start = time.perf_counter()
+        operation(client, i)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+
+    return {
+        "requests": requests,
+        "request_bytes": LinkHandler.request_bytes // requests,
+        "response_bytes": LinkHandler.response_bytes // requests,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument(
+        "--bandwidth", type=float, default=50, help="Link bandwidth in Mbit/s"
+    )
+    parser.add_argument(
+        "--rtt", type=float, default=20, help="Link round trip time in milliseconds"
+    )
+    parser.add_argument(
+        "--operation", choices=sorted(OPERATIONS), action="append", default=None
+    )
+    parser.add_argument("--json", metavar="PATH", help="Write the results as JSON")
+    args = parser.parse_args()
+
+    LinkHandler.bandwidth = args.bandwidth * 1000 * 1000 / 8
+    LinkHandler.rtt = args.rtt / 1000
+
+    results = {}
+    with MockServer(LinkHandler) as server:
+        for http_compress in (False, True):
+            client = AppSearch(
+                server.url,
+                http_auth="private-benchmark",
+                http_compress=http_compress,
+            )
+            for name in args.operation or sorted(OPERATIONS):
+                # Warm up the connection before measuring.
+                OPERATIONS[name](client, 0)
+                results["%s[http_compress=%s]" % (name, http_compress)] = run_operation(
+                    client, OPERATIONS[name], args.requests
+                )
+            client.close()
+
+    print(
+        "%d requests per operation over a %g Mbit/s link with %g ms RTT\n"
+        % (args.requests, args.bandwidth, args.rtt)
+    )
+    print_table(
+        ("operation", "request bytes", "response bytes", "p50 ms", "p99 ms"),
+        [
+            (
+                name,
+                result["request_bytes"],
+                result["response_bytes"],
+                "%.2f" % result["p50_ms"],
+                "%.2f" % result["p99_ms"],
+            )
+            for name, result in sorted(results.items())
+        ],
+    )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
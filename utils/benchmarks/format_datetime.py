@@ -0,0 +1,156 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""Compares format_datetime() with the strftime() and 'tzlocal()'
+based implementation it replaced, and checks that both produce
+exactly the same output.
+
+Usage: python utils/benchmarks/format_datetime.py [--number=20000] [--repeat=5]
+"""
+
+import argparse
+import datetime
+import json
+import random
+import timeit
+
+import common
+from dateutil import tz
+
+from elastic_enterprise_search import JSONSerializer
+from elastic_enterprise_search._utils import format_datetime
+
+
+def format_datetime_before(value):
+    """format_datetime() before it was optimized"""
+    # When given a timezone unaware datetime, use local timezone.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=tz.tzlocal())
+
+    utcoffset = value.utcoffset()
+    offset_secs = utcoffset.total_seconds()
+    # Use 'Z' for UTC, otherwise use '[+-]XX:XX' for tz offset
+    if offset_secs == 0:
+        timezone = "Z"
+    else:
+        offset_sign = "+" if offset_secs >= 0 else "-"
+        offset_secs = int(abs(offset_secs))
+        hours = offset_secs // 3600
+        minutes = (offset_secs % 3600) // 60
+        timezone = "{}{:02}:{:02}".format(offset_sign, hours, minutes)
+    return value.strftime("%Y-%m-%dT%H:%M:%S") + timezone
+
+
+def make_datetimes(count, tzinfo):
+    rand = random.Random(0)
+    start = datetime.datetime(1970, 1, 1)
+    return [
+        (start + datetime.timedelta(seconds=rand.randint(0, 2**31))).replace(
+            microsecond=rand.randint(0, 999999), tzinfo=tzinfo
+        )
+        for _ in range(count)
+    ]
+
+
+class BeforeSerializer(JSONSerializer):
+    def default(self, data):
+        if isinstance(data, datetime.datetime):
+            return format_datetime_before(data)
+        return super(BeforeSerializer, self).default(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", metavar="PATH", help="Write the results as JSON")
+    args = parser.parse_args()
+
+    cases = [
+        ("naive", None),
+        ("datetime.timezone.utc", getattr(datetime, "timezone", tz).utc),
+        ("dateutil.tz.UTC", tz.UTC),
+        ("fixed offset", tz.tzoffset(None, -18000)),
+        ("Europe/Berlin", tz.gettz("Europe/Berlin")),
+    ]
+
+    rows = []
+    results = {}
+    for name, tzinfo in cases:
+        values = make_datetimes(1000, tzinfo)
+        for value in values:
+            assert format_datetime(value) == format_datetime_before(value), value
+
+        def run(func):
+            best = min(
+                timeit.repeat(
+                    lambda: [func(value) for value in values],
+                    number=max(args.number // len(values), 1),
+                    repeat=args.repeat,
+                )
+            )
+            return best / (max(args.number // len(values), 1) * len(values)) * 1e6
+
+        before, after = run(format_datetime_before), run(format_datetime)
+        results[name] = {"before_us": before, "after_us": after}
+        rows.append(
+            (name, "%.2f us" % before, "%.2f us" % after, "%.1fx" % (before / after))
+        )
+
+    # Bulk payload with several timestamps per document
+    documents = [
+        {
+            "id": str(i),
+            "created_at": created,
+            "updated_at": created + datetime.timedelta(hours=1),
+            "published_at": created.replace(tzinfo=None),
+        }
+        for i, created in enumerate(make_datetimes(100, tz.UTC))
+    ]
+    before_serializer, after_serializer = BeforeSerializer(), JSONSerializer()
+    assert before_serializer.dumps(documents) == after_serializer.dumps(documents)
+    number = max(args.number // 300, 1)
+    before, after = [
+        min(
+            timeit.repeat(
+                lambda: serializer.dumps(documents),
+                number=number,
+                repeat=args.repeat,
+            )
+        )
+        / number
+        * 1e6
+        for serializer in (before_serializer, after_serializer)
+    ]
+    results["dumps() 100 documents"] = {"before_us": before, "after_us": after}
+    rows.append(
+        (
+            "dumps() 100 documents",
+            "%.1f us" % before,
+            "%.1f us" % after,
+            "%.1fx" % (before / after),
+        )
+    )
+
+    common.print_table(("", "before", "after", "speedup"), rows)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""Measures how long 'import elastic_enterprise_search' takes in a fresh
+interpreter using 'python -X importtime' and fails if it exceeds a budget.
+
+The budget applies to the time spent importing the client itself, excluding
+'elastic_transport' and the standard library modules it imports. Modules only
+needed by a few APIs ('jwt', 'dateutil', 'multiprocessing.pool') or by the
+asyncio clients ('aiohttp') must not be imported at all.
+
+Usage: python utils/benchmarks/import_time.py [--runs=10] [--budget=50]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import common
+
+LAZY_MODULES = (
+    "aiohttp",
+    "dateutil",
+    "elastic_enterprise_search.helpers",
+    "jwt",
+    "multiprocessing.pool",
+    "sqlite3",
+)
+CHECK_MODULES = (
+    "import sys, elastic_enterprise_search; "
+    "print(','.join(m for m in %r if m in sys.modules))" % (LAZY_MODULES,)
+)
+
+
+def import_times():
+    """Imports the package in a new interpreter and returns
+    the cumulative import time in microseconds of each module.
+    """
+    env = dict(os.environ, PYTHONPATH=common.base_dir)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import elastic_enterprise_search"],
+        env=env,
+        stderr=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split(":", 1)[1].split("|")
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:  # The header line
+            continue
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=50.0,
+        help="Maximum milliseconds spent importing the client",
+    )
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--json", metavar="PATH", help="Write the results as JSON")
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.runs)]
+    totals = sorted(run["elastic_enterprise_search"] / 1000.0 for run in runs)
+    transport = sorted(run.get("elastic_transport", 0) / 1000.0 for run in runs)
+    own = sorted(
+        (run["elastic_enterprise_search"] - run.get("elastic_transport", 0)) / 1000.0
+        for run in runs
+    )
+
+    print("%d runs of 'import elastic_enterprise_search'\n" % args.runs)
+    rows = []
+    for name, values in (
+        ("total", totals),
+        ("elastic_transport", transport),
+        ("client", own),
+    ):
+        rows.append(
+            (
+                name,
+                "%.1f ms" % common.percentile(values, 50),
+                "%.1f ms" % values[0],
+                "%.1f ms" % values[-1],
+            )
+        )
+    common.print_table(("", "median", "min", "max"), rows)
+
+    # Slowest modules of the fastest run
+    fastest = min(runs, key=lambda run: run["elastic_enterprise_search"])
+    print("\nslowest modules (cumulative):")
+    for name, usecs in sorted(fastest.items(), key=lambda x: -x[1])[: args.top]:
+        print("  %-60s %8.1f ms" % (name, usecs / 1000.0))
+
+    env = dict(os.environ, PYTHONPATH=common.base_dir)
+    imported = subprocess.check_output(
+        [sys.executable, "-c", CHECK_MODULES], env=env, universal_newlines=True
+    ).strip()
+
+    median = common.percentile(own, 50)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "total_ms": common.percentile(totals, 50),
+                    "elastic_transport_ms": common.percentile(transport, 50),
+                    "client_ms": median,
+                    "budget_ms": args.budget,
+                    "eagerly_imported": imported.split(",") if imported else [],
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+
+    failed = False
+    if imported:
+        print("\nFAIL: modules that should be imported lazily: %s" % imported)
+        failed = True
+    if median > args.budget:
+        print(
+            "\nFAIL: importing the client took %.1f ms, budget is %.1f ms"
+            % (median, args.budget)
+        )
+        failed = True
+    if failed:
+        sys.exit(1)
+    print("\nOK: %.1f ms is within the %.1f ms budget" % (median, args.budget))
+
+
+if __name__ == "__main__":
+    main()
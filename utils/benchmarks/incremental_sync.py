@@ -0,0 +1,156 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""Measures the time, requests and bytes sent to sync an engine with
+sync_engine_documents() when nothing or only a few documents changed,
+compared to sending every document again with parallel_bulk().
+
+Usage: python utils/benchmarks/incremental_sync.py [--documents=100000] [--changed=1]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from common import MockHandler, MockServer, make_document, print_table
+
+from elastic_enterprise_search import AppSearch
+from elastic_enterprise_search.helpers import (
+    DocumentHashStore,
+    parallel_bulk,
+    sync_engine_documents,
+)
+
+ENGINE_NAME = "benchmark"
+
+
+class DocumentsHandler(MockHandler):
+    """Also answers partial updates and deletes of
+    documents and counts the requests and bytes received
+    """
+
+    lock = threading.Lock()
+    requests = 0
+    request_bytes = 0
+
+    def read_body(self):
+        body = MockHandler.read_body(self)
+        with self.lock:
+            DocumentsHandler.requests += 1
+            DocumentsHandler.request_bytes += len(body)
+        return body
+
+    def do_PATCH(self):
+        self.handle_request("POST")
+
+    def do_DELETE(self):
+        ids = json.loads(self.read_body())
+        self.respond(200, [{"id": id_, "deleted": True} for id_ in ids])
+
+
+def documents(count, changed_percent=0, version=0):
+    # Every 'changed_percent' out of 100 documents gets a new visitor count.
+    for i in range(count):
+        document = make_document(i)
+        if i % 100 < changed_percent:
+            document["visitors"] += version
+        yield document
+
+
+def run(func):
+    DocumentsHandler.requests = DocumentsHandler.request_bytes = 0
+    start = time.perf_counter()
+    func()
+    return {
+        "seconds": time.perf_counter() - start,
+        "requests": DocumentsHandler.requests,
+        "request_bytes": DocumentsHandler.request_bytes,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--documents", type=int, default=100000)
+    parser.add_argument(
+        "--changed", type=int, default=1, help="Percent of documents changed"
+    )
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--json", metavar="PATH", help="Write the results as JSON")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    results = {}
+    try:
+        with MockServer(DocumentsHandler) as server, DocumentHashStore(
+            os.path.join(tmp, "hashes.sqlite3")
+        ) as store:
+            client = AppSearch(server.url, http_auth="private-benchmark")
+
+            def full_reindex():
+                for _ in parallel_bulk(
+                    client,
+                    documents(args.documents),
+                    engine_name=ENGINE_NAME,
+                    thread_count=args.threads,
+                ):
+                    pass
+
+            def sync(version):
+                sync_engine_documents(
+                    client,
+                    ENGINE_NAME,
+                    documents(args.documents, args.changed, version),
+                    store,
+                    thread_count=args.threads,
+                )
+
+            results["1. parallel_bulk (every document)"] = run(full_reindex)
+            results["2. first sync"] = run(lambda: sync(0))
+            results["3. resync, unchanged"] = run(lambda: sync(0))
+            results["4. resync, %d%% changed" % args.changed] = run(lambda: sync(1))
+            client.close()
+            store_bytes = os.path.getsize(os.path.join(tmp, "hashes.sqlite3"))
+    finally:
+        shutil.rmtree(tmp)
+
+    print(
+        "%d documents, %d threads, hash store of %d bytes\n"
+        % (args.documents, args.threads, store_bytes)
+    )
+    print_table(
+        ("run", "seconds", "requests", "request bytes"),
+        [
+            (
+                name,
+                "%.2f" % result["seconds"],
+                result["requests"],
+                result["request_bytes"],
+            )
+            for name, result in sorted(results.items())
+        ],
+    )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""Measures memory use while bulk indexing documents from
+a generator into a local mock server with the bulk helpers.
+Memory should stay flat regardless of the number of documents.
+
+Usage: python utils/benchmarks/memory.py [--documents=50000]
+"""
+
+import argparse
+import json
+import resource
+import time
+import tracemalloc
+
+from common import MockServer, make_document, print_table
+
+from elastic_enterprise_search import AppSearch, helpers
+
+
+def generate_documents(count):
+    for i in range(count):
+        yield make_document(i)
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    indexed = sum(1 for ok, _ in func() if ok)
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "documents": indexed,
+        "docs_per_sec": indexed / duration,
+        "peak_mib": peak / 1024.0 / 1024.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--documents", type=int, default=50000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--json", metavar="PATH", help="Write the results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    with MockServer() as server:
+        client = AppSearch(
+            server.url,
+            http_auth="private-benchmark",
+            connections_per_host=args.threads,
+        )
+        results["streaming_bulk"] = measure(
+            lambda: helpers.streaming_bulk(
+                client,
+                generate_documents(args.documents),
+                engine_name="benchmark",
+            ),
+        )
+        results["parallel_bulk"] = measure(
+            lambda: helpers.parallel_bulk(
+                client,
+                generate_documents(args.documents),
+                engine_name="benchmark",
+                thread_count=args.threads,
+            ),
+        )
+        client.close()
+
+    print("%d documents indexed per helper\n" % args.documents)
+    print_table(
+        ("helper", "docs/s", "peak traced MiB"),
+        [
+            (name, "%.0f" % result["docs_per_sec"], "%.2f" % result["peak_mib"])
+            for name, result in sorted(results.items())
+        ],
+    )
+    # Peak traced memory includes the mock server running in this process.
+    # ru_maxrss is in KiB on Linux and in bytes on macOS.
+    print("\nmax RSS: %d" % resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
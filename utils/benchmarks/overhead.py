@@ -0,0 +1,107 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""Measures the client-side overhead of a single API call without
+any network I/O: building the path and query parameters, building
+HTTP headers, serializing the body, and a complete search() call
+through the Transport with a connection that returns immediately.
+
+Usage: python utils/benchmarks/overhead.py [--number=20000] [--repeat=5]
+"""
+
+import argparse
+import json
+import timeit
+
+from common import print_table, search_response
+from elastic_transport import Connection, QueryParams
+
+from elastic_enterprise_search import AppSearch
+from elastic_enterprise_search._utils import DEFAULT, to_path
+
+SEARCH_BODY = {
+    "query": "mountains",
+    "filters": {"all": [{"states": "California"}, {"world_heritage_site": "true"}]},
+    "page": {"current": 1, "size": 10},
+}
+SEARCH_DATA = json.dumps(search_response())
+
+
+class NoopConnection(Connection):
+    """Returns a canned search response without doing any I/O"""
+
+    def perform_request(self, *args, **kwargs):
+        return 200, {"content-type": "application/json"}, SEARCH_DATA
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", metavar="PATH", help="Write the results as JSON")
+    args = parser.parse_args()
+
+    client = AppSearch(http_auth="private-benchmark", connection_class=NoopConnection)
+    serializer = client.transport.serializer
+
+    benchmarks = [
+        (
+            "to_path()",
+            lambda: to_path("api", "as", "v1", "engines", "national-parks", "search"),
+        ),
+        ("QueryParams()", lambda: QueryParams(None)),
+        (
+            "QueryParams(params)",
+            lambda: QueryParams({"page[current]": 2, "page[size]": 100}),
+        ),
+        ("headers", lambda: client._prepare_headers(None, None, DEFAULT)),
+        (
+            "headers + per-call headers",
+            lambda: client._prepare_headers({"X-Opaque-Id": "1"}, None, DEFAULT),
+        ),
+        (
+            "headers + per-call http_auth",
+            lambda: client._prepare_headers(None, None, "private-other"),
+        ),
+        ("serialize body", lambda: serializer.dumps(SEARCH_BODY)),
+        ("deserialize response", lambda: serializer.loads(SEARCH_DATA)),
+        (
+            "search() total",
+            lambda: client.search(engine_name="national-parks", body=SEARCH_BODY),
+        ),
+        (
+            "get_engine() total",
+            lambda: client.get_engine(engine_name="national-parks"),
+        ),
+    ]
+
+    results = {}
+    for name, func in benchmarks:
+        best = min(timeit.repeat(func, number=args.number, repeat=args.repeat))
+        results[name] = best / args.number * 1e9
+
+    print_table(
+        ("operation", "ns/call"),
+        [(name, "%.0f" % results[name]) for name, _ in benchmarks],
+    )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
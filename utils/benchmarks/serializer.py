@@ -0,0 +1,113 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""Compares JSON encoding and decoding throughput of the standard
+library based JSONSerializer and the orjson based OrjsonSerializer
+on batches of documents shaped like a bulk indexing request.
+
+Usage: python utils/benchmarks/serializer.py [--docs=100] [--repeat=5]
+"""
+
+import argparse
+import datetime
+import json
+import timeit
+
+import common  # noqa: F401
+from dateutil import tz
+
+from elastic_enterprise_search import JSONSerializer, OrjsonSerializer
+
+
+def make_documents(count):
+    now = datetime.datetime(2021, 1, 26, 12, 30, tzinfo=tz.UTC)
+    return [
+        {
+            "id": "park_%d" % i,
+            "title": "Park number %d" % i,
+            "description": "A national park with lakes, trees, and mountains " * 4,
+            "visitors": i * 1000,
+            "acres": i * 1.5,
+            "states": ["California", "Nevada"],
+            "date_established": now - datetime.timedelta(days=i),
+        }
+        for i in range(count)
+    ]
+
+
+def bench(name, func, number, repeat):
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    print("%-30s %10.1f us/op" % (name, best * 1e6))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--docs", type=int, default=100)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", metavar="PATH", help="Write the results as JSON")
+    args = parser.parse_args()
+
+    documents = make_documents(args.docs)
+    serializers = [("json", JSONSerializer())]
+    try:
+        serializers.append(("orjson", OrjsonSerializer()))
+    except ImportError:
+        print("orjson isn't installed, only benchmarking the stdlib serializer")
+
+    encoded = serializers[0][1].dumps(documents)
+    print("batch of %d documents, %d bytes encoded\n" % (args.docs, len(encoded)))
+
+    results = {}
+    for name, serializer in serializers:
+        assert serializer.dumps(documents) == encoded
+        results[name] = (
+            bench(
+                "%s dumps()" % name,
+                lambda: serializer.dumps(documents),
+                args.number,
+                args.repeat,
+            ),
+            bench(
+                "%s loads()" % name,
+                lambda: serializer.loads(encoded),
+                args.number,
+                args.repeat,
+            ),
+        )
+
+    if "orjson" in results:
+        print(
+            "\norjson speedup: %.1fx dumps(), %.1fx loads()"
+            % tuple(j / o for j, o in zip(results["json"], results["orjson"]))
+        )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    name: {"dumps_us": dumps * 1e6, "loads_us": loads * 1e6}
+                    for name, (dumps, loads) in results.items()
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
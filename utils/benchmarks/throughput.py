@@ -0,0 +1,118 @@
+#  Licensed to Elasticsearch B.V. under one or more contributor
+#  license agreements. See the NOTICE file distributed with
+#  this work for additional information regarding copyright
+#  ownership. Elasticsearch B.V. licenses this file to you under
+#  the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""Measures requests per second and p50/p99 latency of search(),
+index_documents() and list_documents() against a local mock server.
+
+Usage: python utils/benchmarks/throughput.py [--requests=2000] [--threads=8]
+"""
+
+import argparse
+import json
+import time
+from multiprocessing.pool import ThreadPool
+
+from common import MockServer, make_document, percentile, print_table
+
+from elastic_enterprise_search import AppSearch
+
+ENGINE_NAME = "benchmark"
+DOCUMENTS = [make_document(i) for i in range(100)]
+
+OPERATIONS = {
+    "search": lambda client, i: client.search(
+        engine_name=ENGINE_NAME, body={"query": "park %d" % i}
+    ),
+    "index_documents": lambda client, i: client.index_documents(
+        engine_name=ENGINE_NAME, documents=DOCUMENTS
+    ),
+    "list_documents": lambda client, i: client.list_documents(
+        engine_name=ENGINE_NAME, current_page=i % 10 + 1, page_size=100
+    ),
+}
+
+
+def run_operation(client, operation, requests, threads):
+    def timed_call(i):
+        start = time.perf_counter()
+        operation(client, i)
+        return time.perf_counter() - start
+
+    # Warm up connections before measuring.
+    for i in range(threads):
+        operation(client, i)
+
+    pool = ThreadPool(threads)
+    try:
+        start = time.perf_counter()
+        latencies = sorted(pool.map(timed_call, range(requests)))
+        duration = time.perf_counter() - start
+    finally:
+        pool.close()
+        pool.join()
+
+    return {
+        "requests": requests,
+        "rps": requests / duration,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument(
+        "--operation", choices=sorted(OPERATIONS), action="append", default=None
+    )
+    parser.add_argument("--json", metavar="PATH", help="Write the results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    with MockServer() as server:
+        client = AppSearch(
+            server.url,
+            http_auth="private-benchmark",
+            connections_per_host=args.threads,
+        )
+        for name in args.operation or sorted(OPERATIONS):
+            results[name] = run_operation(
+                client, OPERATIONS[name], args.requests, args.threads
+            )
+        client.close()
+
+    print("%d requests per operation from %d threads\n" % (args.requests, args.threads))
+    print_table(
+        ("operation", "req/s", "p50 ms", "p99 ms"),
+        [
+            (
+                name,
+                "%.0f" % result["rps"],
+                "%.2f" % result["p50_ms"],
+                "%.2f" % result["p99_ms"],
+            )
+            for name, result in sorted(results.items())
+        ],
+    )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,7 @@ import pathlib
 import re
 from functools import lru_cache
 from typing import List, Optional
+from urllib.parse import quote
 
 import jinja2
 import urllib3
@@ -225,6 +226,27 @@ class API:
     def has_path_params(self):
         return any(part.startswith("{") for part in self.path_parts)
 
+    @property
+    def path_params(self):
+        return [part[1:-1] for part in self.path_parts if part.startswith("{")]
+
+    @property
+    def path_template(self) -> Optional[str]:
+        """Path as a '%'-format string with constant parts already
+        quoted like to_path() would. Only possible when every path
+        parameter is required, otherwise to_path() has to skip
+        empty values at request time.
+        """
+        required = {param.param_name for param in self.required_params}
+        if not all(name in required for name in self.path_params):
+            return None
+        return "/" + "/".join(
+            "%s"
+            if part.startswith("{")
+            else quote(part, ",*[]:-").replace("%", "%%")
+            for part in self.path_parts
+        )
+
     @property
     def description(self) -> str:
         summary = self.spec["summary"]
@@ -402,12 +424,14 @@ def main():
         specs.append(OpenAPI.from_schema(filepath))
 
     for spec in specs:
-        spec_filepath = (
-            base_dir / f"elastic_enterprise_search/client/{spec.namespace}.py"
-        )
-        with spec_filepath.open(mode="w") as f:
-            f.truncate()
-            f.write(env.get_template("client").render(spec=spec))
+        # Render both the sync client and its async twin from the same templates
+        for client_dir, is_async in (("client", False), ("_async/client", True)):
+            spec_filepath = (
+                base_dir / f"elastic_enterprise_search/{client_dir}/{spec.namespace}.py"
+            )
+            with spec_filepath.open(mode="w") as f:
+                f.truncate()
+                f.write(env.get_template("client").render(spec=spec, is_async=is_async))
 
     os.system(f"cd {base_dir} && nox -rs format")
 